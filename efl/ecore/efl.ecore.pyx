@@ -413,11 +413,13 @@ def loop_time_get():
 
 include "efl.ecore_animator.pxi"
 include "efl.ecore_timer.pxi"
+include "efl.ecore_timer_wheel.pxi"
 include "efl.ecore_poller.pxi"
 include "efl.ecore_idler.pxi"
 include "efl.ecore_fd_handler.pxi"
 include "efl.ecore_events.pxi"
 include "efl.ecore_exe.pxi"
+include "efl.ecore_exe_pool.pxi"
 include "efl.ecore_file_download.pxi"
 include "efl.ecore_file_monitor.pxi"
 
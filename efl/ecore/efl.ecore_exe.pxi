@@ -15,7 +15,9 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
-from cpython cimport PyUnicode_AsUTF8String
+from cpython cimport PyUnicode_AsUTF8String, PyBytes_FromStringAndSize
+from cpython.buffer cimport PyBUF_WRITABLE
+from libc.string cimport memcpy
 
 cdef extern from "Python.h":
     object PyUnicode_FromStringAndSize(char *s, Py_ssize_t len)
@@ -50,46 +52,51 @@ cdef exe_flags2str(int value):
     return ", ".join(flags)
 
 
+# One ecore event handler per exe event type is shared by all the filters,
+# the filter of each Ecore_Exe is found in a pointer hash, so the cost of
+# an event does not depend on the number of running processes.
+cdef Eina_Hash *_exe_event_filters[4]
+cdef Ecore_Event_Handler *_exe_event_handlers[4]
+cdef int _exe_event_filters_count[4]
+
+
+cdef int _exe_event_slot(int type):
+    if type == enums.ECORE_EXE_EVENT_ADD:
+        return 0
+    elif type == enums.ECORE_EXE_EVENT_DEL:
+        return 1
+    elif type == enums.ECORE_EXE_EVENT_DATA:
+        return 2
+    elif type == enums.ECORE_EXE_EVENT_ERROR:
+        return 3
+    return -1
+
+
 cdef Eina_Bool _exe_event_filter_cb(void *data, int type, void *event) with gil:
     cdef:
-        ExeEventFilter self = <ExeEventFilter>data
-        Ecore_Exe_Event_Add *e_add
-        Ecore_Exe_Event_Del *e_del
-        Ecore_Exe_Event_Data *e_data
-        Event e
-        list cbs
-        tuple cb
+        int slot = _exe_event_slot(type)
+        Ecore_Exe *exe
+        void *filter
+        ExeEventFilter f
 
-    try:
-        assert self.event_type == type, "event is not what we asked? impossible"
-        if type == enums.ECORE_EXE_EVENT_ADD:
-            e_add = <Ecore_Exe_Event_Add *>event
-            if e_add.exe != self.exe:
-                return 1
-            e = EventExeAdd()
-        elif type == enums.ECORE_EXE_EVENT_DEL:
-            e_del = <Ecore_Exe_Event_Del *>event
-            if e_del.exe != self.exe:
-                return 1
-            e = EventExeDel()
-        elif type == enums.ECORE_EXE_EVENT_DATA or type == enums.ECORE_EXE_EVENT_ERROR:
-            e_data = <Ecore_Exe_Event_Data *>event
-            if e_data.exe != self.exe:
-                return 1
-            e = EventExeData()
-        else:
-            raise SystemError("unknown event type=%d" % type)
+    if slot == -1 or _exe_event_filters[slot] == NULL:
+        return 1
 
-        r = e._set_obj(event)
-        assert r != -1, "exe is not known?! impossible!"
+    if slot == 0:
+        exe = (<Ecore_Exe_Event_Add *>event).exe
+    elif slot == 1:
+        exe = (<Ecore_Exe_Event_Del *>event).exe
+    else:
+        exe = (<Ecore_Exe_Event_Data *>event).exe
 
-        cbs = self.callbacks[:] # copy, so we can change self.callbacks
-        for cb in cbs:
-            try:
-                cb[0](self.owner, e, *cb[1], **cb[2])
-            except Exception:
-                traceback.print_exc()
+    filter = eina_hash_find(_exe_event_filters[slot], &exe)
+    if filter == NULL:
+        return 1
 
+    # hold a reference, a callback may delete the exe and its filters
+    f = <ExeEventFilter>filter
+    try:
+        f._dispatch(event)
     except Exception:
         traceback.print_exc()
 
@@ -102,9 +109,7 @@ cdef class ExeEventFilter:
         self.callbacks = []
 
     def __dealloc__(self):
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
+        self._unregister()
 
         self.exe = NULL
         self.owner = None
@@ -112,21 +117,79 @@ cdef class ExeEventFilter:
         self.callbacks = None
 
     def __init__(self, Exe exe not None, int event_type):
+        if _exe_event_slot(event_type) == -1:
+            raise ValueError("unknown event type=%d" % event_type)
         self.exe = exe.exe
         self.owner = exe
         self.event_type = event_type
         self.callbacks = []
 
+    cdef int _register(self) except 0:
+        cdef int slot = _exe_event_slot(self.event_type)
+
+        if self.registered:
+            return 1
+
+        if _exe_event_filters[slot] == NULL:
+            _exe_event_filters[slot] = eina_hash_pointer_new(NULL)
+        if not eina_hash_add(_exe_event_filters[slot], &self.exe, <void *>self):
+            raise RuntimeError("Could not register the event filter")
+        self.registered = 1
+
+        _exe_event_filters_count[slot] += 1
+        if _exe_event_handlers[slot] == NULL:
+            _exe_event_handlers[slot] = ecore_event_handler_add(
+                self.event_type, _exe_event_filter_cb, NULL)
+        return 1
+
+    cdef void _unregister(self):
+        cdef int slot = _exe_event_slot(self.event_type)
+
+        if not self.registered:
+            return
+
+        eina_hash_del(_exe_event_filters[slot], &self.exe, NULL)
+        self.registered = 0
+
+        _exe_event_filters_count[slot] -= 1
+        if _exe_event_filters_count[slot] == 0 and \
+           _exe_event_handlers[slot] != NULL:
+            ecore_event_handler_del(_exe_event_handlers[slot])
+            _exe_event_handlers[slot] = NULL
+
+    cdef int _dispatch(self, void *event) except 0:
+        cdef:
+            Event e
+            list cbs
+            tuple cb
+
+        if self.event_type == enums.ECORE_EXE_EVENT_ADD:
+            e = EventExeAdd()
+        elif self.event_type == enums.ECORE_EXE_EVENT_DEL:
+            e = EventExeDel()
+        else:
+            e = EventExeData()
+
+        r = e._set_obj(event)
+        assert r != -1, "exe is not known?! impossible!"
+
+        cbs = self.callbacks[:] # copy, so we can change self.callbacks
+        for cb in cbs:
+            try:
+                cb[0](self.owner, e, *cb[1], **cb[2])
+            except Exception:
+                traceback.print_exc()
+
+        if isinstance(e, EventExeData):
+            (<EventExeData>e)._release()
+        return 1
+
     def delete(self):
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
+        self._unregister()
         self.callbacks = None
 
     def callback_add(self, func, args, kargs):
-        if self.handler == NULL:
-            self.handler = ecore_event_handler_add(
-                self.event_type, _exe_event_filter_cb, <void *>self)
+        self._register()
         self.callbacks.append((func, args, kargs))
 
     def callback_del(self, func, args, kargs):
@@ -140,9 +203,7 @@ cdef class ExeEventFilter:
         if self.callbacks:
             return
 
-        if self.handler != NULL:
-            ecore_event_handler_del(self.handler)
-            self.handler = NULL
+        self._unregister()
 
 
 def exe_run_priority_set(int pri):
@@ -854,39 +915,174 @@ cdef class EventExeData(Event):
     This event is issued by :py:class:`Exe` instances created with flags that
     allow reading from either stdout or stderr.
 
+    Nothing is converted until asked for, so handlers only interested in
+    the raw bytes (or in :py:meth:`readinto`) don't pay for the decoding
+    of the text, and binary output can't make the event fail.
+
     :ivar Exe exe: Instance of :py:class:`Exe` that created this event.
-    :ivar string ~EventExeData.data: The raw string buffer with binary data from child process.
-    :ivar int ~EventExeData.size: The size of **data** (same as ``len(data)``)
-    :ivar list lines: List of strings with all text lines
+    :ivar int ~EventExeData.size: The size of the data in bytes
+
+    .. versionchanged:: 1.27
+        :py:attr:`data` and :py:attr:`lines` are computed on first access,
+        invalid UTF-8 sequences are replaced instead of raising.
+
     """
     cdef int _set_obj(self, void *o) except 0:
         cdef Ecore_Exe_Event_Data *obj
-        cdef int i
         obj = <Ecore_Exe_Event_Data*>o
         self.exe = _ecore_exe_event_mapping.get(<uintptr_t>obj.exe)
         if self.exe is None:
             return -1
-        self.data = PyUnicode_FromStringAndSize(<char*>obj.data, obj.size)
+        self.obj = obj
         self.size = obj.size
-        self.lines = []
-
-        line_append = self.lines.append
-        if obj.lines:
-            i = 0
-            while obj.lines[i].line != NULL:
-                line_append(PyUnicode_FromStringAndSize(
-                        obj.lines[i].line, obj.lines[i].size))
-                i += 1
-
         return 1
 
+    cdef void _release(self):
+        # The C event is freed after the dispatch, keep a copy of the
+        # data only if someone is still holding the event.
+        if self.obj == NULL:
+            return
+        if PY_REFCOUNT(self) > 1:
+            if self._raw is None:
+                self._raw = PyBytes_FromStringAndSize(
+                    <char *>self.obj.data, self.obj.size)
+            if self._raw_lines is None:
+                self._raw_lines_get()
+        self.obj = NULL
+
     def __repr__(self):
-        if self.lines is None:
-            count = None
+        return "<%s(size=%d, exe=%r)>" % \
+            (self.__class__.__name__, self.size, self.exe)
+
+    property raw:
+        """The data received from the child process, as is.
+
+        :type: bytes
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            if self._raw is None:
+                if self.obj == NULL:
+                    raise ValueError("Object uninitialized")
+                self._raw = PyBytes_FromStringAndSize(
+                    <char *>self.obj.data, self.obj.size)
+            return self._raw
+
+    cdef object _raw_lines_get(self):
+        cdef:
+            Ecore_Exe_Event_Data_Line *lines
+            int i = 0
+        if self._raw_lines is None:
+            if self.obj == NULL:
+                raise ValueError("Object uninitialized")
+            self._raw_lines = []
+            lines = self.obj.lines
+            if lines != NULL:
+                while lines[i].line != NULL:
+                    self._raw_lines.append(PyBytes_FromStringAndSize(
+                        lines[i].line, lines[i].size))
+                    i += 1
+        return self._raw_lines
+
+    property raw_lines:
+        """The received lines, as is, only with line buffered flags.
+
+        :type: list of bytes
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._raw_lines_get()
+
+    property text:
+        """The data received from the child process, decoded from UTF-8.
+
+        :type: str
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            if self._text is None:
+                self._text = self.raw.decode("UTF-8", "replace")
+            return self._text
+
+    property data:
+        """Same as :py:attr:`text`, kept for compatibility.
+
+        :type: str
+
+        """
+        def __get__(self):
+            return self.text
+
+    property lines:
+        """List of strings with all text lines, only with line buffered
+        flags.
+
+        :type: list of str
+
+        """
+        def __get__(self):
+            if self._lines is None:
+                self._lines = [l.decode("UTF-8", "replace")
+                               for l in self._raw_lines_get()]
+            return self._lines
+
+    def readinto(self, buf, Py_ssize_t offset=0):
+        """Copy the data into a writable buffer, without creating objects.
+
+        :param buf: The destination, fe: a bytearray
+        :param int offset: Where to start writing in **buf**, the data
+            wraps around to the start of **buf** if it doesn't fit, so
+            **buf** can be used as a ring buffer.
+        :return: The offset following the copied data, where to write the
+            next chunk.
+        :rtype: int
+        :raise ValueError: if the data is bigger than **buf**.
+
+        Example::
+
+            ring = bytearray(65536)
+            pos = [0]
+
+            def on_data(exe, event):
+                pos[0] = event.readinto(ring, pos[0])
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Py_buffer view
+            const char *src
+            Py_ssize_t size = self.size, first
+
+        if self.obj != NULL:
+            src = <const char *>self.obj.data
+        elif self._raw is not None:
+            src = <const char *>self._raw
         else:
-            count = len(self.lines)
-        return "<%s(size=%d, lines=#%d, exe=%r)>" % \
-            (self.__class__.__name__, self.size, count, self.exe)
+            raise ValueError("Object uninitialized")
+
+        PyObject_GetBuffer(buf, &view, PyBUF_WRITABLE)
+        try:
+            if size > view.len:
+                raise ValueError(
+                    "data size (%d) is larger than buffer size (%d)." %
+                    (size, view.len))
+            if size == 0:
+                return offset
+            offset %= view.len
+            first = min(size, view.len - offset)
+            memcpy(<char *>view.buf + offset, src, first)
+            if first < size:
+                memcpy(view.buf, src + first, size - first)
+            return (offset + size) % view.len
+        finally:
+            PyBuffer_Release(&view)
 
 
 cdef class EventHandlerExe(EventHandler):
@@ -900,7 +1096,11 @@ cdef class EventHandlerExe(EventHandler):
         e = self.event_cls()
         if e._set_obj(event) == -1: # no exe
             return True
-        return bool(self.func(e, *self.args, **self.kargs))
+        try:
+            return bool(self.func(e, *self.args, **self.kargs))
+        finally:
+            if isinstance(e, EventExeData):
+                (<EventExeData>e)._release()
 
 
 def on_exe_add_event_add(func, *args, **kargs):
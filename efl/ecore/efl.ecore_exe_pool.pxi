@@ -0,0 +1,373 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+from collections import deque
+import struct
+
+
+cdef object _exe_pool_length = struct.Struct(">I")
+
+
+cdef class ExePoolRequest(object):
+    """A request submitted to an :py:class:`ExePool`.
+
+    Works like a simple future: once :py:attr:`done`, either
+    :py:attr:`response` or :py:attr:`error` is set and the callback given to
+    :py:meth:`ExePool.submit` has been called.
+
+    :ivar data: The request payload, as sent to the worker
+    :ivar response: The worker response, as bytes, or ``None``
+    :ivar error: The exception that made the request fail, or ``None``
+    :ivar int attempts: How many times the request has been sent
+
+    .. versionadded:: 1.27
+
+    """
+    cdef readonly object data
+    cdef readonly object response
+    cdef readonly object error
+    cdef readonly int attempts
+    cdef readonly bint done
+    cdef double submitted, finished
+    cdef object func, args, kargs
+
+    def __init__(self):
+        raise TypeError("ExePoolRequest can only be created by ExePool")
+
+    def __repr__(self):
+        return "<%s(size=%d, done=%s, attempts=%d, error=%r)>" % (
+            type(self).__name__, len(self.data), self.done,
+            self.attempts, self.error)
+
+    property latency:
+        """Seconds from the submission to the completion, or ``None``.
+
+        :type: float
+
+        """
+        def __get__(self):
+            if not self.done:
+                return None
+            return self.finished - self.submitted
+
+    cdef void _finish(self, response, error):
+        self.response = response
+        self.error = error
+        self.finished = ecore_time_get()
+        self.done = 1
+        if self.func is not None:
+            try:
+                self.func(self, *self.args, **self.kargs)
+            except Exception:
+                traceback.print_exc()
+        self.func = self.args = self.kargs = None
+
+
+cdef class _ExePoolWorker(object):
+    cdef object exe
+    cdef ExePoolRequest request
+    cdef bytearray buffer
+
+
+cdef class ExePool(object):
+    """
+
+    Keeps a number of worker processes alive and spreads requests on them.
+
+    Each worker is an :py:class:`Exe` running **cmd**, requests are written
+    to the stdin of an idle worker and the first response read from its
+    stdout completes the request. A worker only gets a request at a time,
+    the others wait in a queue, so a slow worker doesn't delay the requests
+    that other workers could serve.
+
+    The messages framing is given by **framing**:
+
+    ``"line"``
+        requests and responses are single lines, the newline is added to
+        the requests and removed from the responses.
+
+    ``"length"``
+        requests and responses are prefixed by their length, as a 4 bytes
+        big endian unsigned integer.
+
+    Workers that die are restarted, waiting **backoff_min** seconds, doubled
+    at each consecutive crash up to **backoff_max**. The request they were
+    serving is queued again, unless it has already been sent
+    **max_attempts** times, then it fails with a :py:exc:`RuntimeError`.
+
+    Everything is driven by the main loop, no thread is involved::
+
+        def on_response(request):
+            print(request.response, request.latency)
+
+        pool = ExePool("./worker.py", 4)
+        pool.submit(b"some work", on_response)
+
+    :param cmd: The command to run for each worker
+    :type cmd: str
+    :param int size: The number of workers
+    :param str framing: ``"line"`` or ``"length"``
+    :param int flags: Additional :py:class:`Exe` flags
+    :param float backoff_min: The initial delay before respawning a worker
+    :param float backoff_max: The maximum delay before respawning a worker
+    :param int max_attempts: How many times a request is sent before failing
+
+    .. versionadded:: 1.27
+
+    """
+    cdef readonly object cmd
+    cdef readonly int size
+    cdef readonly object framing
+    cdef readonly bint running
+    cdef readonly unsigned long completed, failed, restarts
+    cdef int flags, max_attempts, crashes
+    cdef double backoff_min, backoff_max, latency_total, latency_max
+    cdef list workers, idle, timers
+    cdef object queue
+
+    def __init__(self, cmd, int size, framing="line", int flags=0,
+                 double backoff_min=0.1, double backoff_max=10.0,
+                 int max_attempts=3):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if framing not in ("line", "length"):
+            raise ValueError("framing must be 'line' or 'length'")
+
+        self.cmd = cmd
+        self.size = size
+        self.framing = framing
+        self.flags = flags | enums.ECORE_EXE_PIPE_READ | \
+            enums.ECORE_EXE_PIPE_WRITE | enums.ECORE_EXE_TERM_WITH_PARENT
+        if framing == "line":
+            self.flags |= enums.ECORE_EXE_PIPE_READ_LINE_BUFFERED
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.workers = []
+        self.idle = []
+        self.timers = []
+        self.queue = deque()
+        self.running = 1
+
+        for i in range(size):
+            self._spawn()
+
+    def __repr__(self):
+        return "<%s(cmd=%r, size=%d, alive=%d, idle=%d, queued=%d)>" % (
+            type(self).__name__, self.cmd, self.size, len(self.workers),
+            len(self.idle), len(self.queue))
+
+    def _spawn(self):
+        cdef _ExePoolWorker worker = _ExePoolWorker()
+        worker.buffer = bytearray()
+        worker.exe = Exe(self.cmd, self.flags)
+        worker.exe.on_data_event_add(self._on_data, worker)
+        worker.exe.on_del_event_add(self._on_del, worker)
+        self.workers.append(worker)
+        self.idle.append(worker)
+        self._schedule()
+
+    def _respawn(self, timer):
+        self.timers.remove(timer)
+        if self.running and len(self.workers) < self.size:
+            self._spawn()
+        return ECORE_CALLBACK_CANCEL
+
+    def _schedule(self):
+        cdef:
+            _ExePoolWorker worker
+            ExePoolRequest request
+
+        while self.queue and self.idle:
+            worker = self.idle.pop()
+            request = self.queue.popleft()
+            worker.request = request
+            request.attempts += 1
+            if self.framing == "line":
+                worker.exe.send(request.data + b"\n")
+            else:
+                worker.exe.send(_exe_pool_length.pack(len(request.data)) +
+                                request.data)
+
+    def _on_data(self, exe, EventExeData event, _ExePoolWorker worker):
+        cdef Py_ssize_t size
+
+        if self.framing == "line":
+            for line in event.raw_lines:
+                self._response(worker, line)
+        else:
+            worker.buffer += event.raw
+            while len(worker.buffer) >= 4:
+                size = _exe_pool_length.unpack_from(worker.buffer)[0]
+                if len(worker.buffer) < 4 + size:
+                    break
+                self._response(worker, bytes(worker.buffer[4:4 + size]))
+                del worker.buffer[:4 + size]
+
+        self._schedule()
+
+    def _response(self, _ExePoolWorker worker, response):
+        cdef ExePoolRequest request = worker.request
+        if request is None:
+            # not something we asked for, ignore it
+            return
+
+        worker.request = None
+        self.idle.append(worker)
+        self.crashes = 0
+        self.completed += 1
+        request._finish(response, None)
+        self.latency_total += request.finished - request.submitted
+        if request.finished - request.submitted > self.latency_max:
+            self.latency_max = request.finished - request.submitted
+
+    def _on_del(self, exe, event, _ExePoolWorker worker):
+        cdef:
+            ExePoolRequest request = worker.request
+            double delay
+            Timer timer
+
+        self.workers.remove(worker)
+        if worker in self.idle:
+            self.idle.remove(worker)
+        worker.request = None
+        worker.exe = None
+
+        if request is not None:
+            if self.running and request.attempts < self.max_attempts:
+                self.queue.appendleft(request)
+            else:
+                self.failed += 1
+                request._finish(None, RuntimeError(
+                    "worker died %d times serving the request" %
+                    request.attempts))
+
+        if not self.running:
+            return
+
+        self.crashes += 1
+        self.restarts += 1
+        delay = min(self.backoff_max,
+                    self.backoff_min * 2 ** (self.crashes - 1))
+        timer = Timer(delay, self._respawn)
+        timer.args = (timer,)
+        self.timers.append(timer)
+
+    def submit(self, data, func=None, *args, **kargs):
+        """Queue a request, it will be sent to the first idle worker.
+
+        :param data: The request payload
+        :type data: bytes or str
+        :param func: Called when the request is done, as
+            ``func(request, *args, **kargs)``
+        :type func: callable
+        :return: The request, to check its state later
+        :rtype: :py:class:`ExePoolRequest`
+        :raise RuntimeError: if the pool has been shut down
+        :raise ValueError: if a line request contains a newline
+
+        """
+        cdef ExePoolRequest request
+
+        if not self.running:
+            raise RuntimeError("the pool has been shut down")
+        if func is not None and not callable(func):
+            raise TypeError("Parameter 'func' must be callable")
+        if isinstance(data, unicode):
+            data = PyUnicode_AsUTF8String(data)
+        else:
+            data = bytes(data)
+        if self.framing == "line" and b"\n" in data:
+            raise ValueError("line requests must not contain newlines")
+
+        request = ExePoolRequest.__new__(ExePoolRequest)
+        request.data = data
+        request.func = func
+        request.args = args
+        request.kargs = kargs
+        request.submitted = ecore_time_get()
+        self.queue.append(request)
+        self._schedule()
+        return request
+
+    property queue_depth:
+        """The number of requests waiting for an idle worker.
+
+        :type: int
+
+        """
+        def __get__(self):
+            return len(self.queue)
+
+    def stats_get(self):
+        """Get the pool statistics.
+
+        :return: alive, idle, busy and queued are the current number of
+            workers and waiting requests, completed, failed and restarts are
+            totals since the pool creation, latency_avg and latency_max are
+            in seconds, for the completed requests.
+        :rtype: dict
+
+        """
+        return {
+            "alive": len(self.workers),
+            "idle": len(self.idle),
+            "busy": len(self.workers) - len(self.idle),
+            "queued": len(self.queue),
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "latency_avg": self.latency_total / self.completed
+                           if self.completed else 0.0,
+            "latency_max": self.latency_max,
+        }
+
+    property stats:
+        def __get__(self):
+            return self.stats_get()
+
+    def shutdown(self):
+        """Stop the workers and fail the queued requests.
+
+        The workers are terminated, the requests they were serving fail
+        when they die. Nothing is restarted anymore.
+
+        """
+        cdef:
+            _ExePoolWorker worker
+            ExePoolRequest request
+
+        if not self.running:
+            return
+        self.running = 0
+
+        for timer in self.timers:
+            timer.delete()
+        self.timers = []
+
+        while self.queue:
+            request = self.queue.popleft()
+            self.failed += 1
+            request._finish(None, RuntimeError("the pool has been shut down"))
+
+        for worker in self.workers:
+            if not worker.exe.is_deleted():
+                worker.exe.terminate()
+
+    def delete(self):
+        """Alias for :py:meth:`shutdown`"""
+        self.shutdown()
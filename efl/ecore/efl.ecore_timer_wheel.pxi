@@ -0,0 +1,350 @@
+# Copyright (C) 2007-2022 various contributors (see AUTHORS)
+#
+# This file is part of Python-EFL.
+#
+# Python-EFL is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 3 of the License, or (at your option) any later version.
+#
+# Python-EFL is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
+
+from libc.math cimport floor, ceil
+
+
+# Timeout states
+cdef enum:
+    TIMEOUT_IDLE        # not scheduled, fired or cancelled
+    TIMEOUT_SCHEDULED   # linked in a slot of the wheel
+    TIMEOUT_DUE         # unlinked, waiting to be called in the current batch
+    TIMEOUT_RUNNING     # its callback is running
+
+
+cdef class TimerWheel
+
+
+cdef class Timeout(object):
+    """A timeout managed by a :py:class:`TimerWheel`.
+
+    Created by :py:meth:`TimerWheel.add`, it is a plain object, much lighter
+    than a :py:class:`Timer`.
+
+    :ivar wheel: The wheel of the timeout
+    :ivar float delay: The delay used by the last (re)scheduling
+
+    .. versionadded:: 1.27
+
+    """
+    cdef readonly TimerWheel wheel
+    cdef readonly double delay
+    cdef Timeout prev, next
+    cdef long long deadline
+    cdef int state
+    cdef object func, args, kargs
+
+    def __init__(self):
+        raise TypeError("Timeout can only be created by TimerWheel")
+
+    def __repr__(self):
+        return "<%s(delay=%f, active=%s, func=%s)>" % (
+            type(self).__name__, self.delay, self.active, self.func)
+
+    property active:
+        """Whether the timeout is waiting to be called.
+
+        :type: bool
+
+        """
+        def __get__(self):
+            return self.state == TIMEOUT_SCHEDULED or \
+                self.state == TIMEOUT_DUE
+
+    property pending:
+        """Seconds until the timeout is called, or ``None`` if not active.
+
+        :type: float
+
+        """
+        def __get__(self):
+            if not self.active:
+                return None
+            return max(0.0, self.wheel.start +
+                       self.deadline * self.wheel.resolution -
+                       ecore_time_get())
+
+    def cancel(self):
+        """Stop the timeout, its callback won't be called.
+
+        Nothing is done if the timeout isn't active.
+
+        """
+        if self.state == TIMEOUT_SCHEDULED:
+            self.wheel._unlink(self)
+        self.state = TIMEOUT_IDLE
+
+    def delete(self):
+        """Alias for :py:meth:`cancel`"""
+        self.cancel()
+
+    def reschedule(self, delay=None):
+        """Schedule the timeout again, from now.
+
+        Works on active timeouts as well as on fired or cancelled ones.
+
+        :param delay: The new delay in seconds, the previous one if ``None``
+        :type delay: float
+
+        """
+        if self.wheel.slots is None:
+            raise RuntimeError("the wheel has been deleted")
+        if self.state == TIMEOUT_SCHEDULED:
+            self.wheel._unlink(self)
+        if delay is not None:
+            self.delay = delay
+        self.wheel._link(self)
+
+
+cdef Eina_Bool _timer_wheel_cb(void *data) with gil:
+    cdef TimerWheel wheel = <TimerWheel>data
+
+    try:
+        wheel._tick()
+    except Exception:
+        traceback.print_exc()
+
+    if wheel.timer == NULL:
+        # deleted by a callback
+        return enums.ECORE_CALLBACK_CANCEL
+    if wheel.count == 0:
+        wheel.timer = NULL
+        Py_DECREF(wheel)
+        return enums.ECORE_CALLBACK_CANCEL
+    return enums.ECORE_CALLBACK_RENEW
+
+
+cdef class TimerWheel(object):
+    """
+
+    Manages a lot of timeouts with a single :py:class:`Timer`.
+
+    Every :py:class:`Timer` is an Eo object with its own ecore timer, that's
+    too heavy when thousands of timeouts are needed, as for per connection
+    timeouts. A wheel keeps its timeouts in **slots** buckets, adding,
+    cancelling and rescheduling them costs the same whatever their number.
+    A single ecore timer ticks every **resolution** seconds while timeouts
+    are active, and calls all the ones that are due at once.
+
+    Timeouts are never called early, but can be called up to a
+    **resolution** late (plus the main loop latency)::
+
+        wheel = TimerWheel(0.1)
+
+        def on_timeout(conn):
+            conn.close()
+
+        timeout = wheel.add(30.0, on_timeout, conn)
+        ...
+        # some activity on the connection
+        timeout.reschedule()
+
+    Like for :py:class:`Timer`, the callbacks are called as
+    ``func(*args, **kargs)``, returning **True** (or ``ECORE_CALLBACK_RENEW``)
+    schedules the timeout again with the same delay.
+
+    :param float resolution: The tick length, in seconds
+    :param int slots: The number of buckets, delays up to
+        ``resolution * slots`` are checked only once
+
+    .. versionadded:: 1.27
+
+    """
+    cdef readonly double resolution
+    cdef readonly int count
+    cdef double start
+    cdef long long tick
+    cdef list slots
+    cdef list due       # the timeouts being called by _tick()
+    cdef Ecore_Timer *timer
+
+    def __init__(self, double resolution=0.1, int slots=512):
+        cdef Timeout sentinel
+
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+
+        self.resolution = resolution
+        self.start = ecore_time_get()
+        self.slots = []
+        for i in range(slots):
+            sentinel = Timeout.__new__(Timeout)
+            sentinel.prev = sentinel.next = sentinel
+            self.slots.append(sentinel)
+
+    def __repr__(self):
+        return "<%s(resolution=%f, slots=%d, count=%d)>" % (
+            type(self).__name__, self.resolution,
+            len(self.slots) if self.slots is not None else 0, self.count)
+
+    def __len__(self):
+        return self.count
+
+    cdef long long _now_tick(self):
+        return <long long>floor((ecore_time_get() - self.start) /
+                                self.resolution)
+
+    cdef int _link(self, Timeout timeout) except -1:
+        cdef:
+            Timeout sentinel
+            long long deadline
+
+        if self.timer == NULL:
+            # nothing was scheduled, no tick to catch up
+            self.tick = self._now_tick()
+            self.timer = ecore_timer_add(self.resolution, _timer_wheel_cb,
+                                         <void *>self)
+            if self.timer == NULL:
+                raise RuntimeError("could not create the wheel timer")
+            Py_INCREF(self)
+
+        deadline = <long long>ceil((ecore_time_get() + timeout.delay -
+                                    self.start) / self.resolution)
+        if deadline <= self.tick:
+            deadline = self.tick + 1
+        timeout.deadline = deadline
+
+        sentinel = self.slots[deadline % len(self.slots)]
+        timeout.prev = sentinel.prev
+        timeout.next = sentinel
+        sentinel.prev.next = timeout
+        sentinel.prev = timeout
+        timeout.state = TIMEOUT_SCHEDULED
+        self.count += 1
+        return 0
+
+    cdef void _unlink(self, Timeout timeout):
+        timeout.prev.next = timeout.next
+        timeout.next.prev = timeout.prev
+        timeout.prev = timeout.next = None
+        timeout.state = TIMEOUT_IDLE
+        self.count -= 1
+
+    cdef int _tick(self) except -1:
+        cdef:
+            long long now = self._now_tick()
+            long long t, first, last
+            Py_ssize_t n = len(self.slots)
+            Timeout sentinel, timeout, nxt
+            list due = []
+
+        first = self.tick + 1
+        last = now
+        if last - first >= n:
+            # late by more than a turn, every slot is checked once
+            last = first + n - 1
+
+        for t in range(first, last + 1):
+            sentinel = self.slots[t % n]
+            timeout = sentinel.next
+            while timeout is not sentinel:
+                nxt = timeout.next
+                if timeout.deadline <= now:
+                    self._unlink(timeout)
+                    timeout.state = TIMEOUT_DUE
+                    due.append(timeout)
+                timeout = nxt
+        self.tick = now
+
+        self.due = due
+        try:
+            for timeout in due:
+                if self.slots is None:
+                    # deleted by a previous callback
+                    break
+                # cancelled, rescheduled or cleared by a previous callback
+                if timeout.state != TIMEOUT_DUE:
+                    continue
+                timeout.state = TIMEOUT_RUNNING
+                try:
+                    ret = timeout.func(*timeout.args, **timeout.kargs)
+                except Exception:
+                    traceback.print_exc()
+                    ret = False
+                if timeout.state == TIMEOUT_RUNNING:
+                    timeout.state = TIMEOUT_IDLE
+                    if ret and self.slots is not None:
+                        self._link(timeout)
+        finally:
+            self.due = None
+        return 0
+
+    def add(self, double delay, func, *args, **kargs):
+        """Schedule a timeout.
+
+        :param delay: Seconds before calling **func**
+        :type delay: float
+        :param func: Called as ``func(*args, **kargs)``
+        :type func: callable
+        :return: The timeout, to cancel or reschedule it
+        :rtype: :py:class:`Timeout`
+
+        """
+        cdef Timeout timeout
+
+        if self.slots is None:
+            raise RuntimeError("the wheel has been deleted")
+        if not callable(func):
+            raise TypeError("Parameter 'func' must be callable")
+
+        timeout = Timeout.__new__(Timeout)
+        timeout.wheel = self
+        timeout.delay = delay
+        timeout.func = func
+        timeout.args = args
+        timeout.kargs = kargs
+        self._link(timeout)
+        return timeout
+
+    def clear(self):
+        """Cancel all the timeouts.
+
+        Called from a callback, the other timeouts due in the same tick are
+        cancelled too.
+
+        """
+        cdef Timeout sentinel, timeout
+
+        if self.due is not None:
+            for timeout in self.due:
+                if timeout.state == TIMEOUT_DUE:
+                    timeout.state = TIMEOUT_IDLE
+        if self.slots is None:
+            return
+        for sentinel in self.slots:
+            while sentinel.next is not sentinel:
+                self._unlink(sentinel.next)
+
+    def delete(self):
+        """Cancel all the timeouts and stop the wheel timer.
+
+        The wheel can't be used anymore.
+
+        """
+        cdef Timeout sentinel
+
+        self.clear()
+        if self.slots is not None:
+            for sentinel in self.slots:
+                sentinel.prev = sentinel.next = None
+            self.slots = None
+        if self.timer != NULL:
+            ecore_timer_del(self.timer)
+            self.timer = NULL
+            Py_DECREF(self)
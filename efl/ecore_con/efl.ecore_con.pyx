@@ -164,7 +164,19 @@ Module level functions
 """
 
 from libc.stdint cimport uintptr_t
+from libc.string cimport memcpy
 from cpython cimport PyUnicode_AsUTF8String, Py_INCREF, Py_DECREF
+from cpython cimport PyObject
+from cpython.buffer cimport Py_buffer, PyBUF_CONTIG_RO
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
+from cpython.memoryview cimport PyMemoryView_FromBuffer
+
+cdef extern from "Python.h":
+    # with a NULL owner, the view doesn't keep anything alive
+    int PyBuffer_FillInfo(Py_buffer *view, PyObject *obj, void *buf,
+                          Py_ssize_t len, int readonly, int flags) except -1
+    # the cpython.bytearray declaration doesn't propagate the errors
+    int PyByteArray_Resize(object bytearray, Py_ssize_t len) except -1
 
 import traceback
 import atexit
@@ -241,40 +253,48 @@ def shutdown():
 cdef Eina_Bool _con_event_filter_cb(void *data, int ev_type, void *ev) with gil:
     cdef:
         ConEventFilter filter = <ConEventFilter>data
+        Url url
+        void *found
         object event_cls
         Event py_event
         list cbs
-        Eo obj
-        object func
-        tuple args
-        dict kargs
+
+    # all the url events start with the Ecore_Con_Url, look for the
+    # callbacks of the object before building anything, most events are
+    # for other objects or not even managed by us. The pointer hash reads
+    # the key, so it gets the address of the pointer.
+    found = eina_hash_find(filter.objects,
+                           &(<Ecore_Con_Event_Url_Complete *>ev).url_con)
+    if found == NULL:
+        return 1
+
+    # streaming mode, the data goes to the body buffer and to the chunk
+    # function without building any event object
+    if ev_type == ECORE_CON_EVENT_URL_DATA:
+        url = <Url>ecore_con_url_data_get(
+            (<Ecore_Con_Event_Url_Data *>ev).url_con)
+        if url._streaming:
+            try:
+                url._stream_data(<Ecore_Con_Event_Url_Data *>ev)
+            except Exception:
+                traceback.print_exc()
+
+    cbs = (<dict>found).get(ev_type)
+    if not cbs:
+        return 1
 
     # create correct "EventAbc" python object, using the global mapping
     event_cls = _event_mapping_get(ev_type)
-    if event_cls:
-        py_event = event_cls()
-
-        # object_from_instance can fail in _set_obj if the event is
-        # generated from an object not managed by us, so just ignore it.
-        try:
-            py_event._set_obj(ev)
-        except:
-            return 1
+    if event_cls is None:
+        return 1
+    py_event = event_cls()
+    py_event._set_obj(ev)
 
-        # do we have callbacks for this object/event ?
+    for func, args, kargs in tuple(cbs): # copy, so we can change the list
         try:
-            obj = py_event._get_obj()
-            cbs = filter.callbacks.get(ev_type).get(obj)
-        except:
-            cbs = None
-
-        if cbs:
-            cbs = cbs[:] # copy, so we can change filter.callbacks
-            for func, args, kargs in cbs:
-                try:
-                    func(py_event, *args, **kargs)
-                except Exception:
-                    traceback.print_exc()
+            func(py_event, *args, **kargs)
+        except Exception:
+            traceback.print_exc()
 
     return 1 # always return true, no matter what
 
@@ -282,58 +302,93 @@ cdef class ConEventFilter(object):
 
     """
     self.callbacks = {
-        EV_TYPE: {
-            objX: [(cb,args,kargs), ... ]
-            objY: [(cb,args,kargs), ... ]
+        objX: {
+            EV_TYPE: [(cb,args,kargs), ... ]
+            ...
         },
         ...
     }
+
+    The dict of each object is also in self.objects, a C hash keyed by the
+    Ecore_Con_Url pointer, used to dispatch the events. A single ecore
+    handler is connected for each event type, as long as there are
+    callbacks for it, self.handlers_count counts them. Objects in streaming
+    mode stay registered, even without callbacks, and count as a data
+    callback.
     """
 
     def __cinit__(self):
         self.callbacks = {}
         self.handlers = {}
+        self.handlers_count = {}
+        self.objects = eina_hash_pointer_new(NULL)
+
+    cdef _handler_ref(self, int ev_type, int count):
+        # connect a single ecore signal, one per event_type, while used
+        cdef Ecore_Event_Handler* ee
+        cdef int total = self.handlers_count.get(ev_type, 0) + count
+
+        if total > 0:
+            self.handlers_count[ev_type] = total
+            if not ev_type in self.handlers:
+                ee = ecore_event_handler_add(ev_type, _con_event_filter_cb,
+                                             <void *>self)
+                self.handlers[ev_type] = <uintptr_t><void *>ee
+            return
+
+        self.handlers_count.pop(ev_type, None)
+        if ev_type in self.handlers:
+            handler = self.handlers.pop(ev_type)
+            ecore_event_handler_del(<Ecore_Event_Handler *><uintptr_t>handler)
+
+    cdef callback_add(self, int ev_type, Url obj, object func, tuple args, dict kargs):
+        cdef dict d = self.callbacks.get(obj)
 
-    cdef callback_add(self, int ev_type, Eo obj, object func, tuple args, dict kargs):
         # store the function in the callbacks dict
-        if not ev_type in self.callbacks:
-            self.callbacks[ev_type] = {}
-        if not obj in self.callbacks[ev_type]:
-            self.callbacks[ev_type][obj] = []
-        self.callbacks[ev_type][obj].append((func,args,kargs))
+        if d is None:
+            d = self.callbacks[obj] = {}
+            eina_hash_add(self.objects, &obj.obj2, <void *>d)
+        d.setdefault(ev_type, []).append((func, args, kargs))
+        self._handler_ref(ev_type, 1)
 
-        # connect a single ecore signal, one per event_type
-        cdef Ecore_Event_Handler* ee
-        if not ev_type in self.handlers:
-            ee = ecore_event_handler_add(ev_type, _con_event_filter_cb,
-                                         <void *>self)
-            self.handlers[ev_type] = <uintptr_t><void *>ee
+    cdef callback_del(self, int ev_type, Url obj, object func, tuple args, dict kargs):
+        cdef dict d = self.callbacks.get(obj)
 
-    cdef callback_del(self, int ev_type, Eo obj, object func, tuple args, dict kargs):
         try:
-            self.callbacks[ev_type][obj].remove((func, args, kargs))
-        except ValueError:
+            d[ev_type].remove((func, args, kargs))
+        except (TypeError, KeyError, ValueError):
             raise ValueError(
                 "callback is not registered: %s, args=%s, kargs=%s" %
                 (func, args, kargs))
 
-        # can delete the ecore handler?
-        if self.callbacks.get(ev_type) and self.callbacks.get(ev_type).get(obj):
-            return
-        if ev_type in self.handlers:
-            handler = self.handlers.pop(ev_type)
-            ecore_event_handler_del(<Ecore_Event_Handler *><uintptr_t>handler)
+        if not d[ev_type]:
+            del d[ev_type]
+            if not d and not obj._streaming:
+                self.callback_del_full(obj)
+        self._handler_ref(ev_type, -1)
 
-    cdef callback_del_full(self, Eo obj):
-        for ev_type in self.callbacks:
-            if obj in self.callbacks[ev_type]:
-                # remove all the cbs for the obj
-                self.callbacks[ev_type].pop(obj, None)
+    cdef callback_del_full(self, Url obj):
+        cdef dict d = self.callbacks.pop(obj, None)
 
-                # can delete the ecore handler?
-                if len(self.callbacks[ev_type]) < 1 and ev_type in self.handlers:
-                    handler = self.handlers.pop(ev_type)
-                    ecore_event_handler_del(<Ecore_Event_Handler *><uintptr_t>handler)
+        if d is None:
+            return
+        eina_hash_del(self.objects, &obj.obj2, NULL)
+        # the handlers may be needed by the other objects
+        for ev_type, cbs in d.items():
+            self._handler_ref(ev_type, -len(cbs))
+
+    cdef stream_set(self, Url obj, bint enable):
+        cdef dict d = self.callbacks.get(obj)
+
+        if enable:
+            if d is None:
+                d = self.callbacks[obj] = {}
+                eina_hash_add(self.objects, &obj.obj2, <void *>d)
+            self._handler_ref(ECORE_CON_EVENT_URL_DATA, 1)
+        else:
+            self._handler_ref(ECORE_CON_EVENT_URL_DATA, -1)
+            if d is not None and not d:
+                self.callback_del_full(obj)
 
 # name suggestions are welcome for this unusual "singleton" instance
 cdef ConEventFilter GEF = ConEventFilter()
@@ -186,6 +186,21 @@ cdef class Url(Eo):
         u = ecore.Url('http://example.com', fd=fd.fileno())
         u.get()
 
+    To get the whole response in memory, without a bytes copy of each
+    received chunk, enable the :attr:`buffered` mode and read :attr:`body`
+    when the request is completed::
+
+        def on_complete(event):
+            doc = json.loads(bytes(event.url.body))
+
+        u = ecore.Url('http://example.com/api', buffered=True,
+                      buffer_max_size=1024 * 1024)
+        u.on_complete_event_add(on_complete)
+        u.get()
+
+    An incremental parser can instead be fed directly with the received
+    chunks using :func:`chunk_func_set`.
+
     .. seealso::
         If you just need to download a file please consider using the
         simpler :class:`efl.ecore.FileDownload` class instead.
@@ -241,6 +256,9 @@ cdef class Url(Eo):
             events. That will otherwise continue to use resources.
 
         """
+        if self._streaming:
+            self._streaming = 0
+            GEF.stream_set(self, 0)
         GEF.callback_del_full(self)
         ecore_con_url_free(self.obj2)
         self.obj2 = NULL
@@ -284,6 +302,7 @@ cdef class Url(Eo):
         :return: ``True`` on success, ``False`` on error.
         
         """
+        self._stream_reset()
         return bool(ecore_con_url_get(self.obj2))
 
     def head(self):
@@ -296,6 +315,7 @@ cdef class Url(Eo):
         :return: ``True`` on success, ``False`` on error.
         
         """
+        self._stream_reset()
         return bool(ecore_con_url_head(self.obj2))
 
     def post(self, bytes data, content_type):
@@ -316,6 +336,7 @@ cdef class Url(Eo):
         """
         if isinstance(content_type, unicode):
             content_type = PyUnicode_AsUTF8String(content_type)
+        self._stream_reset()
         return bool(ecore_con_url_post(self.obj2,
             <const void*><const char *>data if data is not None else NULL,
             len(data),
@@ -353,6 +374,7 @@ cdef class Url(Eo):
         if isinstance(user, unicode): user = PyUnicode_AsUTF8String(user)
         if isinstance(passwd, unicode): passwd = PyUnicode_AsUTF8String(passwd)
         if isinstance(upload_dir, unicode): upload_dir = PyUnicode_AsUTF8String(upload_dir)
+        self._stream_reset()
         return bool(ecore_con_url_ftp_upload(self.obj2,
                 <const char *>filename if filename is not None else NULL,
                 <const char *>user if user is not None else NULL,
@@ -719,6 +741,157 @@ cdef class Url(Eo):
         def __get__(self):
             return ecore_con_url_received_bytes_get(self.obj2)
 
+    property buffered:
+        """Accumulate the response data in an internal buffer.
+
+        The data is appended to a growable buffer as it is received, without
+        creating a bytes object for each chunk, and is available in
+        :attr:`body`. The buffer is reset by each new request.
+
+        Note that no data is received if a file has been set with :attr:`fd`.
+
+        :type: bool
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return bool(self._buffered)
+
+        def __set__(self, bint buffered):
+            self._buffered = buffered
+            self._stream_update()
+
+    property buffer_max_size:
+        """The maximum number of bytes accepted for a response.
+
+        When a response grows past this size the rest of the data is
+        dropped: it is not added to :attr:`body` nor given to the chunk
+        function anymore, and :attr:`body_overflow` is set. ``0`` means no
+        limit.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._max_size
+
+        def __set__(self, Py_ssize_t max_size):
+            if max_size < 0:
+                raise ValueError("max_size must not be negative")
+            self._max_size = max_size
+
+    property body:
+        """The data received by the last request in :attr:`buffered` mode.
+
+        ``None`` if the buffered mode is disabled or no request has been
+        done yet. Read it when the request is completed, the buffer is
+        replaced by the next request.
+
+        :type: memoryview (**readonly**)
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            if self._body is None:
+                return None
+            return memoryview(self._body)
+
+    property body_overflow:
+        """Whether the last response exceeded :attr:`buffer_max_size`.
+
+        :type: bool (**readonly**)
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return bool(self._overflow)
+
+    def chunk_func_set(self, func, *args, **kargs):
+        """Set a function to be fed with the response data as it arrives.
+
+        The given function will be called for each received chunk with the
+        following signature::
+
+            func(url, chunk, *args, **kargs)
+
+        ``chunk`` is a read only memoryview on the received data, no copy is
+        done, thus it is only valid during the call: copy what you need to
+        keep. This is meant to feed incremental parsers. Use ``None`` to
+        remove the function.
+
+        It works together with :attr:`buffered` and the data events.
+
+        .. versionadded:: 1.27
+
+        """
+        if func is not None and not callable(func):
+            raise TypeError("Parameter 'func' must be callable")
+        self._chunk_func = func
+        self._chunk_args = args
+        self._chunk_kargs = kargs
+        self._stream_update()
+
+    cdef void _stream_update(self):
+        cdef bint streaming = self._buffered or self._chunk_func is not None
+
+        if streaming == self._streaming:
+            return
+        self._streaming = streaming
+        GEF.stream_set(self, streaming)
+
+    cdef void _stream_reset(self):
+        self._body = bytearray() if self._buffered else None
+        self._received = 0
+        self._overflow = 0
+
+    cdef int _stream_data(self, Ecore_Con_Event_Url_Data *event) except -1:
+        cdef:
+            Py_ssize_t size = event.size
+            Py_ssize_t old_size
+            Py_buffer view
+            object chunk
+
+        if self._overflow or size <= 0:
+            return 0
+        if self._max_size and self._received + size > self._max_size:
+            self._overflow = 1
+            return 0
+        self._received += size
+
+        if self._buffered:
+            if self._body is None:
+                self._body = bytearray()
+            old_size = PyByteArray_GET_SIZE(self._body)
+            try:
+                PyByteArray_Resize(self._body, old_size + size)
+            except BufferError:
+                # a view on the buffer is still held, leave it to its owner
+                self._body = bytearray(self._body)
+                PyByteArray_Resize(self._body, old_size + size)
+            memcpy(PyByteArray_AS_STRING(self._body) + old_size,
+                   event.data, size)
+
+        if self._chunk_func is not None:
+            PyBuffer_FillInfo(&view, NULL, event.data, size, 1,
+                              PyBUF_CONTIG_RO)
+            chunk = PyMemoryView_FromBuffer(&view)
+            try:
+                self._chunk_func(self, chunk,
+                                 *self._chunk_args, **self._chunk_kargs)
+            except Exception:
+                traceback.print_exc()
+            # the data is freed after the event, don't let the view outlive it
+            try:
+                chunk.release()
+            except AttributeError:
+                pass
+        return 0
+
     def httpauth_set(self, username, password, bint safe):
         """Set to use http auth, with given username and password
         
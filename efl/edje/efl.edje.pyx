@@ -30,13 +30,18 @@ Classes
 
 """
 
-from cpython cimport PyMem_Malloc, PyMem_Free, PyUnicode_AsUTF8String
+from cpython cimport PyMem_Malloc, PyMem_Free, PyUnicode_AsUTF8String, \
+    Py_INCREF, PyObject_GetBuffer, PyBuffer_Release, PyBUF_FORMAT, \
+    PyBUF_C_CONTIGUOUS, PyBUF_WRITABLE, PyBUF_ND, PyBUF_STRIDES, \
+    PyBytes_FromStringAndSize, PyObject_CheckBuffer
+from libc.string cimport memcpy
 cimport libc.stdlib
 from libc.stdint cimport uintptr_t
 
-from efl.eina cimport eina_list_free, eina_stringshare_del, Eina_Stringshare
+from efl.eina cimport eina_list_free, eina_stringshare_del, Eina_Stringshare, \
+    Eina_Hash, eina_hash_string_superfast_new, eina_hash_find, eina_hash_add
 from efl.eo cimport _object_mapping_register, object_from_instance, \
-    _register_decorated_callbacks
+    _register_decorated_callbacks, PY_REFCOUNT
 
 from efl.utils.conversions cimport _ctouni, _touni, \
     eina_list_strings_to_python_list
@@ -30,6 +30,9 @@ cdef class Message:
         def __get__(self):
             return self._id
 
+    cdef void _release(self):
+        pass
+
 
 cdef class MessageString(Message):
     """String message.
@@ -76,6 +79,31 @@ cdef class MessageFloat(Message):
             return self.obj.val
 
 
+cdef int _message_values_buffer_get(Py_buffer *view, object obj, void *buf,
+                                    Py_ssize_t count, Py_ssize_t itemsize,
+                                    char *format, bint readonly,
+                                    Py_ssize_t *shape_strides,
+                                    int flags) except -1:
+    # a one dimension buffer over the values of a set message
+    if readonly and flags & PyBUF_WRITABLE:
+        raise BufferError("the message values are read only")
+
+    shape_strides[0] = count
+    shape_strides[1] = itemsize
+    view.buf = buf
+    view.obj = obj
+    view.len = count * itemsize
+    view.readonly = readonly
+    view.itemsize = itemsize
+    view.format = format if flags & PyBUF_FORMAT else NULL
+    view.ndim = 1
+    view.shape = shape_strides if flags & PyBUF_ND else NULL
+    view.strides = shape_strides + 1 if flags & PyBUF_STRIDES else NULL
+    view.suboffsets = NULL
+    view.internal = NULL
+    return 0
+
+
 cdef class MessageStringSet(Message):
     """String set message.
 
@@ -108,57 +136,137 @@ cdef class MessageStringSet(Message):
 cdef class MessageIntSet(Message):
     """Integer set message.
 
+    The values are also available through the buffer protocol, as C ints,
+    for example with ``memoryview(message)``, without creating a python
+    object for each of them. The buffer is a copy, made once, so it stays
+    valid after the message handler returns. A message kept by the handler
+    keeps a copy of its values.
+
     :ivar val: message contents.
+
+    .. versionchanged:: 1.27
+        Added the buffer protocol support
     """
-    property val:
-        def __get__(self):
-            cdef int i
+    cdef int _copy(self) except -1:
+        if self._values is None:
             if self.obj == NULL:
                 raise ValueError("Object uninitialized")
+            self._values = PyBytes_FromStringAndSize(
+                <char *>self.obj.val, self.obj.count * sizeof(int))
+            self._count = self.obj.count
+        return 0
+
+    cdef void _release(self):
+        # keep the values only if someone is still holding the message
+        if self.obj == NULL:
+            return
+        if PY_REFCOUNT(self) > 1:
+            self._copy()
+        self.obj = NULL
+
+    cdef const int *_vals(self) except NULL:
+        if self.obj != NULL:
+            return self.obj.val
+        self._copy()
+        return <const int *><char *>self._values
+
+    cdef int _len(self) except -1:
+        if self.obj != NULL:
+            return self.obj.count
+        self._copy()
+        return self._count
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        self._copy()
+        _message_values_buffer_get(view, self, <char *>self._values,
+                                   self._count, sizeof(int), "i", 1,
+                                   self._shape_strides, flags)
+
+    property val:
+        def __get__(self):
+            cdef:
+                int i, n = self._len()
+                const int *val = self._vals()
             lst = []
-            for i from 0 <= i < self.obj.count:
-                lst.append(self.obj.val[i])
+            for i from 0 <= i < n:
+                lst.append(val[i])
             return lst
 
     def __len__(self):
-        if self.obj == NULL:
-            raise ValueError("Object uninitialized")
-        return self.obj.count
+        return self._len()
 
     def __getitem__(self, int index):
-        if self.obj == NULL:
-            raise ValueError("Object uninitialized")
-        if index < 0 or index >= self.obj.count:
+        if index < 0 or index >= self._len():
             raise IndexError("list index out of range")
-        return self.obj.val[index]
+        return self._vals()[index]
 
 
 cdef class MessageFloatSet(Message):
     """Float set message.
 
+    The values are also available through the buffer protocol, as C
+    doubles, for example with ``memoryview(message)``, without creating a
+    python object for each of them. The buffer is a copy, made once, so it
+    stays valid after the message handler returns. A message kept by the
+    handler keeps a copy of its values.
+
     :ivar val: message contents.
+
+    .. versionchanged:: 1.27
+        Added the buffer protocol support
     """
-    property val:
-        def __get__(self):
-            cdef int i
+    cdef int _copy(self) except -1:
+        if self._values is None:
             if self.obj == NULL:
                 raise ValueError("Object uninitialized")
+            self._values = PyBytes_FromStringAndSize(
+                <char *>self.obj.val, self.obj.count * sizeof(double))
+            self._count = self.obj.count
+        return 0
+
+    cdef void _release(self):
+        # keep the values only if someone is still holding the message
+        if self.obj == NULL:
+            return
+        if PY_REFCOUNT(self) > 1:
+            self._copy()
+        self.obj = NULL
+
+    cdef const double *_vals(self) except NULL:
+        if self.obj != NULL:
+            return self.obj.val
+        self._copy()
+        return <const double *><char *>self._values
+
+    cdef int _len(self) except -1:
+        if self.obj != NULL:
+            return self.obj.count
+        self._copy()
+        return self._count
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        self._copy()
+        _message_values_buffer_get(view, self, <char *>self._values,
+                                   self._count, sizeof(double), "d", 1,
+                                   self._shape_strides, flags)
+
+    property val:
+        def __get__(self):
+            cdef:
+                int i, n = self._len()
+                const double *val = self._vals()
             lst = []
-            for i from 0 <= i < self.obj.count:
-                lst.append(self.obj.val[i])
+            for i from 0 <= i < n:
+                lst.append(val[i])
             return lst
 
     def __len__(self):
-        if self.obj == NULL:
-            raise ValueError("Object uninitialized")
-        return self.obj.count
+        return self._len()
 
     def __getitem__(self, int index):
-        if self.obj == NULL:
-            raise ValueError("Object uninitialized")
-        if index < 0 or index >= self.obj.count:
+        if index < 0 or index >= self._len():
             raise IndexError("list index out of range")
-        return self.obj.val[index]
+        return self._vals()[index]
 
 
 cdef class MessageStringInt(Message):
@@ -273,6 +381,141 @@ cdef class MessageStringFloatSet(Message):
         return self.obj.val[index]
 
 
+cdef class MessageBuffer(object):
+    """A preallocated integer or float set message, to send.
+
+    Sending the same kind of message repeatedly with
+    :py:meth:`Edje.message_send_buffer` doesn't allocate anything, the
+    values are written in place through the buffer protocol, as C ints or
+    doubles::
+
+        msg = MessageBuffer(EDJE_MESSAGE_FLOAT_SET, 3)
+        values = memoryview(msg)
+        values[0], values[1], values[2] = x, y, z
+        obj.message_send_buffer(1, msg)
+
+    Edje copies the messages it queues, so the buffer can be changed as
+    soon as it has been sent.
+
+    :param type: ``EDJE_MESSAGE_INT_SET`` or ``EDJE_MESSAGE_FLOAT_SET``
+    :param int size: The maximum number of values
+
+    .. versionadded:: 1.27
+
+    """
+    cdef void *msg
+    cdef readonly int type
+    cdef readonly int size
+    cdef Py_ssize_t itemsize
+    cdef Py_ssize_t shape_strides[2]
+
+    def __cinit__(self, int type, int size):
+        if size < 1:
+            raise ValueError("size must be positive")
+        if type == enums.EDJE_MESSAGE_INT_SET:
+            self.itemsize = sizeof(int)
+            self.msg = PyMem_Malloc(sizeof(Edje_Message_Int_Set) +
+                                    (size - 1) * sizeof(int))
+        elif type == enums.EDJE_MESSAGE_FLOAT_SET:
+            self.itemsize = sizeof(double)
+            self.msg = PyMem_Malloc(sizeof(Edje_Message_Float_Set) +
+                                    (size - 1) * sizeof(double))
+        else:
+            raise ValueError("type must be EDJE_MESSAGE_INT_SET or "
+                             "EDJE_MESSAGE_FLOAT_SET")
+        if self.msg == NULL:
+            raise MemoryError()
+        self.type = type
+        self.size = size
+        (<Edje_Message_Int_Set *>self.msg).count = size
+
+    def __dealloc__(self):
+        PyMem_Free(self.msg)
+        self.msg = NULL
+
+    cdef void *_values_get(self):
+        if self.type == enums.EDJE_MESSAGE_INT_SET:
+            return (<Edje_Message_Int_Set *>self.msg).val
+        return (<Edje_Message_Float_Set *>self.msg).val
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        _message_values_buffer_get(view, self, self._values_get(),
+            (<Edje_Message_Int_Set *>self.msg).count, self.itemsize,
+            "i" if self.type == enums.EDJE_MESSAGE_INT_SET else "d", 0,
+            self.shape_strides, flags)
+
+    def __len__(self):
+        return (<Edje_Message_Int_Set *>self.msg).count
+
+    property count:
+        """The number of values sent, at most :py:attr:`size`.
+
+        :type: int
+
+        """
+        def __get__(self):
+            return (<Edje_Message_Int_Set *>self.msg).count
+
+        def __set__(self, int count):
+            if count < 0 or count > self.size:
+                raise ValueError("count must be between 0 and %d" % self.size)
+            (<Edje_Message_Int_Set *>self.msg).count = count
+
+    def values_set(self, values):
+        """Copy the values and set :py:attr:`count` to their number.
+
+        :param values: A buffer of C ints for an integer set, C doubles for
+            a float set, or any sequence of numbers
+        :raise ValueError: if there are more than :py:attr:`size` values
+
+        """
+        cdef:
+            Py_buffer view
+            Py_ssize_t i, n
+
+        if PyObject_CheckBuffer(values):
+            PyObject_GetBuffer(values, &view,
+                               PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)
+            try:
+                if view.itemsize == self.itemsize and \
+                        _message_format_char(view.format) == \
+                        (b'i' if self.type == enums.EDJE_MESSAGE_INT_SET
+                         else b'd'):
+                    n = view.len // view.itemsize
+                    if n > self.size:
+                        raise ValueError("too many values, the size is %d" %
+                                         self.size)
+                    memcpy(self._values_get(), view.buf, view.len)
+                    (<Edje_Message_Int_Set *>self.msg).count = n
+                    return
+            finally:
+                PyBuffer_Release(&view)
+
+        n = len(values)
+        if n > self.size:
+            raise ValueError("too many values, the size is %d" % self.size)
+        if self.type == enums.EDJE_MESSAGE_INT_SET:
+            for i in range(n):
+                (<Edje_Message_Int_Set *>self.msg).val[i] = values[i]
+        else:
+            for i in range(n):
+                (<Edje_Message_Float_Set *>self.msg).val[i] = values[i]
+        (<Edje_Message_Int_Set *>self.msg).count = n
+
+
+cdef char _message_format_char(const char *format):
+    # the type of a buffer of simple values in native byte order, or 0
+    if format == NULL:
+        return b'B'
+    if format[0] == b'@' or format[0] == b'=':
+        format += 1
+    if format[0] == 0 or format[1] != 0:
+        return 0
+    if format[0] == b'l' and sizeof(long) == sizeof(int):
+        return b'i'
+    return format[0]
+
+
 cdef Message MessageString_from_ptr(void *msg):
     cdef MessageString m
     m = MessageString()
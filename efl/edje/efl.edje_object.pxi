@@ -40,22 +40,89 @@ cdef void message_handler_cb(void *data,
     if self._message_handler_cb is None:
         return
     func, args, kargs = self._message_handler_cb
+    m = Message_from_type(type, id, msg)
     try:
-        func(self, Message_from_type(type, id, msg), *args, **kargs)
+        func(self, m, *args, **kargs)
+    except Exception:
+        traceback.print_exc()
+    if m is not None:
+        # the C message is freed by edje after the handler
+        (<Message>m)._release()
+
+
+# Emissions and sources decoded once and shared, themes use a small set of
+# them. Strings built at runtime could make it grow forever, so it is capped.
+cdef Eina_Hash *_signal_strings = NULL
+cdef int _signal_strings_count = 0
+cdef int _SIGNAL_STRINGS_MAX = 4096
+
+cdef unicode _signal_string_get(const char *s):
+    global _signal_strings, _signal_strings_count
+    cdef:
+        void *found
+        unicode u
+
+    if s == NULL:
+        return None
+    if _signal_strings == NULL:
+        _signal_strings = eina_hash_string_superfast_new(NULL)
+
+    found = eina_hash_find(_signal_strings, s)
+    if found != NULL:
+        return <unicode>found
+
+    u = _ctouni(s)
+    if _signal_strings_count < _SIGNAL_STRINGS_MAX and \
+            eina_hash_add(_signal_strings, s, <void *>u):
+        # kept forever
+        Py_INCREF(u)
+        _signal_strings_count += 1
+    return u
+
+
+cdef class _SignalCallback(object):
+    cdef object func, args, kargs
+    cdef unsigned long received
+    # the (emission, source) pairs waiting for a batch callback, or None
+    cdef list batch
+
+
+cdef void _signal_callback_call(Edje self, _SignalCallback cb,
+                                unicode emission, unicode source):
+    if cb.func is None:
+        # removed by a previous callback
+        return
+    cb.received += 1
+    if cb.batch is not None:
+        if not cb.batch:
+            if not self._signal_batch_pending:
+                self._signal_batch_schedule()
+            self._signal_batch_pending.append(cb)
+        cb.batch.append((emission, source))
+        return
+    try:
+        cb.func(self, emission, source, *cb.args, **cb.kargs)
     except Exception:
         traceback.print_exc()
 
 
 cdef void signal_cb(void *data, Evas_Object *obj,
                     const char *emission, const char *source) with gil:
-    cdef Edje self
+    cdef:
+        Edje self
+        list lst = <list>data
+        unicode em, src
+
     self = object_from_instance(obj)
-    lst = tuple(<object>data)
-    for func, args, kargs in lst:
-        try:
-            func(self, _ctouni(emission), _ctouni(source), *args, **kargs)
-        except Exception:
-            traceback.print_exc()
+    em = _signal_string_get(emission)
+    src = _signal_string_get(source)
+
+    # the callbacks may change the list, only copy it if there are several
+    if len(lst) == 1:
+        _signal_callback_call(self, lst[0], em, src)
+    else:
+        for cb in tuple(lst):
+            _signal_callback_call(self, cb, em, src)
 
 
 class EdjeLoadError(Exception):
@@ -103,6 +170,7 @@ cdef class Edje(Object):
     """
     def __cinit__(self, *a, **ka):
         self._signal_callbacks = {}
+        self._signal_batch_pending = []
 
     def __init__(self, Canvas canvas not None, file=None, group=None, size=None,
                  geometry=None, **kwargs):
@@ -134,6 +202,10 @@ cdef class Edje(Object):
 
     def __free_wrapper_resources(self, ed):
         self._signal_callbacks.clear()
+        del self._signal_batch_pending[:]
+        if self._signal_batch_enterer is not None:
+            self._signal_batch_enterer.delete()
+            self._signal_batch_enterer = None
         self._text_change_cb = None
         self._message_handler_cb = None
 
@@ -1433,6 +1505,88 @@ cdef class Edje(Object):
         else:
             raise TypeError("invalid message type '%s'" % type(data).__name__)
 
+    def message_send_buffer(self, int id, data):
+        """Send an integer or float set message from a buffer.
+
+        The values are copied straight from **data** to the message, no
+        python object is created for each of them:
+
+        - a :py:class:`MessageBuffer` is sent as is, without any allocation
+        - a buffer of C ints (``array('i')``, ``numpy.int32``) is sent as
+          ``EDJE_MESSAGE_INT_SET``
+        - a buffer of C doubles (``array('d')``, ``numpy.float64``) is sent
+          as ``EDJE_MESSAGE_FLOAT_SET``, C floats are converted
+
+        The buffer must be contiguous.
+
+        :param int id: The message id
+        :param data: The values
+        :raise TypeError: if data is not a buffer of one of these types
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            MessageBuffer msg
+            Py_buffer view
+            Py_ssize_t i, n
+            # small messages don't need an allocation
+            double stack[65]
+            void *m = <void *>stack
+            Edje_Message_Type type
+            char fmt
+
+        if isinstance(data, MessageBuffer):
+            msg = <MessageBuffer>data
+            edje_object_message_send(self.obj, <Edje_Message_Type>msg.type,
+                                     id, msg.msg)
+            return
+
+        if not PyObject_CheckBuffer(data):
+            raise TypeError("data must support the buffer protocol")
+
+        PyObject_GetBuffer(data, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)
+        try:
+            n = view.len // view.itemsize if view.itemsize else 0
+            fmt = _message_format_char(view.format)
+            if fmt == b'i' and view.itemsize == sizeof(int):
+                type = enums.EDJE_MESSAGE_INT_SET
+                if sizeof(Edje_Message_Int_Set) + n * sizeof(int) > \
+                        sizeof(stack):
+                    m = PyMem_Malloc(sizeof(Edje_Message_Int_Set) +
+                                     n * sizeof(int))
+                    if m == NULL:
+                        raise MemoryError()
+                memcpy((<Edje_Message_Int_Set *>m).val, view.buf, view.len)
+            elif fmt == b'd' and view.itemsize == sizeof(double) or \
+                    fmt == b'f' and view.itemsize == sizeof(float):
+                type = enums.EDJE_MESSAGE_FLOAT_SET
+                if sizeof(Edje_Message_Float_Set) + n * sizeof(double) > \
+                        sizeof(stack):
+                    m = PyMem_Malloc(sizeof(Edje_Message_Float_Set) +
+                                     n * sizeof(double))
+                    if m == NULL:
+                        raise MemoryError()
+                if view.itemsize == sizeof(double):
+                    memcpy((<Edje_Message_Float_Set *>m).val, view.buf,
+                           view.len)
+                else:
+                    for i in range(n):
+                        (<Edje_Message_Float_Set *>m).val[i] = \
+                            (<float *>view.buf)[i]
+            else:
+                raise TypeError("data must be a buffer of C ints, floats or "
+                                "doubles, not %r" % (
+                                    view.format if view.format != NULL
+                                    else b"B"))
+
+            (<Edje_Message_Int_Set *>m).count = n
+            edje_object_message_send(self.obj, type, id, m)
+        finally:
+            PyBuffer_Release(&view)
+            if m != <void *>stack:
+                PyMem_Free(m)
+
     def message_handler_set(self, func, *args, **kargs):
         """Set the handler of messages coming from Embryo.
 
@@ -1479,6 +1633,52 @@ cdef class Edje(Object):
         """
         if not callable(func):
             raise TypeError("func must be callable")
+        self._signal_callback_add(emission, source, func, args, kargs, False)
+
+    def signal_callback_batch_add(self, emission, source, func,
+                                  *args, **kargs):
+        """Add a callback receiving the given signals in batches.
+
+        Signature::
+
+            function(object, signals, *args, **kargs)
+
+        Instead of calling python for each signal, the matching signals are
+        collected and **func** is called once per main loop iteration, with
+        the list of ``(emission, source)`` tuples received since the
+        previous call. This is much cheaper for the high rate signals that
+        the animations of a theme may emit.
+
+        The patterns are matched by Edje, only the matching signals reach
+        the binding. Use :py:meth:`signal_callback_del` to remove the
+        callback.
+
+        :param emission:
+            the emission to listen, may be or contain '*' to match multiple.
+        :param source:
+            the emission's source to listen, may be or contain '*' to match
+            multiple.
+        :param func:
+            the callable to use. Will get any further arguments you gave to
+            signal_callback_batch_add().
+
+        :raise TypeError: if func is not callable.
+
+        .. versionadded:: 1.27
+
+        """
+        if not callable(func):
+            raise TypeError("func must be callable")
+        self._signal_callback_add(emission, source, func, args, kargs, True)
+
+    def _signal_callback_add(self, emission, source, func, tuple args,
+                             dict kargs, bint batch):
+        cdef _SignalCallback cb = _SignalCallback()
+        cb.func = func
+        cb.args = args
+        cb.kargs = kargs
+        if batch:
+            cb.batch = []
 
         d = self._signal_callbacks.setdefault(emission, {})
         lst = d.setdefault(source, [])
@@ -1489,10 +1689,61 @@ cdef class Edje(Object):
                 <const char *>emission if emission is not None else NULL,
                 <const char *>source if source is not None else NULL,
                 signal_cb, <void*>lst)
-        lst.append((func, args, kargs))
+        lst.append(cb)
+
+    cdef void _signal_batch_schedule(self):
+        from efl.ecore import IdleEnterer
+        if self._signal_batch_enterer is None:
+            self._signal_batch_enterer = IdleEnterer(self._signal_batch_flush)
+
+    def _signal_batch_flush(self):
+        cdef:
+            list pending = self._signal_batch_pending
+            _SignalCallback cb
+            list signals
+
+        self._signal_batch_enterer = None
+        self._signal_batch_pending = []
+        for cb in pending:
+            signals = cb.batch
+            if cb.func is None:
+                # removed in the meantime
+                continue
+            cb.batch = []
+            try:
+                cb.func(self, signals, *cb.args, **cb.kargs)
+            except Exception:
+                traceback.print_exc()
+        return False
+
+    def signal_callback_stats_get(self):
+        """Get how many signals each callback received.
+
+        :return: a ``(emission, source, func, count)`` tuple for each
+            callback, ``count`` includes the signals still waiting for a
+            batch callback.
+        :rtype: list of tuples
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _SignalCallback cb
+        ret = []
+        for emission, d in self._signal_callbacks.items():
+            for source, lst in d.items():
+                for cb in lst:
+                    ret.append((emission, source, cb.func, cb.received))
+        return ret
 
     def signal_callback_del(self, emission, source, func):
-        """Remove the callable associated with given emission and source."""
+        """Remove the callable associated with given emission and source.
+
+        .. versionchanged:: 1.27
+            Also removes the callbacks added with
+            :py:meth:`signal_callback_batch_add`
+
+        """
+        cdef _SignalCallback cb
         try:
             d = self._signal_callbacks[emission]
             lst = d[source]
@@ -1502,15 +1753,16 @@ cdef class Edje(Object):
                              (func, emission, source))
 
         i = -1
-        for i, (f, a, k) in enumerate(lst):
-            if func == f:
+        for i, cb in enumerate(lst):
+            if func == cb.func:
                 break
         else:
             raise ValueError(("function %s not associated with "
                               "emission %r, source %r") %
                              (func, emission, source))
 
-        lst.pop(i)
+        cb = lst.pop(i)
+        cb.func = None
         if lst:
             return
         d.pop(source)
@@ -17,7 +17,7 @@
 #
 
 from cpython cimport PyUnicode_AsUTF8String, PyMem_Malloc, Py_DECREF, Py_INCREF
-from libc.string cimport memcpy, strdup
+from libc.string cimport memcpy, memcmp, strdup
 from libc.stdlib cimport malloc, free
 from libc.stdint cimport uintptr_t
 
@@ -36,6 +36,7 @@ from efl.ecore cimport Event, EventHandler, _event_mapping_register
 
 import sys
 import traceback
+import weakref
 import atexit
 
 
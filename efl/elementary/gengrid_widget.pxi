@@ -19,6 +19,12 @@ cdef class Gengrid(Object):
         self._set_obj(elm_gengrid_add(parent.obj))
         self._set_properties_from_keyword_args(kwargs)
 
+    def __contains__(self, x):
+        # an item knows its widget, no need to walk the grid
+        if not isinstance(x, ObjectItem) or (<ObjectItem>x).item == NULL:
+            return False
+        return elm_object_item_widget_get((<ObjectItem>x).item) == self.obj
+
     def clear(self):
         """Remove all items from a given gengrid widget."""
         elm_gengrid_clear(self.obj)
@@ -132,6 +138,59 @@ cdef class Gengrid(Object):
         return GengridItem(item_class, item_data, func, item_data)\
                           .append_to(self)
 
+    def items_append(self, GengridItemClass item_class not None,
+                     items_data, func=None):
+        """Append many new items (add as last items) to this gengrid.
+
+        :param item_class: a valid instance that defines the
+            behavior of the items. See :py:class:`GengridItemClass`.
+        :param items_data: an iterable with the data of each item, an item is
+            appended for each value, see :py:meth:`item_append`
+        :param func: if not None, this must be a callable to be
+            called back when an item is selected, see :py:meth:`item_append`
+
+        :return: The new items
+        :rtype: list of :py:class:`GengridItem`
+
+        This is the same as calling :py:meth:`item_append` for each value of
+        **items_data**, but all the items are created in a single loop
+        without going back to python, which is a lot faster for big grids.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            GengridItem item
+            Elm_Object_Item *it
+            Evas_Smart_Cb cb = NULL
+            list ret = []
+
+        if func is not None:
+            if not callable(func):
+                raise TypeError("func is not None or callable")
+            cb = _py_elm_gengrid_item_func
+
+        for item_data in items_data:
+            # skip GengridItem.__init__, the values are known to be valid
+            item = GengridItem.__new__(GengridItem)
+            item.item_class = item_class
+            item.item_data = item_data
+            item.cb_func = func
+            item.func_data = item_data
+            item.args = ()
+            item.kwargs = {}
+
+            it = elm_gengrid_item_append(self.obj,
+                item_class.cls, <void*>item,
+                cb, <void*>item)
+            if it == NULL:
+                raise RuntimeError("The item could not be added to the widget.")
+
+            item._set_obj(it)
+            ret.append(item)
+
+        return ret
+
     def item_prepend(self, GengridItemClass item_class not None,
                      item_data, func=None):
         """Prepend a new item (add as first item) to this gengrid.
@@ -554,6 +613,57 @@ cdef class Gengrid(Object):
         """
         return _object_item_to_python(elm_gengrid_nth_item_get(self.obj, nth))
 
+    def index_of(self, ObjectItem item not None):
+        """Get the position of an item in the gengrid.
+
+        The grid is walked in C, the index kept by Elementary is only
+        updated when the gengrid is laid out and is stale right after an
+        insertion.
+
+        :param item: An item of the gengrid
+        :return: The position of the item, 0 being the first
+        :rtype: int
+        :raise ValueError: if the item is not in the gengrid
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Elm_Object_Item *it
+            int i
+
+        if item not in self:
+            raise ValueError("%r is not in the gengrid" % (item,))
+
+        it = elm_gengrid_first_item_get(self.obj)
+        i = 0
+        while it != NULL and it != item.item:
+            it = elm_gengrid_item_next_get(it)
+            i += 1
+        return i
+
+    def item_at(self, int index):
+        """Get the item at a given position.
+
+        Like :py:meth:`nth_item_get`, but negative indexes count from the
+        end of the grid and an error is raised if there is no such item.
+
+        :param int index: The position of the item, 0 being the first
+        :rtype: :py:class:`GengridItem`
+        :raise IndexError: if there is no item at this position
+
+        .. versionadded:: 1.27
+
+        """
+        cdef Elm_Object_Item *it
+
+        if index < 0:
+            index += elm_gengrid_items_count(self.obj)
+        it = elm_gengrid_nth_item_get(self.obj, index) if index >= 0 else NULL
+        if it == NULL:
+            raise IndexError("gengrid index out of range")
+        return _object_item_to_python(it)
+
     def at_xy_item_get(self, int x, int y):
         """Get the item that is at the x, y canvas coords.
 
@@ -651,9 +761,9 @@ cdef class Gengrid(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self._internal_data()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["item_container_data_get_cb"] = data_get
+        self._internal_data()["item_container_data_get_cb"] = data_get
 
         if not elm_drag_item_container_add(self.obj,
             tm_to_anim,
@@ -702,10 +812,10 @@ cdef class Gengrid(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self._internal_data()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["drag_item_container_pos"] = poscb
-        self.internal_data["drop_item_container_cb"] = dropcb
+        self._internal_data()["drag_item_container_pos"] = poscb
+        self._internal_data()["drop_item_container_cb"] = dropcb
 
         if not elm_drop_item_container_add(self.obj,
             format,
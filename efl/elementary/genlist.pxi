@@ -17,42 +17,111 @@
 
 include "genlist_cdef.pxi"
 
+from collections import OrderedDict
+from efl.eina cimport Eina_Hash, eina_hash_string_superfast_new, \
+    eina_hash_find, eina_hash_add
+
+# Part names given to the item class getters, decoded once and shared
+cdef Eina_Hash *_genlist_part_names = NULL
+
+cdef unicode _genlist_part_name_get(const char *part):
+    global _genlist_part_names
+    cdef:
+        void *found
+        unicode u
+
+    if part == NULL:
+        return None
+    if _genlist_part_names == NULL:
+        _genlist_part_names = eina_hash_string_superfast_new(NULL)
+
+    found = eina_hash_find(_genlist_part_names, part)
+    if found != NULL:
+        return <unicode>found
+
+    u = _ctouni(part)
+    if eina_hash_add(_genlist_part_names, part, <void *>u):
+        # kept forever, the part names of the themes are a small set
+        Py_INCREF(u)
+    return u
+
+# The rows of a Genlist model (see Genlist.model_set) have no python item,
+# their data is the row index, tagged with the lowest bit, that is always
+# clear in the pointers to python objects.
+cdef inline bint _genlist_model_row_is(const void *data):
+    return (<uintptr_t>data) & 1
+
+cdef inline void *_genlist_model_row_to_data(Py_ssize_t row):
+    return <void *>((<uintptr_t>row << 1) | 1)
+
+cdef inline Py_ssize_t _genlist_model_row_from_data(const void *data):
+    return <Py_ssize_t>(<uintptr_t>data >> 1)
+
+cdef GenlistItemClass _genlist_item_class_get(void *data, Evas_Object *obj):
+    cdef Genlist gl
+    if _genlist_model_row_is(data):
+        gl = object_from_instance(obj)
+        return gl._model_item_class
+    return (<GenlistItem>data).item_class
+
+cdef object _genlist_item_data_get(void *data, Evas_Object *obj):
+    cdef Genlist gl
+    if _genlist_model_row_is(data):
+        gl = object_from_instance(obj)
+        return gl._model[_genlist_model_row_from_data(data)]
+    return (<GenlistItem>data).item_data
+
+cdef object _genlist_text_cache_miss = object()
+
 cdef char *_py_elm_genlist_item_text_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
-        GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        GenlistItemClass itc = _genlist_item_class_get(data, obj)
+        unicode u = _genlist_part_name_get(part)
+        dict parts = None
 
-    func = item.item_class._text_get_func
+    func = itc._text_get_func
     if func is None:
         return NULL
 
+    if itc._text_cache is not None:
+        if _genlist_model_row_is(data):
+            key = _genlist_model_row_from_data(data)
+        else:
+            key = <GenlistItem>data
+        parts = itc._text_cache_parts_get(key)
+        ret = parts.get(u, _genlist_text_cache_miss)
+        if ret is not _genlist_text_cache_miss:
+            return strdup(ret) if ret is not None else NULL
+
     try:
         o = object_from_instance(obj)
-        ret = func(o, u, item.item_data)
+        ret = func(o, u, _genlist_item_data_get(data, obj))
     except Exception:
         traceback.print_exc()
         return NULL
 
     if ret is not None:
         if isinstance(ret, unicode): ret = PyUnicode_AsUTF8String(ret)
+    if parts is not None:
+        parts[u] = ret
+    if ret is not None:
         return strdup(ret)
     else:
         return NULL
 
 cdef Evas_Object *_py_elm_genlist_item_content_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
-        GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _genlist_part_name_get(part)
         evasObject icon
 
-    func = item.item_class._content_get_func
+    func = _genlist_item_class_get(data, obj)._content_get_func
     if func is None:
         return NULL
 
     o = object_from_instance(obj)
 
     try:
-        icon = func(o, u, item.item_data)
+        icon = func(o, u, _genlist_item_data_get(data, obj))
     except Exception:
         traceback.print_exc()
         return NULL
@@ -64,11 +133,10 @@ cdef Evas_Object *_py_elm_genlist_item_content_get(void *data, Evas_Object *obj,
 
 cdef Evas_Object *_py_elm_genlist_item_reusable_content_get(void *data, Evas_Object *obj, const char *part, Evas_Object *old) with gil:
     cdef:
-        GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _genlist_part_name_get(part)
         evasObject icon
 
-    func = item.item_class._reusable_content_get_func
+    func = _genlist_item_class_get(data, obj)._reusable_content_get_func
     if func is None:
         return NULL
 
@@ -76,7 +144,7 @@ cdef Evas_Object *_py_elm_genlist_item_reusable_content_get(void *data, Evas_Obj
     old_content = object_from_instance(old)
 
     try:
-        icon = func(o, u, item.item_data, old_content)
+        icon = func(o, u, _genlist_item_data_get(data, obj), old_content)
     except Exception:
         traceback.print_exc()
         return NULL
@@ -88,18 +156,17 @@ cdef Evas_Object *_py_elm_genlist_item_reusable_content_get(void *data, Evas_Obj
 
 cdef Eina_Bool _py_elm_genlist_item_state_get(void *data, Evas_Object *obj, const char *part) with gil:
     cdef:
-        GenlistItem item = <GenlistItem>data
-        unicode u = _ctouni(part)
+        unicode u = _genlist_part_name_get(part)
         bint ret
         Genlist o
 
-    func = item.item_class._state_get_func
+    func = _genlist_item_class_get(data, obj)._state_get_func
     if func is None:
         return 0
 
     try:
         o = object_from_instance(obj)
-        ret = func(o, u, item.item_data)
+        ret = func(o, u, _genlist_item_data_get(data, obj))
     except Exception:
         traceback.print_exc()
         return 0
@@ -108,18 +175,17 @@ cdef Eina_Bool _py_elm_genlist_item_state_get(void *data, Evas_Object *obj, cons
 
 cdef Eina_Bool _py_elm_genlist_item_filter_get(void *data, Evas_Object *obj, void *key) with gil:
     cdef:
-        GenlistItem item = <GenlistItem>data
         object pykey = <object>key
         bint ret
         Genlist o
 
-    func = item.item_class._filter_get_func
+    func = _genlist_item_class_get(data, obj)._filter_get_func
     if func is None:
         return 1
 
     try:
         o = object_from_instance(obj)
-        ret = func(o, pykey, item.item_data)
+        ret = func(o, pykey, _genlist_item_data_get(data, obj))
     except Exception:
         traceback.print_exc()
         return 0
@@ -127,10 +193,15 @@ cdef Eina_Bool _py_elm_genlist_item_filter_get(void *data, Evas_Object *obj, voi
     return ret
 
 cdef void _py_elm_genlist_object_item_del(void *data, Evas_Object *obj) with gil:
-    cdef GenlistItem item = <GenlistItem>data
+    cdef GenlistItem item
 
-    if item is None:
+    if data == NULL:
         return
+    if _genlist_model_row_is(data):
+        _genlist_model_row_del(data, obj)
+        return
+
+    item = <GenlistItem>data
 
     func = item.item_class._del_func
 
@@ -141,6 +212,7 @@ cdef void _py_elm_genlist_object_item_del(void *data, Evas_Object *obj) with gil
         except Exception:
             traceback.print_exc()
 
+    item.item_class._text_cache_invalidate(item)
     item._unset_obj()
 
 cdef void _py_elm_genlist_item_func(void *data, Evas_Object *obj, void *event_info) with gil:
@@ -157,14 +229,69 @@ cdef void _py_elm_genlist_item_func(void *data, Evas_Object *obj, void *event_in
         except Exception:
             traceback.print_exc()
 
+cdef void _py_elm_genlist_model_item_func(void *data, Evas_Object *obj, void *event_info) with gil:
+    cdef:
+        Genlist gl
+        GenlistItem item
+
+    try:
+        gl = object_from_instance(obj)
+        item = _object_item_to_python(<Elm_Object_Item *>event_info)
+        gl._model_func(item, gl, item.item_data)
+    except Exception:
+        traceback.print_exc()
+
+cdef GenlistItem _genlist_model_item_new(Elm_Object_Item *it):
+    cdef:
+        Genlist gl = object_from_instance(elm_object_item_widget_get(it))
+        Py_ssize_t row = _genlist_model_row_from_data(elm_object_item_data_get(it))
+        GenlistModelItem item
+
+    # the live items of the rows are tracked, to forget the C item when
+    # the row is deleted
+    if gl._model_items is None:
+        gl._model_items = weakref.WeakValueDictionary()
+    item = gl._model_items.get(row)
+    if item is not None and item.item == it:
+        return item
+
+    item = GenlistModelItem.__new__(GenlistModelItem)
+    item.row = row
+    item.item = it
+    item.item_class = gl._model_item_class
+    item.item_data = gl._model[row]
+    item.args = ()
+    item.kwargs = {}
+    gl._model_items[row] = item
+    return item
+
+cdef void _genlist_model_row_del(void *data, Evas_Object *obj):
+    cdef:
+        void *gl = efl_key_data_get(obj, "python-eo")
+        GenlistModelItem item
+
+    # called while the genlist is destroyed too, don't create a wrapper
+    if gl == NULL or not isinstance(<object>gl, Genlist) or \
+            (<Genlist>gl)._model_items is None:
+        return
+    item = (<Genlist>gl)._model_items.pop(
+        _genlist_model_row_from_data(data), None)
+    if item is not None:
+        item.item = NULL
+
 cdef int _py_elm_genlist_compare_func(const void *data1, const void *data2) with gil:
     cdef:
-        Elm_Object_Item *citem1 = <Elm_Object_Item *>data1
-        Elm_Object_Item *citem2 = <Elm_Object_Item *>data2
-        GenlistItem item1 = <GenlistItem>elm_object_item_data_get(citem1)
-        GenlistItem item2 = <GenlistItem>elm_object_item_data_get(citem2)
+        GenlistItem item1, item2
         object func
 
+    # rows of a model don't hold a GenlistItem, resolve them
+    o1 = _object_item_to_python(<Elm_Object_Item *>data1)
+    o2 = _object_item_to_python(<Elm_Object_Item *>data2)
+    if not isinstance(o1, GenlistItem) or not isinstance(o2, GenlistItem):
+        return 0
+    item1 = o1
+    item2 = o2
+
     if item1.comparison_func is not None:
         func = item1.comparison_func
     elif item2.comparison_func is not None:
@@ -182,6 +309,60 @@ cdef int _py_elm_genlist_compare_func(const void *data1, const void *data2) with
     else:
         return 0
 
+# Native sort keys, see GenlistItem.sorted_insert()
+cdef enum:
+    GENLIST_SORT_KEY_NONE
+    GENLIST_SORT_KEY_INT
+    GENLIST_SORT_KEY_FLOAT
+    GENLIST_SORT_KEY_BYTES
+
+cdef int _py_elm_genlist_key_compare_func(const void *data1, const void *data2) with gil:
+    cdef:
+        void *d1 = elm_object_item_data_get(<Elm_Object_Item *>data1)
+        void *d2 = elm_object_item_data_get(<Elm_Object_Item *>data2)
+        GenlistItem item1, item2
+        double f1, f2
+        Py_ssize_t l1, l2
+        int ret
+
+    if d1 == NULL or d2 == NULL or \
+            _genlist_model_row_is(d1) or _genlist_model_row_is(d2):
+        # no sort key there
+        return _py_elm_genlist_compare_func(data1, data2)
+
+    item1 = <GenlistItem>d1
+    item2 = <GenlistItem>d2
+
+    if item1.sort_key_type == GENLIST_SORT_KEY_INT and \
+            item2.sort_key_type == GENLIST_SORT_KEY_INT:
+        return (item1.sort_key_int > item2.sort_key_int) - \
+               (item1.sort_key_int < item2.sort_key_int)
+
+    if item1.sort_key_type == GENLIST_SORT_KEY_BYTES and \
+            item2.sort_key_type == GENLIST_SORT_KEY_BYTES:
+        l1 = len(item1.sort_key_bytes)
+        l2 = len(item2.sort_key_bytes)
+        ret = memcmp(<const char *>item1.sort_key_bytes,
+                     <const char *>item2.sort_key_bytes, l1 if l1 < l2 else l2)
+        if ret != 0:
+            return ret
+        return (l1 > l2) - (l1 < l2)
+
+    if (item1.sort_key_type == GENLIST_SORT_KEY_INT or
+            item1.sort_key_type == GENLIST_SORT_KEY_FLOAT) and \
+            (item2.sort_key_type == GENLIST_SORT_KEY_INT or
+             item2.sort_key_type == GENLIST_SORT_KEY_FLOAT):
+        f1 = item1.sort_key_float \
+            if item1.sort_key_type == GENLIST_SORT_KEY_FLOAT \
+            else <double>item1.sort_key_int
+        f2 = item2.sort_key_float \
+            if item2.sort_key_type == GENLIST_SORT_KEY_FLOAT \
+            else <double>item2.sort_key_int
+        return (f1 > f2) - (f1 < f2)
+
+    # no comparable keys, use the python comparison function if any
+    return _py_elm_genlist_compare_func(data1, data2)
+
 cdef class GenlistIterator(object):
     cdef:
         Elm_Object_Item *current_item
@@ -10,6 +10,10 @@ cdef class GenlistItem(ObjectItem):
         Elm_Object_Item *parent_item
         int flags
         object comparison_func, item_data, func_data
+        int sort_key_type
+        long long sort_key_int
+        double sort_key_float
+        bytes sort_key_bytes
 
     def __init__(self, GenlistItemClass item_class not None, item_data=None,
                  GenlistItem parent_item=None,
@@ -79,6 +83,9 @@ cdef class GenlistItem(ObjectItem):
         Py_DECREF(self)
         return 1
 
+    cdef object _text_cache_key(self):
+        return self
+
     def __repr__(self):
         return ("<%s(%#x, refcount=%d, Elm_Object_Item=%#x, "
                 "item_class=%s, func=%s, item_data=%r)>") % (
@@ -213,7 +220,8 @@ cdef class GenlistItem(ObjectItem):
         self._set_properties_from_keyword_args(self.kwargs)
         return self
 
-    def sorted_insert(self, Genlist genlist not None, comparison_func):
+    def sorted_insert(self, Genlist genlist not None, comparison_func=None,
+                      sort_key=None):
         """Insert a new item into the sorted genlist object
 
         :param genlist: The Genlist object
@@ -228,16 +236,29 @@ cdef class GenlistItem(ObjectItem):
 
                 func(item1, item2)->int
 
+        :param sort_key: The key of the item, the items are sorted by
+            ascending keys, see :py:attr:`sort_key`
+        :type sort_key: int, float, bytes or unicode
         :rtype: :py:class:`GenlistItem`
 
         This inserts an item in the genlist based on user defined comparison
         function. The two arguments passed to the function are genlist items
         to compare.
 
+        When a **sort_key** is given, the keys are compared in C, without
+        calling back to python, which is much faster for big lists.
+        ``comparison_func`` is then only used against the items without a
+        comparable key.
+
+        .. versionchanged:: 1.27
+            Added the **sort_key** parameter, ``comparison_func`` is now
+            optional when it is given.
+
         """
         cdef:
             Elm_Object_Item *item
             Evas_Smart_Cb cb = NULL
+            Eina_Compare_Cb compare = _py_elm_genlist_compare_func
 
         if self.cb_func is not None:
             cb = _py_elm_genlist_item_func
@@ -246,12 +267,18 @@ cdef class GenlistItem(ObjectItem):
             if not callable(comparison_func):
                 raise TypeError("func is not None or callable")
             self.comparison_func = comparison_func
+        elif sort_key is None:
+            raise TypeError("comparison_func or sort_key is needed")
+
+        if sort_key is not None:
+            self._sort_key_set(sort_key)
+            compare = _py_elm_genlist_key_compare_func
 
         item = elm_genlist_item_sorted_insert(genlist.obj,
             self.item_class.cls, <void*>self,
             self.parent_item,
             <Elm_Genlist_Item_Type>self.flags,
-            _py_elm_genlist_compare_func,
+            compare,
             cb, <void*>self)
 
         if item == NULL:
@@ -261,6 +288,44 @@ cdef class GenlistItem(ObjectItem):
         self._set_properties_from_keyword_args(self.kwargs)
         return self
 
+    cdef int _sort_key_set(self, key) except 0:
+        if isinstance(key, float):
+            self.sort_key_float = key
+            self.sort_key_type = GENLIST_SORT_KEY_FLOAT
+        elif isinstance(key, (int, long)):
+            self.sort_key_int = key
+            self.sort_key_type = GENLIST_SORT_KEY_INT
+        elif isinstance(key, bytes):
+            self.sort_key_bytes = key
+            self.sort_key_type = GENLIST_SORT_KEY_BYTES
+        elif isinstance(key, unicode):
+            # UTF-8 keeps the order of the code points
+            self.sort_key_bytes = PyUnicode_AsUTF8String(key)
+            self.sort_key_type = GENLIST_SORT_KEY_BYTES
+        else:
+            raise TypeError("sort_key must be an int, float, bytes or unicode")
+        return 1
+
+    property sort_key:
+        """The key given to :py:meth:`sorted_insert`, or ``None``.
+
+        Integers and floats are compared with each other, bytes with bytes,
+        unicode keys are compared as UTF-8 bytes.
+
+        :type: int, float or bytes
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            if self.sort_key_type == GENLIST_SORT_KEY_INT:
+                return self.sort_key_int
+            elif self.sort_key_type == GENLIST_SORT_KEY_FLOAT:
+                return self.sort_key_float
+            elif self.sort_key_type == GENLIST_SORT_KEY_BYTES:
+                return self.sort_key_bytes
+            return None
+
     property data:
         """User data (model) for the item.
 
@@ -366,6 +431,7 @@ cdef class GenlistItem(ObjectItem):
         .. seealso:: :py:func:`Genlist.realized_items_update()`
 
         """
+        self.item_class._text_cache_invalidate(self._text_cache_key())
         elm_genlist_item_update(self.item)
 
     def item_class_update(self, GenlistItemClass itc not None):
@@ -376,6 +442,8 @@ cdef class GenlistItem(ObjectItem):
         :type itc: :py:class:`GenlistItemClass`
 
         """
+        self.item_class._text_cache_invalidate(self._text_cache_key())
+        self.item_class = itc
         elm_genlist_item_item_class_update(self.item, itc.cls)
 
     # TODO: def item_class_get(self):
@@ -530,6 +598,7 @@ cdef class GenlistItem(ObjectItem):
         .. seealso:: :py:func:`update()`
 
         """
+        self.item_class._text_cache_invalidate(self._text_cache_key())
         if isinstance(parts, unicode): parts = PyUnicode_AsUTF8String(parts)
         elm_genlist_item_fields_update(self.item,
             <const char *>parts if parts is not None else NULL,
@@ -640,3 +709,73 @@ cdef class GenlistItem(ObjectItem):
     def select_mode_get(self):
         return elm_genlist_item_select_mode_get(self.item)
 
+
+
+cdef class GenlistModelItem(GenlistItem):
+    """
+
+    A row of a :py:class:`Genlist` showing a model.
+
+    The rows of a model don't have a python item, see
+    :py:meth:`Genlist.model_set`. One of these is created each time such a
+    row is given to python, by a callback or by a property like
+    :py:attr:`Genlist.selected_item`, and dropped when not used anymore,
+    so compare them with ``==``, not with ``is``. Once the row is deleted,
+    by :py:meth:`delete`, :py:meth:`Genlist.clear` or
+    :py:meth:`Genlist.model_set`, the item is not valid anymore.
+
+    :py:attr:`data` is the value of the model for the row, as it was when
+    the item was created.
+
+    .. versionadded:: 1.27
+
+    """
+
+    cdef readonly Py_ssize_t row
+    cdef object __weakref__
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError("GenlistModelItem can only be created by Genlist")
+
+    def __dealloc__(self):
+        # the row belongs to the genlist, not to this item
+        self.item = NULL
+
+    def __richcmp__(self, other, int op):
+        cdef Elm_Object_Item *it
+        if op != 2 and op != 3:
+            return NotImplemented
+        if not isinstance(other, GenlistModelItem):
+            return op == 3
+        # deleted rows are only equal to themselves
+        it = (<GenlistModelItem>self).item
+        return (self is other or (it != NULL and
+                it == (<GenlistModelItem>other).item)) == (op == 2)
+
+    def __hash__(self):
+        # the row doesn't change when the row is deleted, unlike the item
+        return hash(self.row)
+
+    def __repr__(self):
+        return "<%s(row=%d, Elm_Object_Item=%#x, item_data=%r)>" % (
+            type(self).__name__, self.row, <uintptr_t>self.item,
+            self.item_data)
+
+    cdef object _text_cache_key(self):
+        return self.row
+
+    def delete(self):
+        """Delete the row from the genlist, the model is not changed."""
+        if self.item == NULL:
+            raise ValueError("Object already deleted")
+        elm_object_item_del(self.item)
+        self.item = NULL
+
+    def item_class_update(self, GenlistItemClass itc not None):
+        """The rows of a model all use the item class given to
+        :py:meth:`Genlist.model_set`.
+
+        :raise TypeError: always
+
+        """
+        raise TypeError("The rows of a model can't change their item class")
@@ -25,6 +25,8 @@ cdef class GenlistItemClass(object):
         object _item_style
         object _decorate_item_style
         object _decorate_all_item_style
+        object _text_cache
+        int _text_cache_size
 
     def __cinit__(self):
         self.cls = elm_genlist_item_class_new()
@@ -231,6 +233,62 @@ cdef class GenlistItemClass(object):
             self._decorate_all_item_style = style
             self.cls.decorate_all_item_style = <char *>style if style is not None else NULL
 
+    property text_cache_size:
+        """Cache the texts of the last **text_cache_size** items.
+
+        When set, the results of :py:func:`text_get()` are kept for each item
+        and part, so realizing an item again (fe. when scrolling back over
+        it) does not call :py:func:`text_get()`. The items least recently
+        realized are dropped when the cache is full.
+
+        The cache of an item is invalidated by :py:meth:`GenlistItem.update`,
+        :py:meth:`GenlistItem.fields_update` and
+        :py:meth:`GenlistItem.item_class_update`, use
+        :py:meth:`text_cache_clear` when the texts change in other ways (fe.
+        :py:meth:`Genlist.realized_items_update`).
+
+        0 (the default) disables the cache.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._text_cache_size
+
+        def __set__(self, int size):
+            if size < 0:
+                raise ValueError("size must not be negative")
+            self._text_cache_size = size
+            self._text_cache = OrderedDict() if size > 0 else None
+
+    def text_cache_clear(self):
+        """Drop all the texts kept by the cache.
+
+        .. seealso:: :py:attr:`text_cache_size`
+
+        .. versionadded:: 1.27
+
+        """
+        if self._text_cache is not None:
+            self._text_cache.clear()
+
+    cdef dict _text_cache_parts_get(self, object key):
+        # the item becomes the most recently used one, the key is the
+        # GenlistItem or, for the rows of a model, the row index
+        cdef dict parts = self._text_cache.pop(key, None)
+        if parts is None:
+            parts = {}
+            if len(self._text_cache) >= self._text_cache_size:
+                self._text_cache.popitem(False)
+        self._text_cache[key] = parts
+        return parts
+
+    cdef void _text_cache_invalidate(self, object key):
+        if self._text_cache is not None:
+            self._text_cache.pop(key, None)
+
     def text_get(self, evasObject obj, part, item_data):
         """To be called by Genlist for each row to get its label.
 
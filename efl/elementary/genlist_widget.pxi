@@ -9,6 +9,12 @@ cdef class Genlist(Object):
 
     """
 
+    cdef:
+        object _model
+        GenlistItemClass _model_item_class
+        object _model_func
+        object _model_items
+
     def __init__(self, evasObject parent not None, *args, **kwargs):
         """
 
@@ -27,23 +33,131 @@ cdef class Genlist(Object):
     def __len__(self):
         return elm_genlist_items_count(self.obj)
 
-    def __contains__(self, GenlistItem x):
-        cdef:
-            Elm_Object_Item *current_item = elm_genlist_first_item_get(self.obj)
-            int count = elm_genlist_items_count(self.obj)
-            int i
+    def __contains__(self, x):
+        # an item knows its widget, no need to walk the list
+        if not isinstance(x, ObjectItem) or (<ObjectItem>x).item == NULL:
+            return False
+        return elm_object_item_widget_get((<ObjectItem>x).item) == self.obj
 
-        for i in range(count):
-            if x.item == current_item:
-                return 1
-            else:
-                current_item = elm_genlist_item_next_get(current_item)
+    def clear(self):
+        """Remove all items from a given genlist widget.
 
-        return 0
+        .. versionchanged:: 1.27
+            The model set with :py:meth:`model_set` is dropped too.
 
-    def clear(self):
-        """Remove all items from a given genlist widget."""
+        """
         elm_genlist_clear(self.obj)
+        self._model_drop()
+
+    cdef void _model_drop(self):
+        cdef GenlistModelItem item
+
+        if self._model_item_class is not None:
+            self._model_item_class.text_cache_clear()
+        if self._model_items is not None:
+            # rows not deleted yet, if the genlist is walking its items
+            for item in self._model_items.values():
+                item.item = NULL
+            self._model_items = None
+        self._model = None
+        self._model_item_class = None
+        self._model_func = None
+
+    def model_set(self, model, GenlistItemClass item_class=None, func=None):
+        """Show a model, a row for each of its values.
+
+        The model is anything with ``__len__`` and ``__getitem__`` taking the
+        row index, like a list or a NumPy array. No python item is created
+        for the rows, the row index is kept in the C item instead, and
+        ``model[index]`` is only read when the row is realized, that is
+        when it scrolls into view. So the memory used on the python side
+        only depends on the number of visible rows, even for millions of
+        rows.
+
+        The item class getters are called with ``model[index]`` as the
+        item data, like for the other rows. When a row is given back to
+        python, by the smart callbacks or by properties like
+        :py:attr:`selected_item`, it is a :py:class:`GenlistModelItem`.
+
+        All the items of the genlist are removed first. Call this again when
+        the length of the model changes, or :py:meth:`model_update` when
+        only its values change. Passing ``None`` as the model just clears
+        the genlist.
+
+        :param model: The values of the rows
+        :type model: sequence
+        :param item_class: A valid instance that defines the behavior of the
+            rows. See :py:class:`GenlistItemClass`. Its ``del_func`` is not
+            called for the rows of a model.
+        :param func: If not None, called when a row is selected, as
+            ``func(item, genlist, item_data)``
+        :type func: callable
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Py_ssize_t i, n
+            Evas_Smart_Cb cb = NULL
+
+        if model is not None:
+            if item_class is None:
+                raise TypeError("A model needs an item_class")
+            if func is not None:
+                if not callable(func):
+                    raise TypeError("func is not None or callable")
+                cb = _py_elm_genlist_model_item_func
+            n = len(model)
+
+        elm_genlist_clear(self.obj)
+        self._model_drop()
+        if model is None:
+            return
+
+        self._model = model
+        self._model_item_class = item_class
+        self._model_func = func
+        item_class.text_cache_clear()
+
+        for i in range(n):
+            if elm_genlist_item_append(self.obj, item_class.cls,
+                    _genlist_model_row_to_data(i), NULL,
+                    enums.ELM_GENLIST_ITEM_NONE, cb, NULL) == NULL:
+                raise RuntimeError("The item could not be added to the widget.")
+
+    property model:
+        """The model shown by the genlist, or ``None``.
+
+        .. seealso:: :py:meth:`model_set`
+
+        :type: sequence
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return self._model
+
+        def __set__(self, model):
+            # keep the item class and callback of the previous model
+            self.model_set(model, self._model_item_class, self._model_func)
+
+    def model_get(self):
+        return self._model
+
+    def model_update(self):
+        """Update the realized rows after the values of the model changed.
+
+        The cached texts of the model rows are dropped too, see
+        :py:attr:`GenlistItemClass.text_cache_size`. The length of the model
+        must not change, call :py:meth:`model_set` again in that case.
+
+        .. versionadded:: 1.27
+
+        """
+        if self._model_item_class is not None:
+            self._model_item_class.text_cache_clear()
+        elm_genlist_realized_items_update(self.obj)
 
     property multi_select:
         """This enables (``True``) or disables (``False``) multi-selection in
@@ -159,6 +273,75 @@ cdef class Genlist(Object):
         return GenlistItem(item_class, item_data, parent_item, flags, func, item_data)\
                           .append_to(self)
 
+    def items_append(self,
+                     GenlistItemClass item_class not None,
+                     items_data,
+                     ObjectItem parent_item=None,
+                     int flags=enums.ELM_GENLIST_ITEM_NONE,
+                     func=None):
+        """Append many new items (add as last rows) to this genlist.
+
+        :param item_class: a valid instance that defines the
+            behavior of the rows. See :py:class:`GenlistItemClass`.
+        :param items_data: an iterable with the data of each row, a row is
+            appended for each value, see :py:meth:`item_append`
+        :param parent_item: the parent of all the rows, if they are tree
+            children, otherwise it may be None.
+        :param flags: defines special behavior of the items, see
+            :py:meth:`item_append`
+        :param func: if not None, this must be a callable to be
+            called back when an item is selected, see :py:meth:`item_append`
+
+        :return: The new items
+        :rtype: list of :py:class:`GenlistItem`
+
+        This is the same as calling :py:meth:`item_append` for each value of
+        **items_data**, but all the rows are created in a single loop without
+        going back to python, which is a lot faster for big lists.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            GenlistItem item
+            Elm_Object_Item *parent = NULL
+            Elm_Object_Item *it
+            Evas_Smart_Cb cb = NULL
+            list ret = []
+
+        if parent_item is not None:
+            parent = _object_item_from_python(parent_item)
+
+        if func is not None:
+            if not callable(func):
+                raise TypeError("func is not None or callable")
+            cb = _py_elm_genlist_item_func
+
+        for item_data in items_data:
+            # skip GenlistItem.__init__, the values are known to be valid
+            item = GenlistItem.__new__(GenlistItem)
+            item.item_class = item_class
+            item.parent_item = parent
+            item.flags = flags
+            item.item_data = item_data
+            item.cb_func = func
+            item.func_data = item_data
+            item.args = ()
+            item.kwargs = {}
+
+            it = elm_genlist_item_append(self.obj,
+                item_class.cls, <void*>item,
+                parent,
+                <Elm_Genlist_Item_Type>flags,
+                cb, <void*>item)
+            if it == NULL:
+                raise RuntimeError("The item could not be added to the widget.")
+
+            item._set_obj(it)
+            ret.append(item)
+
+        return ret
+
     def item_prepend(   self,
                         GenlistItemClass item_class not None,
                         item_data,
@@ -272,10 +455,11 @@ cdef class Genlist(Object):
     def item_sorted_insert( self,
                             GenlistItemClass item_class not None,
                             item_data,
-                            comparison_func not None,
+                            comparison_func=None,
                             ObjectItem parent_item=None,
                             int flags=enums.ELM_GENLIST_ITEM_NONE,
-                            func=None
+                            func=None,
+                            sort_key=None
                             ):
         """This inserts a new item in the genlist based on a user defined
         comparison function.
@@ -314,11 +498,19 @@ cdef class Genlist(Object):
             that represents this item, and ``item_data`` is the
             value given as parameter to this function.
 
+        :param sort_key: if not None, the key of the item, compared in C
+            instead of calling ``comparison_func``, see
+            :py:meth:`GenlistItem.sorted_insert`
+        :type sort_key: int, float, bytes or unicode
+
         :rtype: :py:class:`GenlistItem`
 
+        .. versionchanged:: 1.27
+            Added the **sort_key** parameter
+
         """
         return GenlistItem(item_class, item_data, parent_item, flags, func, item_data)\
-                          .sorted_insert(self, comparison_func)
+                          .sorted_insert(self, comparison_func, sort_key)
 
     property selected_item:
         """This gets the selected item in the list (if multi-selection is
@@ -664,6 +856,58 @@ cdef class Genlist(Object):
         """
         return _object_item_to_python(elm_genlist_nth_item_get(self.obj, nth))
 
+    def index_of(self, ObjectItem item not None):
+        """Get the position of an item in the genlist.
+
+        The expanded tree items are counted too, like for
+        :py:meth:`nth_item_get`. The list is walked in C, the index kept by
+        Elementary is only updated when the genlist is laid out and is stale
+        right after an insertion.
+
+        :param item: An item of the genlist
+        :return: The position of the item, 0 being the first
+        :rtype: int
+        :raise ValueError: if the item is not in the genlist
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Elm_Object_Item *it
+            int i
+
+        if item not in self:
+            raise ValueError("%r is not in the genlist" % (item,))
+
+        it = elm_genlist_first_item_get(self.obj)
+        i = 0
+        while it != NULL and it != item.item:
+            it = elm_genlist_item_next_get(it)
+            i += 1
+        return i
+
+    def item_at(self, int index):
+        """Get the item at a given position.
+
+        Like :py:meth:`nth_item_get`, but negative indexes count from the
+        end of the list and an error is raised if there is no such item.
+
+        :param int index: The position of the item, 0 being the first
+        :rtype: :py:class:`GenlistItem`
+        :raise IndexError: if there is no item at this position
+
+        .. versionadded:: 1.27
+
+        """
+        cdef Elm_Object_Item *it
+
+        if index < 0:
+            index += elm_genlist_items_count(self.obj)
+        it = elm_genlist_nth_item_get(self.obj, index) if index >= 0 else NULL
+        if it == NULL:
+            raise IndexError("genlist index out of range")
+        return _object_item_to_python(it)
+
     def search_by_text_item_get(self, GenlistItem item_to_search_from,
                                 part_name, pattern, Elm_Glob_Match_Flags flags):
         """Search genlist item by given string.
@@ -742,17 +986,17 @@ cdef class Genlist(Object):
 
         """
         def __set__(self, object key):
-            self.internal_data['__filterkeyref'] = key # keep a reference for key
+            self._internal_data()['__filterkeyref'] = key # keep a reference for key
             elm_genlist_filter_set(self.obj, <void *>key if key is not None else NULL)
 
         def __get__(self):
-            return self.internal_data['__filterkeyref']
+            return self._internal_data()['__filterkeyref']
 
     def filter_set(self, key):
-        self.internal_data['__filterkeyref'] = key
+        self._internal_data()['__filterkeyref'] = key
         elm_genlist_filter_set(self.obj, <void*>key if key is not None else NULL)
     def filter_get(self):
-        return self.internal_data['__filterkeyref']
+        return self._internal_data()['__filterkeyref']
 
     def filtered_items_count(self):
         """Return how many items have passed the filter currently.
@@ -790,9 +1034,9 @@ cdef class Genlist(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self._internal_data()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["item_container_data_get_cb"] = data_get
+        self._internal_data()["item_container_data_get_cb"] = data_get
 
         if not elm_drag_item_container_add(self.obj,
             tm_to_anim,
@@ -841,10 +1085,10 @@ cdef class Genlist(Object):
         if itemgetcb is not None:
             if not callable(itemgetcb):
                 raise TypeError("itemgetcb must be callable.")
-            self.internal_data["xy_item_get_cb"] = itemgetcb
+            self._internal_data()["xy_item_get_cb"] = itemgetcb
 
-        self.internal_data["drag_item_container_pos"] = poscb
-        self.internal_data["drop_item_container_cb"] = dropcb
+        self._internal_data()["drag_item_container_pos"] = poscb
+        self._internal_data()["drop_item_container_cb"] = dropcb
 
         if not elm_drop_item_container_add(self.obj,
             format,
@@ -18,7 +18,15 @@
 
 include "gesture_layer_cdef.pxi"
 
-cdef class GestureTapsInfo(object):
+cdef class _GestureInfo(object):
+    # the info objects keep a copy of the C struct, so they stay valid
+    # after the callback and can be filled again for the next event
+
+    cdef void _set(self, void *event_info):
+        pass
+
+
+cdef class GestureTapsInfo(_GestureInfo):
     """
 
     Holds taps info for user
@@ -26,6 +34,22 @@ cdef class GestureTapsInfo(object):
     """
 
     cdef Elm_Gesture_Taps_Info *info
+    cdef Elm_Gesture_Taps_Info _info
+
+    cdef void _set(self, void *event_info):
+        self._info = (<Elm_Gesture_Taps_Info *>event_info)[0]
+        self.info = &self._info
+
+    property fields:
+        """All the values, as ``(x, y, n, timestamp)``
+
+        :type: tuple
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return (self.info.x, self.info.y, self.info.n, self.info.timestamp)
 
     property x:
         """Holds center point between fingers
@@ -63,7 +87,7 @@ cdef class GestureTapsInfo(object):
         def __get__(self):
             return self.info.timestamp
 
-cdef class GestureMomentumInfo(object):
+cdef class GestureMomentumInfo(_GestureInfo):
     """
 
     Holds momentum info for user
@@ -75,6 +99,25 @@ cdef class GestureMomentumInfo(object):
     """
 
     cdef Elm_Gesture_Momentum_Info *info
+    cdef Elm_Gesture_Momentum_Info _info
+    cdef object _owner  # the line info holding our struct, if any
+
+    cdef void _set(self, void *event_info):
+        self._info = (<Elm_Gesture_Momentum_Info *>event_info)[0]
+        self.info = &self._info
+
+    property fields:
+        """All the values, as ``(x1, y1, x2, y2, tx, ty, mx, my, n)``
+
+        :type: tuple
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return (self.info.x1, self.info.y1, self.info.x2, self.info.y2,
+                    self.info.tx, self.info.ty, self.info.mx, self.info.my,
+                    self.info.n)
 
     property x1:
         """Final-swipe direction starting point on X
@@ -157,7 +200,7 @@ cdef class GestureMomentumInfo(object):
         def __get__(self):
             return self.info.n
 
-cdef class GestureLineInfo(object):
+cdef class GestureLineInfo(_GestureInfo):
     """
 
     Holds line info for user
@@ -165,6 +208,22 @@ cdef class GestureLineInfo(object):
     """
 
     cdef Elm_Gesture_Line_Info *info
+    cdef Elm_Gesture_Line_Info _info
+
+    cdef void _set(self, void *event_info):
+        self._info = (<Elm_Gesture_Line_Info *>event_info)[0]
+        self.info = &self._info
+
+    property fields:
+        """All the values, as ``(momentum_fields, angle)``
+
+        :type: tuple
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return (self.momentum.fields, self.info.angle)
 
     property momentum:
         """Line momentum info
@@ -175,6 +234,7 @@ cdef class GestureLineInfo(object):
         def __get__(self):
             cdef GestureMomentumInfo ret = GestureMomentumInfo.__new__(GestureMomentumInfo)
             ret.info = &self.info.momentum
+            ret._owner = self
             return ret
 
     property angle:
@@ -186,7 +246,7 @@ cdef class GestureLineInfo(object):
         def __get__(self):
             return self.info.angle
 
-cdef class GestureZoomInfo(object):
+cdef class GestureZoomInfo(_GestureInfo):
     """
 
     Holds zoom info for user
@@ -194,6 +254,23 @@ cdef class GestureZoomInfo(object):
     """
 
     cdef Elm_Gesture_Zoom_Info *info
+    cdef Elm_Gesture_Zoom_Info _info
+
+    cdef void _set(self, void *event_info):
+        self._info = (<Elm_Gesture_Zoom_Info *>event_info)[0]
+        self.info = &self._info
+
+    property fields:
+        """All the values, as ``(x, y, radius, zoom, momentum)``
+
+        :type: tuple
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return (self.info.x, self.info.y, self.info.radius,
+                    self.info.zoom, self.info.momentum)
 
     property x:
         """Holds zoom center point reported to user
@@ -240,7 +317,7 @@ cdef class GestureZoomInfo(object):
         def __get__(self):
             return self.info.momentum
 
-cdef class GestureRotateInfo(object):
+cdef class GestureRotateInfo(_GestureInfo):
     """
 
     Holds rotation info for user
@@ -248,6 +325,23 @@ cdef class GestureRotateInfo(object):
     """
 
     cdef Elm_Gesture_Rotate_Info *info
+    cdef Elm_Gesture_Rotate_Info _info
+
+    cdef void _set(self, void *event_info):
+        self._info = (<Elm_Gesture_Rotate_Info *>event_info)[0]
+        self.info = &self._info
+
+    property fields:
+        """All the values, as ``(x, y, radius, base_angle, angle, momentum)``
+
+        :type: tuple
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return (self.info.x, self.info.y, self.info.radius,
+                    self.info.base_angle, self.info.angle, self.info.momentum)
 
     property x:
         """Holds zoom center point reported to user
@@ -303,55 +397,94 @@ cdef class GestureRotateInfo(object):
         def __get__(self):
             return self.info.momentum
 
-cdef Evas_Event_Flags _gesture_layer_taps_event_cb(void *data, void *event_info) with gil:
-    callback, args, kwargs = <object>data
-    cdef GestureTapsInfo ei = GestureTapsInfo.__new__(GestureTapsInfo)
-    ei.info = <Elm_Gesture_Taps_Info *>event_info
-    try:
-        ret = callback(ei, *args, **kwargs)
-        return <Evas_Event_Flags>ret if ret is not None else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
-    except Exception:
-        traceback.print_exc()
-
-cdef Evas_Event_Flags _gesture_layer_momentum_event_cb(void *data, void *event_info) with gil:
-    callback, args, kwargs = <object>data
-    cdef GestureMomentumInfo ei = GestureMomentumInfo.__new__(GestureMomentumInfo)
-    ei.info = <Elm_Gesture_Momentum_Info *>event_info
-    try:
-        ret = callback(ei, *args, **kwargs)
-        return <Evas_Event_Flags>ret if ret is not None else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
-    except Exception:
-        traceback.print_exc()
-
-cdef Evas_Event_Flags _gesture_layer_line_event_cb(void *data, void *event_info) with gil:
-    callback, args, kwargs = <object>data
-    cdef GestureLineInfo ei = GestureLineInfo.__new__(GestureLineInfo)
-    ei.info = <Elm_Gesture_Line_Info *>event_info
-    try:
-        ret = callback(ei, *args, **kwargs)
-        return <Evas_Event_Flags>ret if ret is not None else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
-    except Exception:
-        traceback.print_exc()
-
-cdef Evas_Event_Flags _gesture_layer_zoom_event_cb(void *data, void *event_info) with gil:
-    callback, args, kwargs = <object>data
-    cdef GestureZoomInfo ei = GestureZoomInfo.__new__(GestureZoomInfo)
-    ei.info = <Elm_Gesture_Zoom_Info *>event_info
-    try:
-        ret = callback(ei, *args, **kwargs)
-        return <Evas_Event_Flags>ret if ret is not None else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
-    except Exception:
-        traceback.print_exc()
-
-cdef Evas_Event_Flags _gesture_layer_rotate_event_cb(void *data, void *event_info) with gil:
-    callback, args, kwargs = <object>data
-    cdef GestureRotateInfo ei = GestureRotateInfo.__new__(GestureRotateInfo)
-    ei.info = <Elm_Gesture_Rotate_Info *>event_info
-    try:
-        ret = callback(ei, *args, **kwargs)
-        return <Evas_Event_Flags>ret if ret is not None else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
-    except Exception as e:
-        traceback.print_exc()
+cdef class _GestureCb(object):
+    cdef:
+        GestureLayer layer
+        Elm_Gesture_Type idx
+        Elm_Gesture_State state
+        object func
+        tuple args
+        dict kwargs
+        _GestureInfo info       # shared by all the states of the gesture
+        bint pending            # a coalesced MOVE waits for the next frame
+        Evas_Event_Flags flags  # what func returned the last time
+
+    cdef Evas_Event_Flags _event(self, void *event_info):
+        cdef _GestureCb move
+
+        if self.state == enums.ELM_GESTURE_STATE_MOVE and \
+                self.layer._move_coalesce and event_info != NULL:
+            self.info._set(event_info)
+            if not self.pending:
+                self.pending = 1
+                self.layer._move_flush_schedule()
+            return self.flags
+
+        # keep the order, the last MOVE goes before START, END or ABORT
+        move = self.layer._gesture_cbs.get(
+            (self.idx, enums.ELM_GESTURE_STATE_MOVE))
+        if move is not None and move.pending:
+            move.pending = 0
+            move._call(move.info)
+
+        if event_info == NULL:
+            return self._call(None)
+        self.info._set(event_info)
+        return self._call(self.info)
+
+    cdef Evas_Event_Flags _call(self, info):
+        try:
+            ret = self.func(info, *self.args, **self.kwargs)
+        except Exception:
+            traceback.print_exc()
+            return EVAS_EVENT_FLAG_NONE
+        self.flags = <Evas_Event_Flags>ret if ret is not None \
+            else <Evas_Event_Flags>EVAS_EVENT_FLAG_NONE
+        return self.flags
+
+
+cdef _GestureInfo _gesture_info_new(Elm_Gesture_Type idx):
+    if  idx == <int>enums.ELM_GESTURE_N_TAPS or \
+        idx == <int>enums.ELM_GESTURE_N_LONG_TAPS or \
+        idx == <int>enums.ELM_GESTURE_N_DOUBLE_TAPS or \
+        idx == <int>enums.ELM_GESTURE_N_TRIPLE_TAPS:
+        return GestureTapsInfo.__new__(GestureTapsInfo)
+    elif idx == <int>enums.ELM_GESTURE_MOMENTUM:
+        return GestureMomentumInfo.__new__(GestureMomentumInfo)
+    elif idx == <int>enums.ELM_GESTURE_N_LINES or \
+        idx == <int>enums.ELM_GESTURE_N_FLICKS:
+        return GestureLineInfo.__new__(GestureLineInfo)
+    elif idx == <int>enums.ELM_GESTURE_ZOOM:
+        return GestureZoomInfo.__new__(GestureZoomInfo)
+    elif idx == <int>enums.ELM_GESTURE_ROTATE:
+        return GestureRotateInfo.__new__(GestureRotateInfo)
+    else:
+        raise TypeError("Unknown gesture type")
+
+
+cdef Evas_Event_Flags _gesture_layer_event_cb(void *data, void *event_info) with gil:
+    return (<_GestureCb>data)._event(event_info)
+
+
+cdef Eina_Bool _gesture_layer_move_flush_cb(void *data) with gil:
+    cdef:
+        GestureLayer layer = <GestureLayer>data
+        _GestureCb cb
+
+    layer._move_animator = NULL
+    Py_DECREF(layer)
+
+    for cb in tuple(layer._gesture_cbs.values()):
+        if cb.pending:
+            cb.pending = 0
+            cb._call(cb.info)
+    return 0 # ECORE_CALLBACK_CANCEL
+
+
+cdef void _gesture_layer_del_cb(void *data, Evas *e, Evas_Object *obj,
+                                void *event_info) with gil:
+    (<GestureLayer>data)._move_flush_cancel()
+
 
 cdef class GestureLayer(Object):
     """
@@ -363,6 +496,35 @@ cdef class GestureLayer(Object):
 
     """
 
+    cdef:
+        dict _gesture_cbs       # (idx, state): _GestureCb
+        dict _gesture_infos     # idx: the info object of the gesture
+        bint _move_coalesce
+        Ecore_Animator *_move_animator
+
+    def __cinit__(self):
+        self._gesture_cbs = {}
+        self._gesture_infos = {}
+
+    cdef void _move_flush_schedule(self):
+        if self._move_animator != NULL:
+            return
+        self._move_animator = ecore_animator_add(
+            _gesture_layer_move_flush_cb, <void *>self)
+        if self._move_animator != NULL:
+            Py_INCREF(self)
+
+    cdef void _move_flush_cancel(self):
+        cdef _GestureCb cb
+
+        if self._move_animator == NULL:
+            return
+        ecore_animator_del(self._move_animator)
+        self._move_animator = NULL
+        for cb in self._gesture_cbs.values():
+            cb.pending = 0
+        Py_DECREF(self)
+
     def __init__(self, evasObject parent, *args, **kwargs):
         """
 
@@ -373,6 +535,9 @@ cdef class GestureLayer(Object):
 
         """
         self._set_obj(elm_gesture_layer_add(parent.obj))
+        # the python object lives until the del event, no reference needed
+        evas_object_event_callback_add(self.obj, EVAS_CALLBACK_DEL,
+                                       _gesture_layer_del_cb, <void *>self)
         self._set_properties_from_keyword_args(kwargs)
 
     def cb_set(self, Elm_Gesture_Type idx, Elm_Gesture_State cb_type, callback, *args, **kwargs):
@@ -387,6 +552,10 @@ cdef class GestureLayer(Object):
 
             func(event_info, *args, **kwargs)
 
+        The ``event_info`` object is shared by all the callbacks of the
+        gesture and filled again for each event, copy what you need to keep,
+        its ``fields`` tuple for example.
+
         .. note:: You should return either EVAS_EVENT_FLAG_NONE or
             EVAS_EVENT_FLAG_ON_HOLD from this callback.
 
@@ -397,38 +566,65 @@ cdef class GestureLayer(Object):
         :param callback: Callback function.
         :type callback: function
 
+        .. versionchanged:: 1.27
+            The event_info objects are reused and stay valid after the call
+
         """
-        cdef Elm_Gesture_Event_Cb cb = NULL
-
-        if callback:
-            if not callable(callback):
-                raise TypeError("callback is not callable")
-
-        if  idx == <int>enums.ELM_GESTURE_N_TAPS or \
-            idx == <int>enums.ELM_GESTURE_N_LONG_TAPS or \
-            idx == <int>enums.ELM_GESTURE_N_DOUBLE_TAPS or \
-            idx == <int>enums.ELM_GESTURE_N_TRIPLE_TAPS:
-            cb = _gesture_layer_taps_event_cb
-        elif idx == <int>enums.ELM_GESTURE_MOMENTUM:
-            cb = _gesture_layer_momentum_event_cb
-        elif idx == <int>enums.ELM_GESTURE_N_LINES or \
-            idx == <int>enums.ELM_GESTURE_N_FLICKS:
-            cb = _gesture_layer_line_event_cb
-        elif idx == <int>enums.ELM_GESTURE_ZOOM:
-            cb = _gesture_layer_zoom_event_cb
-        elif idx == <int>enums.ELM_GESTURE_ROTATE:
-            cb = _gesture_layer_rotate_event_cb
-        else:
-            raise TypeError("Unknown gesture type")
-
-        data = (callback, args, kwargs)
-        Py_INCREF(data)
+        cdef _GestureCb cb
+
+        if callback is not None and not callable(callback):
+            raise TypeError("callback is not callable")
+
+        info = self._gesture_infos.get(idx)
+        if info is None:
+            info = _gesture_info_new(idx)
+
+        if callback is None:
+            self._gesture_cbs.pop((idx, cb_type), None)
+            elm_gesture_layer_cb_set(self.obj, idx, cb_type, NULL, NULL)
+            return
+
+        self._gesture_infos[idx] = info
+        cb = _GestureCb.__new__(_GestureCb)
+        cb.layer = self
+        cb.idx = idx
+        cb.state = cb_type
+        cb.func = callback
+        cb.args = args
+        cb.kwargs = kwargs
+        cb.info = info
+        cb.flags = EVAS_EVENT_FLAG_NONE
+        # keeps the data alive while it's set
+        self._gesture_cbs[(idx, cb_type)] = cb
 
         elm_gesture_layer_cb_set(   self.obj,
                                     idx,
                                     cb_type,
-                                    cb,
-                                    <void *>data)
+                                    _gesture_layer_event_cb,
+                                    <void *>cb)
+
+    property move_coalesce:
+        """Deliver the MOVE state callbacks at most once per frame.
+
+        Zoom, rotate and momentum gestures report MOVE states at the input
+        rate, with this set only the last one of each frame is given to
+        the callbacks, when the frame is rendered. START, END and ABORT are
+        always delivered immediately, after the pending MOVE of the same
+        gesture.
+
+        Since the delayed callbacks can't tell the gesture layer the event
+        flags, the MOVE events get the flags returned by the last call.
+
+        :type: bool
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            return bool(self._move_coalesce)
+
+        def __set__(self, bint coalesce):
+            self._move_coalesce = coalesce
 
     property hold_events:
         """Gesture-layer repeat events. Set to True if you like to get the
@@ -1,4 +1,6 @@
-from efl.evas.enums cimport EVAS_EVENT_FLAG_NONE
+from efl.evas cimport Evas, evas_object_event_callback_add
+from efl.evas.enums cimport EVAS_EVENT_FLAG_NONE, EVAS_CALLBACK_DEL
+from efl.ecore cimport Ecore_Animator, ecore_animator_add, ecore_animator_del
 
 from efl.elementary.enums cimport Elm_Gesture_State, Elm_Gesture_Type
 
@@ -18,6 +18,8 @@
 
 include "list_cdef.pxi"
 
+from efl.eina cimport eina_list_count, eina_list_nth
+
 cdef class ListItem(ObjectItem):
     """
 
@@ -427,6 +429,12 @@ cdef class List(Object):
         self._set_obj(elm_list_add(parent.obj))
         self._set_properties_from_keyword_args(kwargs)
 
+    def __contains__(self, x):
+        # an item knows its widget, no need to walk the list
+        if not isinstance(x, ObjectItem) or (<ObjectItem>x).item == NULL:
+            return False
+        return elm_object_item_widget_get((<ObjectItem>x).item) == self.obj
+
     def go(self):
         """Starts the list.
 
@@ -709,6 +717,57 @@ cdef class List(Object):
     def items_get(self):
         return _object_item_list_to_python(elm_list_items_get(self.obj))
 
+    def index_of(self, ObjectItem item not None):
+        """Get the position of an item in the list.
+
+        Elementary has no index for the list items, the items are counted
+        in C, without creating the python items.
+
+        :param item: An item of the list
+        :return: The position of the item, 0 being the first
+        :rtype: int
+        :raise ValueError: if the item is not in the list
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            const Eina_List *lst
+            int i = 0
+
+        if item not in self:
+            raise ValueError("%r is not in the list" % (item,))
+
+        lst = elm_list_items_get(self.obj)
+        while lst != NULL and lst.data != <void *>item.item:
+            lst = lst.next
+            i += 1
+        return i
+
+    def item_at(self, int index):
+        """Get the item at a given position.
+
+        Negative indexes count from the end of the list.
+
+        :param int index: The position of the item, 0 being the first
+        :rtype: :py:class:`ListItem`
+        :raise IndexError: if there is no item at this position
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Eina_List *lst = elm_list_items_get(self.obj)
+            void *it = NULL
+
+        if index < 0:
+            index += eina_list_count(lst)
+        if index >= 0:
+            it = eina_list_nth(lst, index)
+        if it == NULL:
+            raise IndexError("list index out of range")
+        return _object_item_to_python(<Elm_Object_Item *>it)
+
     property selected_item:
         """Get the selected item.
 
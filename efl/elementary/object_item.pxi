@@ -55,6 +55,9 @@ cdef _object_item_to_python(Elm_Object_Item *it):
         EINA_LOG_DOM_WARN(PY_EFL_ELM_LOG_DOMAIN, "Creating an incomplete ObjectItem.")
         item = ObjectItem.__new__(ObjectItem)
         item._set_obj(it)
+    elif _genlist_model_row_is(data):
+        # a row of a Genlist model, see Genlist.model_set()
+        item = _genlist_model_item_new(it)
     else:
         item = <object>data
 
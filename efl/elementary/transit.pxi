@@ -89,6 +89,289 @@ cdef void elm_transit_del_cb(void *data, Elm_Transit *transit) with gil:
     trans.obj = NULL
     Py_DECREF(trans)
 
+# The keyframe tracks, see TransitKeyframeEffect
+cdef enum:
+    _KEYFRAME_COLOR
+    _KEYFRAME_TRANSLATION
+    _KEYFRAME_ZOOM
+    _KEYFRAME_ROTATION
+    _KEYFRAME_MAP_POINTS
+    _KEYFRAME_TRACKS
+
+ctypedef struct _Transit_Keyframe_Track:
+    int count
+    int dim
+    int last            # segment of the previous lookup, where to start
+    double *keys
+    double *values
+
+ctypedef struct _Transit_Keyframes:
+    int refs            # the python object and each transit using it
+    Evas_Map *map
+    _Transit_Keyframe_Track tracks[_KEYFRAME_TRACKS]
+
+
+cdef void _transit_keyframes_unref(_Transit_Keyframes *kf) nogil:
+    cdef int i
+    kf.refs -= 1
+    if kf.refs > 0:
+        return
+    for i in range(_KEYFRAME_TRACKS):
+        free(kf.tracks[i].keys)
+        free(kf.tracks[i].values)
+    if kf.map != NULL:
+        evas_map_free(kf.map)
+    free(kf)
+
+
+cdef bint _transit_keyframe_value(_Transit_Keyframe_Track *track,
+                                  double progress, double *out) nogil:
+    cdef:
+        int i, j, n = track.count, d = track.dim
+        double *keys = track.keys
+        double *values = track.values
+        double t
+
+    if n == 0:
+        return 0
+    if progress <= keys[0]:
+        for j in range(d):
+            out[j] = values[j]
+        return 1
+    if progress >= keys[n - 1]:
+        for j in range(d):
+            out[j] = values[(n - 1) * d + j]
+        return 1
+
+    # progress goes forward (or backward when auto reversing), so the
+    # segment is searched from the previous one
+    i = track.last
+    if i > n - 2:
+        i = n - 2
+    while i > 0 and keys[i] > progress:
+        i -= 1
+    while keys[i + 1] <= progress:
+        i += 1
+    track.last = i
+
+    t = (progress - keys[i]) / (keys[i + 1] - keys[i])
+    for j in range(d):
+        out[j] = values[i * d + j] + \
+            (values[(i + 1) * d + j] - values[i * d + j]) * t
+    return 1
+
+
+cdef inline Evas_Coord _transit_keyframe_coord(double v) nogil:
+    return <Evas_Coord>floor(v + 0.5)
+
+
+cdef void _transit_keyframe_op(Elm_Transit_Effect *effect,
+                               Elm_Transit *transit, double progress) nogil:
+    cdef:
+        _Transit_Keyframes *kf = <_Transit_Keyframes *>effect
+        const Eina_List *l
+        Evas_Object *o
+        double color[4]
+        double translation[2]
+        double zoom[1]
+        double rotation[1]
+        double points[12]
+        bint has_color, has_map, has_points
+        Evas_Coord x, y, w, h, px, py, pz, cx, cy
+        int i
+
+    has_color = _transit_keyframe_value(&kf.tracks[_KEYFRAME_COLOR],
+                                        progress, color)
+    if not _transit_keyframe_value(&kf.tracks[_KEYFRAME_TRANSLATION],
+                                   progress, translation):
+        translation[0] = translation[1] = 0.0
+    if not _transit_keyframe_value(&kf.tracks[_KEYFRAME_ZOOM],
+                                   progress, zoom):
+        zoom[0] = 1.0
+    if not _transit_keyframe_value(&kf.tracks[_KEYFRAME_ROTATION],
+                                   progress, rotation):
+        rotation[0] = 0.0
+    has_points = _transit_keyframe_value(&kf.tracks[_KEYFRAME_MAP_POINTS],
+                                         progress, points)
+    has_map = kf.tracks[_KEYFRAME_TRANSLATION].count or \
+        kf.tracks[_KEYFRAME_ZOOM].count or \
+        kf.tracks[_KEYFRAME_ROTATION].count or has_points
+
+    if has_map and kf.map == NULL:
+        kf.map = evas_map_new(4)
+        if kf.map == NULL:
+            has_map = 0
+
+    l = elm_transit_objects_get(transit)
+    while l != NULL:
+        o = <Evas_Object *>l.data
+        l = l.next
+
+        if has_color:
+            evas_object_color_set(o,
+                _transit_keyframe_coord(color[0]),
+                _transit_keyframe_coord(color[1]),
+                _transit_keyframe_coord(color[2]),
+                _transit_keyframe_coord(color[3]))
+
+        if not has_map:
+            continue
+
+        evas_object_geometry_get(o, &x, &y, &w, &h)
+        evas_map_util_points_populate_from_geometry(kf.map, x, y, w, h, 0)
+        for i in range(4):
+            evas_map_point_coord_get(kf.map, i, &px, &py, &pz)
+            if has_points:
+                px += _transit_keyframe_coord(points[i * 3])
+                py += _transit_keyframe_coord(points[i * 3 + 1])
+                pz += _transit_keyframe_coord(points[i * 3 + 2])
+            evas_map_point_coord_set(kf.map, i,
+                px + _transit_keyframe_coord(translation[0]),
+                py + _transit_keyframe_coord(translation[1]), pz)
+
+        cx = x + w / 2 + _transit_keyframe_coord(translation[0])
+        cy = y + h / 2 + _transit_keyframe_coord(translation[1])
+        if zoom[0] != 1.0:
+            evas_map_util_zoom(kf.map, zoom[0], zoom[0], cx, cy)
+        if rotation[0] != 0.0:
+            evas_map_util_rotate(kf.map, rotation[0], cx, cy)
+        evas_object_map_set(o, kf.map)
+        evas_object_map_enable_set(o, 1)
+
+
+cdef void _transit_keyframe_end(Elm_Transit_Effect *effect,
+                                Elm_Transit *transit) nogil:
+    _transit_keyframes_unref(<_Transit_Keyframes *>effect)
+
+
+cdef class TransitKeyframeEffect(object):
+    """TransitKeyframeEffect(color=None, translation=None, zoom=None, rotation=None, map_points=None)
+
+    An effect interpolating keyframes, to be added with
+    :py:meth:`Transit.effect_add`.
+
+    Each parameter is a list of ``(progress, value)`` keyframes, progress
+    going from 0.0 to 1.0 (after the tween mode is applied). Between two
+    keyframes the value is linearly interpolated, before the first and after
+    the last one their values are kept.
+
+    Unlike a :py:class:`TransitCustomEffect`, everything is computed in C,
+    no Python code runs at each frame, so a lot of transits can run at the
+    same time. The same effect can be added to several transits.
+
+    Example::
+
+        effect = TransitKeyframeEffect(
+            color=[(0.0, (255, 255, 255, 255)), (1.0, (0, 0, 0, 0))],
+            zoom=[(0.0, 1.0), (0.5, 2.0), (1.0, 1.0)],
+            rotation=[(0.0, 0), (1.0, 360)])
+
+        t = Transit(duration=1.0)
+        t.object_add(obj)
+        t.effect_add(effect)
+        t.go()
+
+    :param color: Keyframes of ``(r, g, b, a)`` colors, premultiplied
+    :param translation: Keyframes of ``(dx, dy)`` offsets
+    :param zoom: Keyframes of zoom rates, 1.0 is the object size
+    :param rotation: Keyframes of rotation angles, in degrees
+    :param map_points: Keyframes of 4 ``(dx, dy)`` or ``(dx, dy, dz)``
+        offsets, one for each corner, clockwise from the top left one
+
+    .. note:: Translation, zoom, rotation and map points are applied through
+        an :py:class:`~efl.evas.Map` of the objects, their geometry is
+        not changed. Zoom and rotation are centered on the translated
+        object.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef _Transit_Keyframes *kf
+
+    def __cinit__(self):
+        self.kf = <_Transit_Keyframes *>calloc(1, sizeof(_Transit_Keyframes))
+        if self.kf == NULL:
+            raise MemoryError()
+        self.kf.refs = 1
+
+    def __init__(self, color=None, translation=None, zoom=None,
+                 rotation=None, map_points=None):
+        if color is not None:
+            self._track_set(_KEYFRAME_COLOR, color, 4)
+        if translation is not None:
+            self._track_set(_KEYFRAME_TRANSLATION, translation, 2)
+        if zoom is not None:
+            self._track_set(_KEYFRAME_ZOOM, zoom, 1)
+        if rotation is not None:
+            self._track_set(_KEYFRAME_ROTATION, rotation, 1)
+        if map_points is not None:
+            self._track_set(_KEYFRAME_MAP_POINTS, map_points, 12)
+
+    def __dealloc__(self):
+        if self.kf != NULL:
+            _transit_keyframes_unref(self.kf)
+            self.kf = NULL
+
+    def __repr__(self):
+        return "<%s(color=%d, translation=%d, zoom=%d, rotation=%d, " \
+            "map_points=%d)>" % (type(self).__name__,
+                self.kf.tracks[_KEYFRAME_COLOR].count,
+                self.kf.tracks[_KEYFRAME_TRANSLATION].count,
+                self.kf.tracks[_KEYFRAME_ZOOM].count,
+                self.kf.tracks[_KEYFRAME_ROTATION].count,
+                self.kf.tracks[_KEYFRAME_MAP_POINTS].count)
+
+    cdef int _track_set(self, int idx, keyframes, int dim) except -1:
+        cdef:
+            _Transit_Keyframe_Track *track = &self.kf.tracks[idx]
+            list frames = sorted(keyframes, key=lambda frame: frame[0])
+            list values
+            int i, j, n = len(frames)
+
+        if n == 0:
+            raise ValueError("at least a keyframe is needed")
+
+        rows = []
+        for progress, value in frames:
+            if dim == 1:
+                values = [float(value)]
+            elif dim == 12:
+                if len(value) != 4:
+                    raise ValueError("map points keyframes need 4 points")
+                values = []
+                for point in value:
+                    if len(point) == 2:
+                        values.extend((float(point[0]), float(point[1]), 0.0))
+                    elif len(point) == 3:
+                        values.extend(float(v) for v in point)
+                    else:
+                        raise ValueError("map points are (dx, dy) or "
+                                         "(dx, dy, dz)")
+            else:
+                values = [float(v) for v in value]
+                if len(values) != dim:
+                    raise ValueError("keyframe values must have %d items" %
+                                     dim)
+            rows.append((float(progress), values))
+
+        free(track.keys)
+        free(track.values)
+        track.count = 0
+        track.keys = <double *>malloc(n * sizeof(double))
+        track.values = <double *>malloc(n * dim * sizeof(double))
+        if track.keys == NULL or track.values == NULL:
+            raise MemoryError()
+
+        for i, (progress, values) in enumerate(rows):
+            track.keys[i] = progress
+            for j, v in enumerate(values):
+                track.values[i * dim + j] = v
+        track.dim = dim
+        track.last = 0
+        track.count = n
+        return 0
+
+
 cdef class Transit(object):
     """
 
@@ -106,6 +389,7 @@ cdef class Transit(object):
         object del_cb
         tuple del_cb_args
         dict del_cb_kwargs
+        set keyframe_effects
 
     def __init__(self, *args, **kwargs):
         """
@@ -115,6 +399,7 @@ cdef class Transit(object):
 
         """
         self.obj = elm_transit_add()
+        self.keyframe_effects = set()
         self._set_properties_from_keyword_args(kwargs)
         Py_INCREF(self)
 
@@ -141,7 +426,7 @@ cdef class Transit(object):
         """
         elm_transit_del(self.obj)
 
-    def effect_add(self, TransitCustomEffect effect):
+    def effect_add(self, effect):
         """Add a new effect to the transit.
 
         Example::
@@ -153,6 +438,9 @@ cdef class Transit(object):
             e = MyEffect()
             t.effect_add(e)
 
+        A :py:class:`TransitKeyframeEffect` can be added as well, it runs
+        without calling Python code.
+
         .. warning:: The transit will free the context data at the and of the
             transition with the data_free_cb function. Do not share the
             context data in between different transit objects.
@@ -164,15 +452,35 @@ cdef class Transit(object):
             :meth:`delete` function.
 
         :param effect: The context data of the effect.
+        :type effect: :py:class:`TransitCustomEffect` or
+            :py:class:`TransitKeyframeEffect`
+
+        .. versionchanged:: 1.27
+            Accept :py:class:`TransitKeyframeEffect`
 
         """
-        effect.transit = self
+        cdef TransitKeyframeEffect keyframes
+
+        if isinstance(effect, TransitKeyframeEffect):
+            keyframes = effect
+            # elm ignores effects added twice, they must be counted once
+            if keyframes in self.keyframe_effects:
+                return
+            self.keyframe_effects.add(keyframes)
+            keyframes.kf.refs += 1
+            elm_transit_effect_add(self.obj,
+                _transit_keyframe_op,
+                <void *>keyframes.kf,
+                _transit_keyframe_end)
+            return
+
+        (<TransitCustomEffect?>effect).transit = self
         elm_transit_effect_add(self.obj,
             elm_transit_effect_transition_cb,
             <void *>effect,
             elm_transit_effect_end_cb)
 
-    def effect_del(self, TransitCustomEffect effect):
+    def effect_del(self, effect):
         """Delete an added effect.
 
         This function will remove the effect from the ``transit``, calling the
@@ -185,11 +493,25 @@ cdef class Transit(object):
             elm_transit_del(transit), i.e., it will kill the ``transit``.
 
         :param effect: The context data of the effect.
+        :type effect: :py:class:`TransitCustomEffect` or
+            :py:class:`TransitKeyframeEffect`
 
         """
+        cdef TransitKeyframeEffect keyframes
+
+        if isinstance(effect, TransitKeyframeEffect):
+            keyframes = effect
+            if keyframes not in self.keyframe_effects:
+                return
+            self.keyframe_effects.discard(keyframes)
+            elm_transit_effect_del(self.obj,
+                _transit_keyframe_op,
+                <void *>keyframes.kf)
+            return
+
         elm_transit_effect_del(self.obj,
             elm_transit_effect_transition_cb,
-            <void *>effect)
+            <void *><TransitCustomEffect?>effect)
 
     def object_add(self, evasObject obj):
         """Add new object to apply the effects.
@@ -1,4 +1,4 @@
-from . import Transit, TransitCustomEffect
+from . import Transit, TransitCustomEffect, TransitKeyframeEffect
 
 from . import ELM_TRANSIT_EFFECT_FLIP_AXIS_X
 from . import ELM_TRANSIT_EFFECT_FLIP_AXIS_Y
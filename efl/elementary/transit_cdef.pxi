@@ -1,6 +1,13 @@
 from efl.elementary.enums cimport Elm_Transit_Effect_Flip_Axis, \
     Elm_Transit_Effect_Wipe_Dir, Elm_Transit_Effect_Wipe_Type, \
     Elm_Transit_Tween_Mode
+from efl.evas cimport Evas_Map, evas_object_color_set, \
+    evas_object_geometry_get, evas_map_new, evas_map_free, \
+    evas_object_map_set, evas_object_map_enable_set, \
+    evas_map_util_points_populate_from_geometry, evas_map_util_zoom, \
+    evas_map_util_rotate, evas_map_point_coord_get, evas_map_point_coord_set
+from libc.math cimport floor
+from libc.stdlib cimport calloc
 
 cdef extern from "Elementary.h":
     ctypedef struct Elm_Transit
@@ -16,7 +23,7 @@ cdef extern from "Elementary.h":
     void                     elm_transit_effect_del(Elm_Transit *transit, Elm_Transit_Effect_Transition_Cb transition_cb, Elm_Transit_Effect *effect)
     void                     elm_transit_object_add(Elm_Transit *transit, Evas_Object *obj)
     void                     elm_transit_object_remove(Elm_Transit *transit, Evas_Object *obj)
-    const Eina_List         *elm_transit_objects_get(Elm_Transit *transit)
+    const Eina_List         *elm_transit_objects_get(Elm_Transit *transit) nogil
     void                     elm_transit_objects_final_state_keep_set(Elm_Transit *transit, Eina_Bool state_keep)
     Eina_Bool                elm_transit_objects_final_state_keep_get(Elm_Transit *transit)
     void                     elm_transit_event_enabled_set(Elm_Transit *transit, Eina_Bool enabled)
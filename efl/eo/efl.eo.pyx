@@ -34,11 +34,13 @@ from cpython cimport PyObject, Py_INCREF, Py_DECREF, PyUnicode_AsUTF8String
 from libc.stdint cimport uintptr_t
 from efl.eina cimport Eina_Bool, \
     Eina_Hash, eina_hash_string_superfast_new, eina_hash_add, eina_hash_del, \
-    eina_hash_find, EINA_LOG_DOM_DBG, EINA_LOG_DOM_INFO, \
+    eina_hash_find, eina_hash_pointer_new, eina_hash_free_buckets, \
+    EINA_LOG_DOM_DBG, EINA_LOG_DOM_INFO, \
     Eina_Iterator, eina_iterator_next, eina_iterator_free
-from efl.c_eo cimport Eo as cEo, efl_object_init, efl_object_shutdown, efl_del, \
+from efl.c_eo cimport Eo as cEo, Efl_Class, efl_object_init, \
+    efl_object_shutdown, efl_del, \
     efl_class_name_get, efl_class_get, efl_object_class_get,\
-    efl_key_data_set, efl_key_data_get, \
+    efl_key_data_set, efl_key_data_get, efl_wref_add, efl_wref_del, \
     efl_event_callback_add, efl_event_callback_del, EFL_EVENT_DEL, \
     efl_parent_get, efl_parent_set, Efl_Event_Description, \
     efl_event_freeze, efl_event_thaw, efl_event_freeze_count_get, \
@@ -90,6 +92,10 @@ the function object_from_instance.
 """
 cdef Eina_Hash *object_mapping = eina_hash_string_superfast_new(NULL)
 
+# Cache of the lookups in object_mapping, keyed on the Efl_Class pointer, so
+# that the class name must be hashed only once per class
+cdef Eina_Hash *object_mapping_by_class = eina_hash_pointer_new(NULL)
+
 
 cdef void _object_mapping_register(char *name, object cls) except *:
 
@@ -106,6 +112,7 @@ cdef void _object_mapping_register(char *name, object cls) except *:
 
 cdef void _object_mapping_unregister(char *name):
     eina_hash_del(object_mapping, name, NULL)
+    eina_hash_free_buckets(object_mapping_by_class)
 
 
 cdef api object object_from_instance(cEo *obj):
@@ -113,31 +120,38 @@ cdef api object object_from_instance(cEo *obj):
     cdef:
         void *data = NULL
         Eo o
-        const char *cls_name = efl_class_name_get(efl_class_get(obj))
+        const Efl_Class *klass
+        const char *cls_name
         type cls
         void *cls_ret
 
     if obj == NULL:
         return None
 
+    # fast path, the object is already wrapped
     data = efl_key_data_get(obj, "python-eo")
     if data != NULL:
-        EINA_LOG_DOM_DBG(PY_EFL_EO_LOG_DOMAIN,
-            "Returning a Python object instance for Eo of type %s.", cls_name)
         return <Eo>data
 
-    if cls_name == NULL:
-        raise ValueError(
-            "Eo object at %#x does not have a type!" % <uintptr_t>obj)
-
-    cls_ret = eina_hash_find(object_mapping, cls_name)
+    klass = efl_class_get(obj)
+    cls_name = efl_class_name_get(klass)
+    cls_ret = eina_hash_find(object_mapping_by_class, &klass)
 
     if cls_ret == NULL:
-        # TODO: Add here a last ditch effort to import the class from a module
-        raise ValueError(
-            "Eo object at %#x of type %s does not have a mapping!" % (
-                <uintptr_t>obj, cls_name)
-            )
+        if cls_name == NULL:
+            raise ValueError(
+                "Eo object at %#x does not have a type!" % <uintptr_t>obj)
+
+        cls_ret = eina_hash_find(object_mapping, cls_name)
+
+        if cls_ret == NULL:
+            # TODO: Add here a last ditch effort to import the class from a module
+            raise ValueError(
+                "Eo object at %#x of type %s does not have a mapping!" % (
+                    <uintptr_t>obj, cls_name)
+                )
+
+        eina_hash_add(object_mapping_by_class, &klass, cls_ret)
 
     cls = <type>cls_ret
 
@@ -158,25 +172,64 @@ cdef api cEo *instance_from_object(object obj):
     return o.obj
 
 
+# Decorated callbacks of the extension types (that do not accept new
+# attributes), python classes store the table in their own __dict__
+cdef dict _decorated_callbacks_tables = dict()
+
+
+cdef tuple _decorated_callbacks_table_get(type cls):
+    """
+
+    Return the decorated callbacks of a class, as a tuple of
+    ("function_name", *args) items. The table is built only once per class,
+    looking for __decorated_callbacks__ in the attributes of the class and
+    of all its bases (the attributes overridden in a subclass win).
+
+    """
+    cdef:
+        tuple table
+        dict attrs
+        object attr_name, attrib
+
+    # only look in the class own __dict__, subclasses must build their table
+    table = cls.__dict__.get("__efl_decorated_callbacks__")
+    if table is None:
+        table = _decorated_callbacks_tables.get(cls)
+    if table is not None:
+        return table
+
+    attrs = dict()
+    for klass in reversed(cls.__mro__):
+        for attr_name, attrib in klass.__dict__.items():
+            attrs[attr_name] = getattr(attrib, "__decorated_callbacks__", None)
+
+    table = tuple([cb for cbs in attrs.values() if cbs for cb in cbs])
+
+    try:
+        type.__setattr__(cls, "__efl_decorated_callbacks__", table)
+    except TypeError:
+        _decorated_callbacks_tables[cls] = table
+
+    return table
+
+
 cdef void _register_decorated_callbacks(Eo obj):
     """
 
-    Search every attrib of the pyobj for a __decorated_callbacks__ object,
-    a list actually. If found then exec the functions listed there, with their
-    arguments. Must be called just after the _set_obj call.
+    Register the callbacks decorated in the class of the object (or in any
+    of its bases), see _decorated_callbacks_table_get().
+    Must be called just after the _set_obj call.
     List items signature: ("function_name", *args)
 
-    """
-    cdef object attr_name, attrib, func_name, func
-    cdef type cls = type(obj)
+    .. note:: The table is computed the first time an object of a class is
+        created, decorated methods added to the class later on are ignored.
 
-    # FIXME: This whole thing is really slow. Can we do it better?
+    """
+    cdef object func_name, func
 
-    for attr_name, attrib in cls.__dict__.items():
-        if "__decorated_callbacks__" in dir(attrib):
-            for (func_name, *args) in getattr(attrib, "__decorated_callbacks__"):
-                func = getattr(obj, func_name)
-                func(*args)
+    for (func_name, *args) in _decorated_callbacks_table_get(type(obj)):
+        func = getattr(obj, func_name)
+        func(*args)
 
 
 ######################################################################
@@ -195,6 +248,9 @@ cdef void _efl_event_del_cb(void *data, const Efl_Event *event) with gil:
     # efl_event_callback_stop(self.obj)
     efl_event_callback_del(self.obj, EFL_EVENT_DEL, _efl_event_del_cb, <const void *>self)
     efl_key_data_set(self.obj, "python-eo", NULL)
+    if self._legacy_parent_obj != NULL:
+        efl_wref_del(self._legacy_parent_obj, &self._legacy_parent_obj)
+        self._legacy_parent_obj = NULL
     self.obj = NULL
     Py_DECREF(self)
 
@@ -227,9 +283,8 @@ cdef class Eo(object):
 
     # c globals declared in eo.pxd (to make the class available to others)
 
-    def __cinit__(self):
-        self.data = dict()
-        self.internal_data = dict()
+    # data and internal_data are allocated only when needed, most of the
+    # objects (fe: the ones wrapped in callbacks) never use them
 
     def __init__(self, *args, **kwargs):
         if type(self) is Eo:
@@ -250,6 +305,10 @@ cdef class Eo(object):
         return 1 if self.obj != NULL else 0
 
     cdef int _set_obj(self, cEo *obj) except 0:
+        cdef:
+            cEo *parent
+            void *data
+
         assert self.obj == NULL, "Object must be clean"
         assert obj != NULL, "Cannot set a NULL object"
 
@@ -260,14 +319,39 @@ cdef class Eo(object):
 
         # from efl 1.18 eo.parent changed behaviour, objects are now reparented
         # when, fe, swallowed. This is the hack to keep the old behavior.
-        try:
-            parent = object_from_instance(efl_parent_get(obj))
-        except ValueError:
-            parent = None
-        self.internal_data["_legacy_parent"] = parent
+        # If the parent is not wrapped yet keep just a weak reference to it,
+        # the python object is created on request by _legacy_parent_get()
+        parent = efl_parent_get(obj)
+        if parent != NULL:
+            data = efl_key_data_get(parent, "python-eo")
+            if data != NULL:
+                self._legacy_parent = <Eo>data
+            else:
+                self._legacy_parent_obj = parent
+                efl_wref_add(parent, &self._legacy_parent_obj)
 
         return 1
 
+    cdef object _legacy_parent_get(self):
+        cdef cEo *parent = self._legacy_parent_obj
+
+        if parent != NULL:
+            efl_wref_del(parent, &self._legacy_parent_obj)
+            self._legacy_parent_obj = NULL
+            try:
+                self._legacy_parent = object_from_instance(parent)
+            except ValueError:
+                self._legacy_parent = None
+
+        return self._legacy_parent
+
+    cdef int _legacy_parent_set(self, Eo parent) except 0:
+        if self._legacy_parent_obj != NULL:
+            efl_wref_del(self._legacy_parent_obj, &self._legacy_parent_obj)
+            self._legacy_parent_obj = NULL
+        self._legacy_parent = parent
+        return 1
+
     def _wipe_obj_data_NEVER_USE_THIS(self):
         # only used in tests/eo/test_02_class_names.py
         # to force object_from_instance() to recreate the obj
@@ -307,6 +391,17 @@ cdef class Eo(object):
         """
         return bool(self.obj == NULL)
 
+    property data:
+        """A dictionary where you can store any python object
+
+        :type: dict
+
+        """
+        def __get__(self):
+            if self._data is None:
+                self._data = dict()
+            return self._data
+
     property parent:
         """The parent object
 
@@ -314,18 +409,18 @@ cdef class Eo(object):
 
         """
         def __set__(self, Eo parent):
-            self.internal_data["_legacy_parent"] = parent
+            self._legacy_parent_set(parent)
             efl_parent_set(self.obj, parent.obj)
 
         def __get__(self):
-            return self.internal_data["_legacy_parent"]
+            return self._legacy_parent_get()
 
     def parent_set(self, Eo parent):
-        self.internal_data["_legacy_parent"] = parent
+        self._legacy_parent_set(parent)
         efl_parent_set(self.obj, parent.obj)
 
     def parent_get(self):
-        return self.internal_data["_legacy_parent"]
+        return self._legacy_parent_get()
 
     def event_freeze(self):
         """Pause event propagation for this object."""
@@ -376,6 +376,12 @@ Evas_Colorspace
 
     YCBCR420TM12601_PL
 
+.. data:: EVAS_COLORSPACE_AGRY88
+
+    AGRY88
+
+    .. versionadded:: 1.27
+
 
 .. _Evas_Object_Table_Homogeneous_Mode:
 
@@ -1065,6 +1071,7 @@ EVAS_COLORSPACE_GRY8 = enums.EVAS_COLORSPACE_GRY8
 EVAS_COLORSPACE_YCBCR422601_PL = enums.EVAS_COLORSPACE_YCBCR422601_PL
 EVAS_COLORSPACE_YCBCR420NV12601_PL = enums.EVAS_COLORSPACE_YCBCR420NV12601_PL
 EVAS_COLORSPACE_YCBCR420TM12601_PL = enums.EVAS_COLORSPACE_YCBCR420TM12601_PL
+EVAS_COLORSPACE_AGRY88 = enums.EVAS_COLORSPACE_AGRY88
 
 EVAS_OBJECT_TABLE_HOMOGENEOUS_NONE = enums.EVAS_OBJECT_TABLE_HOMOGENEOUS_NONE
 EVAS_OBJECT_TABLE_HOMOGENEOUS_TABLE = enums.EVAS_OBJECT_TABLE_HOMOGENEOUS_TABLE
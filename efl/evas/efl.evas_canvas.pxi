@@ -455,9 +455,29 @@ cdef class Canvas(Eo):
         evas_obscured_clear(self.obj)
 
     def render_updates(self):
-        cdef Eina_List *lst
+        """Force canvas to redraw pending updates.
+
+        :return: The regions of the canvas that have been redrawn
+        :rtype: list of :py:class:`Rect`
+
+        .. versionchanged:: 1.27
+            Return the updated regions
+
+        """
+        cdef:
+            Eina_List *lst
+            Eina_List *l
+            Eina_Rectangle *r
+            list ret = []
+
         lst = evas_render_updates(self.obj)
+        l = lst
+        while l != NULL:
+            r = <Eina_Rectangle *>l.data
+            ret.append(Rect(r.x, r.y, r.w, r.h))
+            l = l.next
         evas_render_updates_free(lst)
+        return ret
 
     def render(self):
         """Force canvas to redraw pending updates."""
@@ -23,6 +23,7 @@ cdef int _object_free_wrapper_resources(Object obj) except 0:
     cdef int i
     for i from 0 <= i < evas_object_event_callbacks_len:
         obj._event_callbacks[i] = None
+    obj._motion_coalescers = None
     return 1
 
 
@@ -36,6 +37,10 @@ cdef int _object_unregister_callbacks(Object obj) except 0:
                 cb = evas_object_event_callbacks[i]
                 evas_object_event_callback_del(o, i, cb)
 
+        if obj._motion_coalescers is not None:
+            for coalescer in obj._motion_coalescers.values():
+                (<_MotionCoalescer>coalescer).unregister()
+
         evas_object_event_callback_del(o, EVAS_CALLBACK_FREE, obj_free_cb)
     return 1
 
@@ -71,13 +76,15 @@ cdef _object_add_callback_to_list(Object obj, int type, func, args, kargs):
     if type < 0 or type >= evas_object_event_callbacks_len:
         raise ValueError("Invalid callback type")
 
+    # callbacks are stored in tuples, replaced on every change, so that
+    # dispatching can iterate them while callbacks are added or removed
     r = (func, args, kargs)
     lst = obj._event_callbacks[type]
     if lst is not None:
-        lst.append(r)
+        obj._event_callbacks[type] = lst + (r,)
         return False
     else:
-        obj._event_callbacks[type] = [r]
+        obj._event_callbacks[type] = (r,)
         return True
 
 
@@ -98,11 +105,11 @@ cdef _object_del_callback_from_list(Object obj, int type, func):
         raise ValueError("Callback %s was not registered with type %d" %
                          (func, type))
 
-    lst.pop(i)
-    if len(lst) == 0:
+    if len(lst) == 1:
         obj._event_callbacks[type] = None
         return True
     else:
+        obj._event_callbacks[type] = lst[:i] + lst[i+1:]
         return False
 
 
@@ -1727,6 +1734,88 @@ cdef class Object(Eo):
                 cb = evas_object_event_callbacks[<int>type]
                 evas_object_event_callback_del(self.obj, type, cb)
 
+    def event_callback_coalesced_add(self, Evas_Callback_Type type, func,
+                                     *args, **kargs):
+        """Add a callback for motion events, called once per frame and device.
+
+        Instead of calling python for every single motion event, the events
+        are accumulated in C and delivered in one go just before the canvas
+        is rendered. Motion alone doesn't change the canvas, so the first
+        event of a frame damages the pointer position, to get that render.
+        Every device (and finger, for *EVAS_CALLBACK_MULTI_MOVE*) is
+        accumulated separately, and its pending motion is also delivered before
+        its button (or the finger) is released, so no position is ever lost.
+
+        :param type: *EVAS_CALLBACK_MOUSE_MOVE* or
+            *EVAS_CALLBACK_MULTI_MOVE*
+        :type type: int
+        :param func: function to call back, with the signature::
+
+                function(object, event, *args, **kargs)
+
+            where ``event`` is an :py:class:`EventMotionCoalesced`, holding
+            the last position and all the intermediate points of a device.
+        :type func: function
+
+        :raise ValueError: if **type** is not a motion event.
+        :raise TypeError: if **func** is not callable.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _MotionCoalescer coalescer
+
+        if not callable(func):
+            raise TypeError("func must be callable")
+        if <int>type != enums.EVAS_CALLBACK_MOUSE_MOVE and \
+           <int>type != enums.EVAS_CALLBACK_MULTI_MOVE:
+            raise ValueError("Only motion events can be coalesced")
+
+        if self._motion_coalescers is None:
+            self._motion_coalescers = {}
+        coalescer = self._motion_coalescers.get(<int>type)
+        if coalescer is None:
+            coalescer = _MotionCoalescer()
+            coalescer.register(self, type)
+            self._motion_coalescers[<int>type] = coalescer
+        coalescer.callbacks += ((func, args, kargs),)
+
+    def event_callback_coalesced_del(self, Evas_Callback_Type type, func):
+        """Remove a callback added with :py:func:`event_callback_coalesced_add`
+
+        :param type: *EVAS_CALLBACK_MOUSE_MOVE* or
+            *EVAS_CALLBACK_MULTI_MOVE*
+        :type type: int
+        :param func: function used with
+            :py:func:`event_callback_coalesced_add()`.
+        :type func: function
+
+        :raise ValueError: if there was no **func** connected with this type.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _MotionCoalescer coalescer = None
+
+        if self._motion_coalescers is not None:
+            coalescer = self._motion_coalescers.get(<int>type)
+        if coalescer is None:
+            raise ValueError("Callback %s was not registered with type %d" %
+                             (func, type))
+
+        lst = coalescer.callbacks
+        for i, r in enumerate(lst):
+            if func == r[0]:
+                break
+        else:
+            raise ValueError("Callback %s was not registered with type %d" %
+                             (func, type))
+
+        coalescer.callbacks = lst[:i] + lst[i+1:]
+        if not coalescer.callbacks:
+            coalescer.unregister()
+            del self._motion_coalescers[<int>type]
+
     def on_mouse_in_add(self, func, *a, **k):
         """Same as event_callback_add(EVAS_CALLBACK_MOUSE_IN, ...)
 
@@ -15,10 +15,37 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
+from cpython cimport PyObject
+from cpython.array cimport array, clone
+from libc.stdlib cimport realloc, free
+from libc.string cimport memcpy, memset
+
+cdef list _object_event_pool = [None] * enums.EVAS_CALLBACK_LAST
+
+
+cdef object _object_event_pool_pop(int type, type cls):
+    # Hand out the cached event wrapper for this type, or a new one if it
+    # is currently in use (ie: an event emitted from inside a callback)
+    event = _object_event_pool[type]
+    if event is None:
+        return cls()
+    _object_event_pool[type] = None
+    return event
+
+
+cdef void _object_event_pool_push(int type, object event):
+    # A wrapper that a callback kept a reference to is left to its owner
+    # (and stays invalid as usual), the next event will get a fresh one.
+    if (<PyObject *>event).ob_refcnt == 1:
+        _object_event_pool[type] = event
+
 
 cdef int cb_object_dispatcher(Object self, event, int type) except 0:
-    # iterate over copy since users may delete callback from callback
-    lst = tuple(self._event_callbacks[type])
+    # callback lists are never modified in place (see
+    # _object_add_callback_to_list) so there is no need to copy them here
+    lst = self._event_callbacks[type]
+    if lst is None:
+        return 1
     for func, args, kargs in lst:
         try:
             func(self, event, *args, **kargs)
@@ -28,8 +55,9 @@ cdef int cb_object_dispatcher(Object self, event, int type) except 0:
 
 
 cdef int cb_object_dispatcher2(Object self, int type) except 0:
-    # iterate over copy since users may delete callback from callback
-    lst = tuple(self._event_callbacks[type])
+    lst = self._event_callbacks[type]
+    if lst is None:
+        return 1
     for func, args, kargs in lst:
         try:
             func(self, *args, **kargs)
@@ -40,82 +68,82 @@ cdef int cb_object_dispatcher2(Object self, int type) except 0:
 
 cdef void cb_object_mouse_in(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseIn event
-    event = EventMouseIn()
+    cdef EventMouseIn event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_IN, EventMouseIn)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_IN)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_IN, event)
 
 
 cdef void cb_object_mouse_out(void *data, Evas *e,
                               Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseOut event
-    event = EventMouseOut()
+    cdef EventMouseOut event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_OUT, EventMouseOut)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_OUT)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_OUT, event)
 
 
 cdef void cb_object_mouse_down(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseDown event
-    event = EventMouseDown()
+    cdef EventMouseDown event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_DOWN, EventMouseDown)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_DOWN)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_DOWN, event)
 
 
 cdef void cb_object_mouse_up(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseUp event
-    event = EventMouseUp()
+    cdef EventMouseUp event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_UP, EventMouseUp)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_UP)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_UP, event)
 
 
 cdef void cb_object_mouse_move(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseMove event
-    event = EventMouseMove()
+    cdef EventMouseMove event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_MOVE, EventMouseMove)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_MOVE)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_MOVE, event)
 
 
 cdef void cb_object_multi_down(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMultiDown event
-    event = EventMultiDown()
+    cdef EventMultiDown event = _object_event_pool_pop(enums.EVAS_CALLBACK_MULTI_DOWN, EventMultiDown)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_DOWN)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MULTI_DOWN, event)
 
 cdef void cb_object_multi_up(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMultiUp event
-    event = EventMultiUp()
+    cdef EventMultiUp event = _object_event_pool_pop(enums.EVAS_CALLBACK_MULTI_UP, EventMultiUp)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_UP)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MULTI_UP, event)
 
 
 cdef void cb_object_multi_move(void *data, Evas *e,
                                Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMultiMove event
-    event = EventMultiMove()
+    cdef EventMultiMove event = _object_event_pool_pop(enums.EVAS_CALLBACK_MULTI_MOVE, EventMultiMove)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MULTI_MOVE)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MULTI_MOVE, event)
 
 
 cdef void cb_object_mouse_wheel(void *data, Evas *e,
                                 Evas_Object *obj, void *e_inf) with gil:
-    cdef EventMouseWheel event
-    event = EventMouseWheel()
+    cdef EventMouseWheel event = _object_event_pool_pop(enums.EVAS_CALLBACK_MOUSE_WHEEL, EventMouseWheel)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_MOUSE_WHEEL)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_MOUSE_WHEEL, event)
 
 
 cdef void cb_object_free(void *data, Evas *e,
@@ -125,20 +153,20 @@ cdef void cb_object_free(void *data, Evas *e,
 
 cdef void cb_object_key_down(void *data, Evas *e,
                              Evas_Object *obj, void *e_inf) with gil:
-    cdef EventKeyDown event
-    event = EventKeyDown()
+    cdef EventKeyDown event = _object_event_pool_pop(enums.EVAS_CALLBACK_KEY_DOWN, EventKeyDown)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_KEY_DOWN)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_KEY_DOWN, event)
 
 
 cdef void cb_object_key_up(void *data, Evas *e,
                            Evas_Object *obj, void *e_inf) with gil:
-    cdef EventKeyUp event
-    event = EventKeyUp()
+    cdef EventKeyUp event = _object_event_pool_pop(enums.EVAS_CALLBACK_KEY_UP, EventKeyUp)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_KEY_UP)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_KEY_UP, event)
 
 
 cdef void cb_object_focus_in(void *data, Evas *e,
@@ -183,11 +211,11 @@ cdef void cb_object_del(void *data, Evas *e,
 
 cdef void cb_object_hold(void *data, Evas *e,
                          Evas_Object *obj, void *e_inf) with gil:
-    cdef EventHold event
-    event = EventHold()
+    cdef EventHold event = _object_event_pool_pop(enums.EVAS_CALLBACK_HOLD, EventHold)
     event._set_obj(e_inf)
     cb_object_dispatcher(<Object>data, event, enums.EVAS_CALLBACK_HOLD)
     event._unset_obj()
+    _object_event_pool_push(enums.EVAS_CALLBACK_HOLD, event)
 
 
 cdef void cb_object_changed_size_hints(void *data, Evas *e,
@@ -255,6 +283,264 @@ cdef void cb_object_viewport_resize(void *data, Evas *e,
     print("EVAS_CALLBACK_CANVAS_VIEWPORT_RESIZE is not supported by object.")
 
 
+ctypedef struct _Motion_Slot:
+    Evas_Device *dev
+    int device          # the finger of multi events, 0 for the mouse
+    int *points         # x, y pairs
+    int count
+    int size
+    int buttons
+    unsigned int timestamp
+
+ctypedef struct _Motion_Buffer:
+    void *coalescer     # the owning _MotionCoalescer, borrowed
+    int type
+    _Motion_Slot *slots # one per device and finger
+    int nslots
+    int pending         # slots holding motion
+
+
+cdef class _MotionCoalescer:
+    """Motion events accumulated in C, delivered to python once per frame
+
+    The motion is stored without taking the GIL, separately for every device
+    (and finger), and flushed to the python callbacks just before the canvas
+    renders, or before the button (or finger) of a device is released, so
+    that its final position always comes first.
+
+    """
+    cdef:
+        _Motion_Buffer buf
+        Object owner
+        Evas_Object *obj
+        Evas *evas
+        tuple callbacks
+
+    def __cinit__(self):
+        self.buf.coalescer = <void *>self
+        self.callbacks = ()
+
+    def __dealloc__(self):
+        cdef int i
+        for i in range(self.buf.nslots):
+            free(self.buf.slots[i].points)
+        free(self.buf.slots)
+        self.buf.slots = NULL
+        self.buf.nslots = 0
+
+    cdef int register(self, Object owner, int type) except 0:
+        cdef Evas_Callback_Type up_type
+        self.owner = owner
+        self.obj = owner.obj
+        self.evas = evas_object_evas_get(self.obj)
+        self.buf.type = type
+        if type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+            up_type = enums.EVAS_CALLBACK_MOUSE_UP
+        else:
+            up_type = enums.EVAS_CALLBACK_MULTI_UP
+
+        evas_object_event_callback_add(self.obj, <Evas_Callback_Type>type,
+                                       cb_object_motion_coalesce, &self.buf)
+        evas_object_event_callback_priority_add(self.obj, up_type,
+            EVAS_CALLBACK_PRIORITY_BEFORE, cb_object_motion_flush, &self.buf)
+        evas_event_callback_add(self.evas, enums.EVAS_CALLBACK_RENDER_PRE,
+                                cb_canvas_motion_flush, &self.buf)
+        return 1
+
+    cdef int unregister(self) except 0:
+        cdef:
+            Evas_Callback_Type up_type
+            int i
+        if self.obj == NULL:
+            return 1
+        if self.buf.type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+            up_type = enums.EVAS_CALLBACK_MOUSE_UP
+        else:
+            up_type = enums.EVAS_CALLBACK_MULTI_UP
+
+        evas_object_event_callback_del_full(self.obj,
+            <Evas_Callback_Type>self.buf.type,
+            cb_object_motion_coalesce, &self.buf)
+        evas_object_event_callback_del_full(self.obj, up_type,
+            cb_object_motion_flush, &self.buf)
+        evas_event_callback_del_full(self.evas, enums.EVAS_CALLBACK_RENDER_PRE,
+                                     cb_canvas_motion_flush, &self.buf)
+        self.obj = NULL
+        self.evas = NULL
+        self.owner = None
+        for i in range(self.buf.nslots):
+            self.buf.slots[i].count = 0
+        self.buf.pending = 0
+        return 1
+
+    cdef int flush(self, int slot) except 0:
+        # slot -1 flushes all the devices
+        cdef int i
+        if slot >= 0:
+            return self._flush_slot(slot)
+        # the callbacks may feed more events, and add slots
+        i = 0
+        while i < self.buf.nslots and self.buf.pending > 0:
+            self._flush_slot(i)
+            i += 1
+        return 1
+
+    cdef int _flush_slot(self, int i) except 0:
+        cdef:
+            _Motion_Slot *slot = &self.buf.slots[i]
+            EventMotionCoalesced event
+            array points
+            int count = slot.count
+
+        if count == 0:
+            return 1
+
+        event = EventMotionCoalesced.__new__(EventMotionCoalesced)
+        points = clone(_motion_array_template, count * 2, False)
+        memcpy(points.data.as_ints, slot.points, sizeof(int) * 2 * count)
+        event.type = self.buf.type
+        event.count = count
+        event.points = points
+        event.device = slot.device
+        event.buttons = slot.buttons
+        event.timestamp = slot.timestamp
+        # the slots may move while the callbacks run, don't use slot below
+        slot.count = 0
+        self.buf.pending -= 1
+
+        # keep a reference, a callback may delete the object or this coalescer
+        owner = self.owner
+        for func, args, kargs in self.callbacks:
+            try:
+                func(owner, event, *args, **kargs)
+            except Exception:
+                traceback.print_exc()
+        return 1
+
+
+cdef array _motion_array_template = array('i')
+
+
+cdef int _motion_slot_find(_Motion_Buffer *buf, Evas_Device *dev,
+                           int device) nogil:
+    cdef int i
+    for i in range(buf.nslots):
+        if buf.slots[i].dev == dev and buf.slots[i].device == device:
+            return i
+    return -1
+
+
+cdef _Motion_Slot *_motion_slot_append(_Motion_Buffer *buf,
+                                       Evas_Device *dev, int device) nogil:
+    # the slot of the device, with room for one more point at the end,
+    # NULL when out of memory
+    cdef:
+        _Motion_Slot *slot
+        int *points
+        int i = _motion_slot_find(buf, dev, device)
+        int size
+
+    if i < 0:
+        slot = <_Motion_Slot *>realloc(buf.slots,
+                                       sizeof(_Motion_Slot) * (buf.nslots + 1))
+        if slot == NULL:
+            return NULL
+        buf.slots = slot
+        i = buf.nslots
+        buf.nslots += 1
+        memset(&buf.slots[i], 0, sizeof(_Motion_Slot))
+        buf.slots[i].dev = dev
+        buf.slots[i].device = device
+    slot = &buf.slots[i]
+
+    if slot.count == slot.size:
+        size = slot.size * 2 if slot.size > 0 else 32
+        points = <int *>realloc(slot.points, sizeof(int) * 2 * size)
+        if points != NULL:
+            slot.points = points
+            slot.size = size
+        elif slot.count > 0:
+            # out of memory, at least keep track of the last position
+            slot.count -= 1
+        else:
+            return NULL
+
+    if slot.count == 0:
+        buf.pending += 1
+    slot.count += 1
+    return slot
+
+
+cdef void cb_object_motion_coalesce(void *data, Evas *e,
+                                    Evas_Object *obj, void *e_inf) nogil:
+    cdef:
+        _Motion_Buffer *buf = <_Motion_Buffer *>data
+        Evas_Event_Mouse_Move *mouse
+        Evas_Event_Multi_Move *multi
+        _Motion_Slot *slot
+        bint idle = buf.pending == 0
+        int *points
+        int x, y
+
+    if buf.type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+        mouse = <Evas_Event_Mouse_Move *>e_inf
+        slot = _motion_slot_append(buf, mouse.dev, 0)
+        if slot == NULL:
+            return
+        points = slot.points + (slot.count - 1) * 2
+        points[0] = mouse.cur.canvas.x
+        points[1] = mouse.cur.canvas.y
+        slot.buttons = mouse.buttons
+        slot.timestamp = mouse.timestamp
+        x, y = mouse.cur.output.x, mouse.cur.output.y
+    else:
+        multi = <Evas_Event_Multi_Move *>e_inf
+        slot = _motion_slot_append(buf, multi.dev, multi.device)
+        if slot == NULL:
+            return
+        points = slot.points + (slot.count - 1) * 2
+        points[0] = multi.cur.canvas.x
+        points[1] = multi.cur.canvas.y
+        slot.timestamp = multi.timestamp
+        x, y = multi.cur.output.x, multi.cur.output.y
+
+    # motion alone doesn't change the canvas, so a render (and RENDER_PRE)
+    # may never come, damage the pointer position to have the next frame
+    if idle:
+        evas_damage_rectangle_add(e, x, y, 1, 1)
+
+
+cdef void _motion_buffer_flush(_Motion_Buffer *buf, int slot) with gil:
+    # hold a reference, callbacks are allowed to remove the coalescer
+    cdef _MotionCoalescer coalescer = <_MotionCoalescer>buf.coalescer
+    try:
+        coalescer.flush(slot)
+    except Exception:
+        traceback.print_exc()
+
+
+cdef void cb_object_motion_flush(void *data, Evas *e,
+                                 Evas_Object *obj, void *e_inf) nogil:
+    cdef:
+        _Motion_Buffer *buf = <_Motion_Buffer *>data
+        Evas_Event_Multi_Up *multi
+        int i
+
+    # only the device going up, the others keep moving
+    if buf.type == enums.EVAS_CALLBACK_MOUSE_MOVE:
+        i = _motion_slot_find(buf, (<Evas_Event_Mouse_Up *>e_inf).dev, 0)
+    else:
+        multi = <Evas_Event_Multi_Up *>e_inf
+        i = _motion_slot_find(buf, multi.dev, multi.device)
+    if i >= 0 and buf.slots[i].count > 0:
+        _motion_buffer_flush(buf, i)
+
+
+cdef void cb_canvas_motion_flush(void *data, Evas *e, void *e_inf) nogil:
+    if (<_Motion_Buffer *>data).pending > 0:
+        _motion_buffer_flush(<_Motion_Buffer *>data, -1)
+
+
 cdef int evas_object_event_callbacks_len
 cdef Evas_Object_Event_Cb evas_object_event_callbacks[36]
 evas_object_event_callbacks_len = 36
@@ -15,10 +15,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
-from cpython cimport PyUnicode_AsUTF8String
+from cpython cimport PyObject, PyUnicode_AsUTF8String
 
 from efl.utils.conversions cimport _ctouni
 
+
+cdef inline bint _event_wrapper_reusable(PyObject *o):
+    # Event wrappers are rebound to new C structs only if nobody kept a
+    # reference to them, a retained wrapper must stay invalid forever.
+    return o.ob_refcnt == 1
+
 cdef class EventPoint:
     cdef void _set_obj(self, Evas_Point *obj):
         self.obj = obj
@@ -174,9 +180,11 @@ cdef class EventPrecisionPoint:
 
 cdef class EventPosition:
     cdef void _set_objs(self, Evas_Point *output, Evas_Coord_Point *canvas):
-        self.output = EventPoint()
+        if not _event_wrapper_reusable(<PyObject *>self.output):
+            self.output = EventPoint()
         self.output._set_obj(output)
-        self.canvas = EventCoordPoint()
+        if not _event_wrapper_reusable(<PyObject *>self.canvas):
+            self.canvas = EventCoordPoint()
         self.canvas._set_obj(canvas)
 
     cdef void _unset_objs(self):
@@ -191,9 +199,11 @@ cdef class EventPosition:
 
 cdef class EventPrecisionPosition:
     cdef void _set_objs(self, Evas_Point *output, Evas_Coord_Precision_Point *canvas):
-        self.output = EventPoint()
+        if not _event_wrapper_reusable(<PyObject *>self.output):
+            self.output = EventPoint()
         self.output._set_obj(output)
-        self.canvas = EventPrecisionPoint()
+        if not _event_wrapper_reusable(<PyObject *>self.canvas):
+            self.canvas = EventPrecisionPoint()
         self.canvas._set_obj(canvas)
 
     cdef void _unset_objs(self):
@@ -210,7 +220,8 @@ cdef class EventPrecisionPosition:
 cdef class EventMouseIn:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_In*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -257,7 +268,8 @@ cdef class EventMouseIn:
 cdef class EventMouseOut:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Out*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -304,7 +316,8 @@ cdef class EventMouseOut:
 cdef class EventMouseDown:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Down*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -360,7 +373,8 @@ cdef class EventMouseDown:
 cdef class EventMouseUp:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Up*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -416,9 +430,11 @@ cdef class EventMouseUp:
 cdef class EventMouseMove:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Move*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.cur.output, &self.obj.cur.canvas)
-        self.prev_position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.prev_position):
+            self.prev_position = EventPosition()
         self.prev_position._set_objs(&self.obj.prev.output,
                                      &self.obj.prev.canvas)
 
@@ -470,7 +486,8 @@ cdef class EventMouseMove:
 cdef class EventMultiDown:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Down*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -554,7 +571,8 @@ cdef class EventMultiDown:
 cdef class EventMultiUp:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Up*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -639,7 +657,8 @@ cdef class EventMultiUp:
 cdef class EventMultiMove:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Multi_Move*>ptr
-        self.position = EventPrecisionPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPrecisionPosition()
         self.position._set_objs(&self.obj.cur.output, &self.obj.cur.canvas)
 
     cdef void _unset_obj(self):
@@ -710,7 +729,8 @@ cdef class EventMultiMove:
 cdef class EventMouseWheel:
     cdef void _set_obj(self, void *ptr):
         self.obj = <Evas_Event_Mouse_Wheel*>ptr
-        self.position = EventPosition()
+        if not _event_wrapper_reusable(<PyObject *>self.position):
+            self.position = EventPosition()
         self.position._set_objs(&self.obj.output, &self.obj.canvas)
 
     cdef void _unset_obj(self):
@@ -911,3 +931,37 @@ cdef class EventHold:
         def __set__(self, flags):
             self._check_validity()
             self.obj.event_flags = flags
+
+
+
+cdef class EventMotionCoalesced:
+    """The motion events of a device received since the last delivery
+
+    Given to the callbacks added with
+    :py:func:`~efl.evas.Object.event_callback_coalesced_add`. Unlike the
+    other event objects this one holds a copy of the data, so it is
+    still valid after the callback returns.
+
+    Available attributes (all readonly):
+
+    - **type**: *EVAS_CALLBACK_MOUSE_MOVE* or *EVAS_CALLBACK_MULTI_MOVE*
+    - **count**: number of motion events coalesced
+    - **points**: ``array('i')`` of canvas coordinates, as x0, y0, x1, y1...
+    - **device**: the finger of the points (always 0 for
+      *EVAS_CALLBACK_MOUSE_MOVE*), every device gets its own event
+    - **position**: the last (x, y) canvas position
+    - **buttons**: buttons pressed during the last mouse move
+    - **timestamp**: timestamp of the last motion event
+
+    .. versionadded:: 1.27
+
+    """
+    def __repr__(self):
+        return "<%s(count=%d, device=%d, position=%r, buttons=%d, " \
+               "timestamp=%d)>" % (type(self).__name__, self.count,
+                                   self.device, self.position, self.buttons,
+                                   self.timestamp)
+
+    property position:
+        def __get__(self):
+            return (self.points[-2], self.points[-1])
@@ -16,31 +16,194 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 from cpython cimport PyObject
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.string cimport memcpy
 
 cdef extern from "Python.h":
     PyObject * PyMemoryView_FromBuffer(Py_buffer *info)
 
 from cpython.buffer cimport Py_buffer, PyObject_CheckBuffer, \
-    PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+    PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE, PyBUF_WRITABLE, \
+    PyBUF_FORMAT, PyBUF_ND, PyBUF_STRIDES
+
+import sys
+
+# the byte order prefix of the native buffer formats
+cdef bytes _native_byteorder = b"<" if sys.byteorder == "little" else b">"
 
 
 cdef int _data_size_get(Evas_Object *obj):
-    cdef int stride, h, bpp, cspace, have_alpha
+    # NOTE: stride is in bytes
+    cdef int stride, h, cspace, have_alpha
     stride = evas_object_image_stride_get(obj)
     evas_object_image_size_get(obj, NULL, &h)
     cspace = evas_object_image_colorspace_get(obj)
     have_alpha = evas_object_image_alpha_get(obj)
-    if cspace == EVAS_COLORSPACE_ARGB8888:
-        bpp = 4
+    if cspace == EVAS_COLORSPACE_ARGB8888 or \
+       cspace == EVAS_COLORSPACE_GRY8 or \
+       cspace == EVAS_COLORSPACE_AGRY88:
+        return stride * h
     elif cspace == EVAS_COLORSPACE_RGB565_A5P:
         if have_alpha == 0:
-            bpp = 2
+            return stride * h
         else:
-            bpp = 3
+            # the alpha plane, one byte per pixel, follows the color plane
+            return stride * h + stride / 2 * h
     else:
         return 0 # XXX not supported.
 
-    return stride * h * bpp
+
+cdef int _data_pixel_size_get(Evas_Object *obj, char **format):
+    cdef int cspace = evas_object_image_colorspace_get(obj)
+    if cspace == EVAS_COLORSPACE_ARGB8888:
+        format[0] = "I"
+        return 4
+    elif cspace == EVAS_COLORSPACE_AGRY88:
+        format[0] = "H"
+        return 2
+    elif cspace == EVAS_COLORSPACE_GRY8:
+        format[0] = "B"
+        return 1
+    else:
+        return 0
+
+
+cdef int _data_buffer_get(Evas_Object *obj, Py_buffer *view, int flags,
+                          int x, int y, int w, int h, object owner) except -1:
+    # Export the pixels in the (x, y, w, h) region as a 2D (h, w) buffer.
+    # view.internal holds shape[2], strides[2] and the region (x, y, w, h)
+    # owner is kept alive by the view, and gets __releasebuffer__ called
+    cdef:
+        int iw, ih, stride, itemsize
+        char *format = NULL
+        bint writable = flags & PyBUF_WRITABLE == PyBUF_WRITABLE
+        bint contiguous
+        char *data
+        Py_ssize_t *internal
+
+    evas_object_image_size_get(obj, &iw, &ih)
+    if w < 0:
+        w = iw - x
+    if h < 0:
+        h = ih - y
+    if x < 0 or y < 0 or w < 0 or h < 0 or x + w > iw or y + h > ih:
+        raise BufferError(
+            "region (%d, %d, %d, %d) out of the image size (%d, %d)" % (
+                x, y, w, h, iw, ih))
+
+    itemsize = _data_pixel_size_get(obj, &format)
+    if itemsize == 0:
+        raise BufferError("Unsupported colorspace")
+
+    stride = evas_object_image_stride_get(obj)
+    # a partial region is contiguous only when whole rows are requested
+    contiguous = x == 0 and w == iw and stride == w * itemsize
+    if flags & PyBUF_STRIDES != PyBUF_STRIDES and not contiguous:
+        # without strides an N-dimensional view must be C contiguous, a
+        # simple block of bytes can only hold whole (padded) rows
+        if flags & PyBUF_ND == PyBUF_ND or x != 0 or w != iw:
+            raise BufferError("the region is not contiguous, strides needed")
+
+    internal = <Py_ssize_t *>PyMem_Malloc(sizeof(Py_ssize_t) * 8)
+    if internal == NULL:
+        raise MemoryError
+
+    data = <char *>evas_object_image_data_get(obj, writable)
+    if data == NULL:
+        PyMem_Free(internal)
+        raise BufferError("image has no allocated buffer.")
+
+    internal[0] = h
+    internal[1] = w
+    internal[2] = stride
+    internal[3] = itemsize
+    internal[4] = x
+    internal[5] = y
+    internal[6] = w
+    internal[7] = h
+
+    view.buf = data + y * stride + x * itemsize
+    view.internal = internal
+    view.readonly = not writable
+    view.itemsize = itemsize
+    view.format = format if flags & PyBUF_FORMAT == PyBUF_FORMAT else NULL
+    view.suboffsets = NULL
+    if flags & PyBUF_ND == PyBUF_ND:
+        view.ndim = 2
+        view.shape = internal
+        if flags & PyBUF_STRIDES == PyBUF_STRIDES:
+            view.strides = internal + 2
+        else:
+            view.strides = NULL
+        view.len = h * w * itemsize
+    else:
+        # a simple block of bytes, row padding included
+        view.ndim = 1
+        view.shape = NULL
+        view.strides = NULL
+        view.len = h * stride
+    view.obj = owner
+    return 0
+
+
+cdef void _data_buffer_release(Evas_Object *obj, Py_buffer *view):
+    cdef:
+        Py_ssize_t *internal = <Py_ssize_t *>view.internal
+        int x, y, w, h
+
+    # give back the whole data, not the region start
+    evas_object_image_data_set(obj, <char *>view.buf -
+                                    internal[5] * internal[2] -
+                                    internal[4] * internal[3])
+    if not view.readonly:
+        x, y, w, h = internal[4], internal[5], internal[6], internal[7]
+        evas_object_image_data_update_add(obj, x, y, w, h)
+    PyMem_Free(internal)
+    view.internal = NULL
+
+
+cdef int _rects_merge(int *r, int n) nogil:
+    # Merge overlapping rects (x, y, w, h) in place, until none of the
+    # remaining ones overlap, returns the new number of rects.
+    cdef:
+        int i, j, x, y, x2, y2
+        bint changed = 1
+    while changed:
+        changed = 0
+        i = 0
+        while i < n:
+            j = i + 1
+            while j < n:
+                if r[i*4] < r[j*4] + r[j*4+2] and \
+                   r[j*4] < r[i*4] + r[i*4+2] and \
+                   r[i*4+1] < r[j*4+1] + r[j*4+3] and \
+                   r[j*4+1] < r[i*4+1] + r[i*4+3]:
+                    x = min(r[i*4], r[j*4])
+                    y = min(r[i*4+1], r[j*4+1])
+                    x2 = max(r[i*4] + r[i*4+2], r[j*4] + r[j*4+2])
+                    y2 = max(r[i*4+1] + r[i*4+3], r[j*4+1] + r[j*4+3])
+                    r[i*4], r[i*4+1], r[i*4+2], r[i*4+3] = x, y, x2-x, y2-y
+                    # move the last rect in place of the merged one
+                    n -= 1
+                    memcpy(&r[j*4], &r[n*4], 4 * sizeof(int))
+                    changed = 1
+                else:
+                    j += 1
+            i += 1
+    return n
+
+
+cdef int _data_updates_add(Evas_Object *obj, int *r, int n, bint merge):
+    # returns the number of rects given to evas
+    cdef int i, added = 0
+    if merge:
+        n = _rects_merge(r, n)
+    for i in range(n):
+        if r[i*4+2] > 0 and r[i*4+3] > 0:
+            evas_object_image_data_update_add(obj, r[i*4], r[i*4+1],
+                                              r[i*4+2], r[i*4+3])
+            added += 1
+    return added
 
 
 cdef class Image(Object):
@@ -120,6 +283,13 @@ cdef class Image(Object):
 
             R = (r * a) / 32; G = (g * a) / 32; B = (b * a) / 32;
 
+    Consumers that ask for a shaped buffer (like :py:class:`memoryview` or
+    numpy) get a 2D view of **h** rows by **w** pixels, in place, see
+    :py:func:`image_data_region_get` to access only a part of the pixels.
+
+    .. versionchanged:: 1.27
+        The buffer is exported as 2D for ARGB8888, AGRY88 and GRY8 images.
+
     .. note:: if an image is resized it will **tile** it's contents respecting
         geometry set by :py:attr:`fill`, so if you want the contents to be
         **scaled** you need to call :py:attr:`fill` with ``x=0, y=0, w=new_width,
@@ -424,7 +594,7 @@ cdef class Image(Object):
         evas_object_image_size_set(self.obj, w, h)
 
     property stride:
-        """Get the row stride (in pixels) being used to draw this image.
+        """Get the row stride (in bytes) being used to draw this image.
 
         While image have logical dimension of width and height set by
         :py:attr:`image_size`, the line can be a bit larger than width to
@@ -437,7 +607,7 @@ cdef class Image(Object):
         alpha plane with data using stride in multiple of 1 byte.
 
         .. note:: This value can change after setting :py:attr:`image_size`.
-        .. note:: Unit is pixels, not bytes.
+        .. note:: Unit is bytes, not pixels.
 
         :type: int
 
@@ -486,111 +656,80 @@ cdef class Image(Object):
         PyObject_GetBuffer(buf, &view, PyBUF_SIMPLE)
 
         expected_size = _data_size_get(self.obj)
-        if view.itemsize < expected_size:
+        if view.len < expected_size:
+            PyBuffer_Release(&view)
             raise ValueError(
                 "buffer size (%d) is smaller than expected (%d)!" % (
-                    view.itemsize, expected_size
+                    view.len, expected_size
                     )
                 )
 
-        evas_object_image_data_set(self.obj, <void *>view.buf)
+        evas_object_image_data_copy_set(self.obj, <void *>view.buf)
 
         PyBuffer_Release(&view)
 
-    # def image_data_memoryview_get(self, bint for_writing=False, bint simple=True):
-    #     """image_data_memoryview_get(bool for_writing) -> MemoryView
+    def image_data_memoryview_get(self, bint for_writing=False):
+        """Get a MemoryView to the raw image data of the given image object.
 
-    #     Get a MemoryView object to the raw image data of the given image object.
+        :param bool for_writing: Whether the data will be modified or not.
+        :return: The raw image data, see :py:func:`image_data_region_get`
+            for the format.
+        :rtype: memoryview
 
-    #     :param bool for_writing: Whether the data being retrieved will be
-    #             modified or not.
-    #     :param bool simple: Whether the MemoryView is 1D or 2D
-    #     :return MemoryView: The raw image data.
+        This gives direct access to the image object's internal pixel
+        buffer, no copy is involved. If you request it for writing, the
+        whole image will be marked dirty, so that it gets redrawn at the next
+        update, when the memoryview is released.
 
-    #     This method returns a MemoryView object to an image object's internal pixel
-    #     buffer, for reading only or read/write. If you request it for
-    #     writing, the image will be marked dirty so that it gets redrawn at
-    #     the next update.
+        .. versionadded:: 1.27
 
-    #     Each time you call this method on an image object, its data
-    #     buffer will have an internal reference counter
-    #     incremented. Decrement it back by using
-    #     :py:func:`image_data_set`.
-
-    #     This is best suited for when you want to modify an existing image,
-    #     without changing its dimensions.
-
-    #     .. note::
-    #         The contents' format returned by it depend on the color
-    #         space of the given image object.
+        """
+        return memoryview(self.image_data_region_get(for_writing=for_writing))
 
-    #     .. note::
-    #         You may want to use :py:func:`image_data_update_add` to
-    #         inform data changes, if you did any.
+    def image_data_region_get(self, int x=0, int y=0, int w=-1, int h=-1,
+                              bint for_writing=False):
+        """Get a buffer to a region of the raw image data.
 
-    #     """
-    #     cdef int stride, h, bpp, cspace, have_alpha, img_size
-
-    #     stride = evas_object_image_stride_get(self.obj)
-    #     evas_object_image_size_get(self.obj, NULL, &h)
-    #     cspace = evas_object_image_colorspace_get(self.obj)
-    #     have_alpha = evas_object_image_alpha_get(self.obj)
-
-    #     bpp = 0
-    #     if cspace == EVAS_COLORSPACE_ARGB8888:
-    #         bpp = 4
-    #         format = "L"
-    #     elif cspace == EVAS_COLORSPACE_RGB565_A5P:
-    #         if have_alpha == 0:
-    #             bpp = 2
-    #             format = "H"
-    #         else:
-    #             pass #bpp = 3
-    #             # XXX: There's no type that has three bytes.
-    #             #      Is the format string actually used?
-    #     if bpp == 0:
-    #         raise ValueError("Unsupported colorspace")
-
-    #     img_size = stride * h * bpp
-
-    #     cdef Py_buffer *img_buf = <Py_buffer *>PyMem_Malloc(sizeof(Py_buffer))
-    #     if img_buf == NULL:
-    #         raise MemoryError
-
-    #     cdef:
-    #         Py_ssize_t simple_shape[1]
-    #         Py_ssize_t shape[2]
-    #         Py_ssize_t strides[2]
-    #         Py_ssize_t suboffsets[2]
-
-    #     if simple:
-    #         simple_shape[0] = img_size
-    #     else:
-    #         shape[0] = stride / bpp
-    #         shape[1] = h
-    #         strides[0] = stride
-    #         strides[1] = h * bpp
-    #         suboffsets[0] = -1
-    #         suboffsets[1] = -1
-
-    #     img_buf.buf = evas_object_image_data_get(self.obj, for_writing)
-    #     img_buf.len = img_size
-    #     img_buf.readonly = not for_writing
-    #     img_buf.format = format
-    #     if simple:
-    #         img_buf.ndim = 1
-    #         img_buf.shape = simple_shape
-    #         img_buf.strides = NULL
-    #         img_buf.suboffsets = NULL
-    #     else:
-    #         img_buf.ndim = 2
-    #         img_buf.shape = shape
-    #         img_buf.strides = strides
-    #         img_buf.suboffsets = suboffsets
-    #     img_buf.itemsize = bpp
-
-    #     return <object>PyMemoryView_FromBuffer(img_buf)
+        :param x: X coordinate of the region
+        :type x: int
+        :param y: Y coordinate of the region
+        :type y: int
+        :param w: Width of the region, -1 means up to the right edge
+        :type w: int
+        :param h: Height of the region, -1 means up to the bottom edge
+        :type h: int
+        :param for_writing: Always export writable buffers, even to the
+            consumers that do not request one (like :py:class:`memoryview`).
+            Off by default, like in :py:func:`image_data_memoryview_get`.
+        :type for_writing: bool
+        :return: An object exporting the region with the buffer protocol
+        :rtype: :py:class:`ImageDataRegion`
+
+        The returned object gives direct access (without copies) to the
+        pixels, as a 2D buffer of **h** rows by **w** pixels, with the row
+        stride of the image. Supported colorspaces are
+        *EVAS_COLORSPACE_ARGB8888* (format ``I``, one 32 bit integer per
+        pixel), *EVAS_COLORSPACE_AGRY88* (format ``H``) and
+        *EVAS_COLORSPACE_GRY8* (format ``B``).
+
+        When a writable buffer is released, only the region is marked as
+        dirty, so this is the way to go to update a small part of a large
+        image, fe with numpy::
+
+            region = img.image_data_region_get(10, 10, 64, 64,
+                                               for_writing=True)
+            arr = numpy.asarray(region)
+            arr[:] = 0xff000000  # black
+            del arr  # buffer released, region updated
+
+        .. versionadded:: 1.27
 
+        """
+        cdef ImageDataRegion region = ImageDataRegion.__new__(ImageDataRegion)
+        region.image = self
+        region.x, region.y, region.w, region.h = x, y, w, h
+        region.writable = for_writing
+        return region
 
     # TODO:
     # def image_data_convert(self, to_cspace):
@@ -655,6 +794,72 @@ cdef class Image(Object):
         """
         evas_object_image_data_update_add(self.obj, x, y, w, h)
 
+    def image_data_updates_add(self, rects, bint merge=False):
+        """Mark many sub-regions of the image to be redrawn, at once.
+
+        :param rects: The regions to update, either a sequence of
+            ``(x, y, w, h)`` tuples or a C contiguous buffer of N x 4
+            32 bit integers in native byte order (fe: an ``array('i')`` or
+            a numpy array of dtype int32)
+        :param merge: Merge overlapping regions before passing them to Evas
+        :type merge: bool
+        :return: The number of regions passed to Evas
+        :rtype: int
+
+        This is the same as calling :py:func:`image_data_update_add` for
+        every rect, without the per call overhead. Empty rects are skipped.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            Py_buffer view
+            int *r
+            int i, n, added
+            bint own = 0
+            bytes fmt
+
+        if PyObject_CheckBuffer(rects):
+            PyObject_GetBuffer(rects, &view, PyBUF_FORMAT | PyBUF_ND)
+            try:
+                fmt = view.format if view.format != NULL else b"B"
+                if fmt[:1] in (b"@", b"=", _native_byteorder):
+                    fmt = fmt[1:]
+                elif fmt[:1] in (b"<", b">", b"!"):
+                    raise ValueError("rects buffer must be in native byte order")
+                if view.itemsize != 4 or fmt not in (b"i", b"l"):
+                    raise ValueError("rects buffer must contain 32 bit ints")
+                if view.len % (4 * sizeof(int)) != 0:
+                    raise ValueError("rects buffer length must be N x 4")
+                n = view.len // (4 * sizeof(int))
+                if merge:
+                    r = <int *>PyMem_Malloc(view.len)
+                    if r == NULL:
+                        raise MemoryError
+                    memcpy(r, view.buf, view.len)
+                    own = 1
+                else:
+                    r = <int *>view.buf
+                added = _data_updates_add(self.obj, r, n, merge)
+            finally:
+                if own:
+                    PyMem_Free(r)
+                PyBuffer_Release(&view)
+            return added
+        else:
+            rects = tuple(rects)
+            n = len(rects)
+            r = <int *>PyMem_Malloc(max(n, 1) * 4 * sizeof(int))
+            if r == NULL:
+                raise MemoryError
+            try:
+                for i in range(n):
+                    r[i*4], r[i*4+1], r[i*4+2], r[i*4+3] = rects[i]
+                added = _data_updates_add(self.obj, r, n, merge)
+            finally:
+                PyMem_Free(r)
+            return added
+
     property alpha:
         """Enable or disable alpha channel.
 
@@ -1339,20 +1544,10 @@ cdef class Image(Object):
 
 
     def __getbuffer__(self, Py_buffer *view, int flags):
-        view.buf = evas_object_image_data_get(self.obj, not view.readonly)
-        if view.buf == NULL:
-            raise SystemError("image has no allocated buffer.")
-        view.len = _data_size_get(self.obj)
-        view.format = "L"
-        view.ndim = 1
-        view.itemsize = 4
-        # TODO: Check flags, provide multidim if possible, handle other
-        #       colorspaces
+        _data_buffer_get(self.obj, view, flags, 0, 0, -1, -1, self)
 
     def __releasebuffer__(self, Py_buffer *view):
-        evas_object_image_data_set(self.obj, view.buf)
-        # TODO: Free possibly allocated memory here (shape, strides, suboffsets)
-
+        _data_buffer_release(self.obj, view)
 
     def on_image_preloaded_add(self, func, *a, **k):
         """Same as event_callback_add(EVAS_CALLBACK_IMAGE_PRELOADED, ...)"""
@@ -1415,6 +1610,37 @@ cdef class FilledImage(Image):
 #FIXME: Check if this is right
 _object_mapping_register("Evas.FilledImage", FilledImage)
 
+
+cdef class ImageDataRegion(object):
+    """A region of the raw pixel data of an :py:class:`Image`
+
+    Exports the pixels with the buffer protocol, see
+    :py:func:`Image.image_data_region_get`.
+
+    .. versionadded:: 1.27
+
+    """
+    cdef readonly Image image
+    cdef readonly int x, y, w, h
+    cdef readonly bint writable
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError("Use Image.image_data_region_get()")
+
+    def __repr__(self):
+        return "<%s(image=%#x, x=%d, y=%d, w=%d, h=%d)>" % (
+            type(self).__name__, <uintptr_t><void *>self.image,
+            self.x, self.y, self.w, self.h)
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        if self.writable:
+            flags |= PyBUF_WRITABLE
+        _data_buffer_get(self.image.obj, view, flags,
+                         self.x, self.y, self.w, self.h, self)
+
+    def __releasebuffer__(self, Py_buffer *view):
+        _data_buffer_release(self.image.obj, view)
+
 def extension_can_load(filename):
     """Check if a file extension is supported by :py:class:`Image`.
 
@@ -20,8 +20,8 @@ from efl.c_eo cimport efl_key_data_set, efl_key_data_get
 from efl.eo cimport Eo, EoIterator
 
 from cpython cimport Py_INCREF, Py_DECREF, PyObject_Call, \
-    PyMem_Malloc, PyMem_Free
-from libc.stdlib cimport malloc, calloc
+    PyMem_Malloc, PyMem_Free, PyTuple_New, PyTuple_SET_ITEM
+from libc.stdlib cimport malloc, calloc, realloc, free
 from libc.string cimport strdup
 
 #cdef object _smart_classes
@@ -94,6 +94,128 @@ cdef class SmartCbDescription:
             return _ctouni(self.desc.type)
 
 
+ctypedef struct _Smart_Layout_Rule:
+    Evas_Object *member
+    double rel_x, rel_y, rel_w, rel_h
+    double align_x, align_y
+    int offset_x, offset_y, offset_w, offset_h
+    bint resize_w, resize_h
+
+ctypedef struct _Smart_Layout:
+    Evas_Object *clipper    # the clipped smart clipper, never laid out
+    _Smart_Layout_Rule *rules
+    int count
+    int size
+
+
+cdef _Smart_Layout_Rule *_smart_layout_rule_find(_Smart_Layout *layout,
+                                                 Evas_Object *member) nogil:
+    cdef int i
+    for i in range(layout.count):
+        if layout.rules[i].member == member:
+            return &layout.rules[i]
+    return NULL
+
+
+cdef void _smart_layout_rule_apply(_Smart_Layout_Rule rule,
+                                   Evas_Coord x, Evas_Coord y,
+                                   Evas_Coord w, Evas_Coord h) nogil:
+    # the rule is a copy, the callbacks of the member may change the rules
+    cdef Evas_Coord mw, mh
+
+    evas_object_geometry_get(rule.member, NULL, NULL, &mw, &mh)
+    if rule.resize_w or rule.resize_h:
+        if rule.resize_w:
+            mw = <Evas_Coord>(rule.rel_w * w) + rule.offset_w
+        if rule.resize_h:
+            mh = <Evas_Coord>(rule.rel_h * h) + rule.offset_h
+        evas_object_resize(rule.member, mw, mh)
+    evas_object_move(rule.member,
+        x + <Evas_Coord>(rule.rel_x * w - rule.align_x * mw) + rule.offset_x,
+        y + <Evas_Coord>(rule.rel_y * h - rule.align_y * mh) + rule.offset_y)
+
+
+cdef void _smart_layout_apply(Evas_Object *o, _Smart_Layout *layout,
+                              Evas_Coord x, Evas_Coord y,
+                              Evas_Coord w, Evas_Coord h) nogil:
+    cdef int i = 0
+    # the rules may be changed by the callbacks of the members, the count
+    # is read again for each rule
+    while i < layout.count:
+        # members removed from the object keep their rule, but are left alone
+        if evas_object_smart_parent_get(layout.rules[i].member) == o:
+            _smart_layout_rule_apply(layout.rules[i], x, y, w, h)
+        i += 1
+
+
+cdef bint _smart_layout_partial(Evas_Object *o, _Smart_Layout *layout) nogil:
+    """Whether some members of the object have no rule."""
+    cdef:
+        Eina_List *members = evas_object_smart_members_get(o)
+        Eina_List *l = members
+        bint partial = 0
+
+    while l != NULL:
+        if l.data != layout.clipper and \
+                _smart_layout_rule_find(layout, <Evas_Object *>l.data) == NULL:
+            partial = 1
+            break
+        l = l.next
+    eina_list_free(members)
+    return partial
+
+
+cdef void _smart_layout_rule_remove(_Smart_Layout *layout,
+                                    _Smart_Layout_Rule *rule) nogil:
+    layout.count -= 1
+    rule[0] = layout.rules[layout.count]
+
+
+cdef void _smart_layout_member_del_cb(void *data, Evas *e,
+                                      Evas_Object *member, void *ei) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>data
+        _Smart_Layout_Rule *rule = _smart_layout_rule_find(layout, member)
+    if rule != NULL:
+        _smart_layout_rule_remove(layout, rule)
+
+
+cdef void _smart_layout_free_cb(void *data, Evas *e,
+                                Evas_Object *o, void *ei) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>data
+        int i
+
+    efl_key_data_set(o, "python-layout", NULL)
+    for i in range(layout.count):
+        evas_object_event_callback_del_full(layout.rules[i].member,
+            enums.EVAS_CALLBACK_DEL, _smart_layout_member_del_cb, layout)
+    free(layout.rules)
+    free(layout)
+
+
+cdef _Smart_Layout *_smart_layout_get(SmartObject obj, bint create) except? NULL:
+    cdef _Smart_Layout *layout
+
+    layout = <_Smart_Layout *>efl_key_data_get(obj.obj, "python-layout")
+    if layout != NULL or not create:
+        return layout
+
+    if obj._smart is None:
+        raise TypeError("member layouts need an object of a python Smart")
+
+    layout = <_Smart_Layout *>calloc(1, sizeof(_Smart_Layout))
+    if layout == NULL:
+        raise MemoryError
+    # the clipped smart class moves all the members and has its own clipper
+    if obj._smart.cls_def.add != NULL:
+        layout.clipper = evas_object_smart_clipped_clipper_get(obj.obj)
+    efl_key_data_set(obj.obj, "python-layout", layout)
+    evas_object_event_callback_add(obj.obj, enums.EVAS_CALLBACK_DEL,
+                                   _smart_layout_free_cb, layout)
+    return layout
+
+
 cdef void _smart_object_delete(Evas_Object *o) with gil:
     cdef:
         void *tmp
@@ -119,7 +241,7 @@ cdef void _smart_object_delete(Evas_Object *o) with gil:
         traceback.print_exc()
 
 
-cdef void _smart_object_move(Evas_Object *o, Evas_Coord x, Evas_Coord y) with gil:
+cdef void _smart_object_move_py(Evas_Object *o, Evas_Coord x, Evas_Coord y) with gil:
     cdef:
         void *tmp
         Smart cls
@@ -144,7 +266,7 @@ cdef void _smart_object_move(Evas_Object *o, Evas_Coord x, Evas_Coord y) with gi
         traceback.print_exc()
 
 
-cdef void _smart_object_resize(Evas_Object *o, Evas_Coord w, Evas_Coord h) with gil:
+cdef void _smart_object_resize_py(Evas_Object *o, Evas_Coord w, Evas_Coord h) with gil:
     cdef:
         void *tmp
         Smart cls
@@ -169,6 +291,53 @@ cdef void _smart_object_resize(Evas_Object *o, Evas_Coord w, Evas_Coord h) with
         traceback.print_exc()
 
 
+# Members with a layout rule are placed in C, the python move and resize
+# are only called when there is no layout or some members have no rule.
+
+cdef void _smart_object_move(Evas_Object *o, Evas_Coord x, Evas_Coord y) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>efl_key_data_get(o, "python-layout")
+        Evas_Coord w, h
+
+    if layout == NULL or _smart_layout_partial(o, layout):
+        _smart_object_move_py(o, x, y)
+    if layout != NULL:
+        evas_object_geometry_get(o, NULL, NULL, &w, &h)
+        _smart_layout_apply(o, layout, x, y, w, h)
+
+
+cdef void _smart_object_resize(Evas_Object *o, Evas_Coord w, Evas_Coord h) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>efl_key_data_get(o, "python-layout")
+        Evas_Coord x, y
+
+    if layout == NULL or _smart_layout_partial(o, layout):
+        _smart_object_resize_py(o, w, h)
+    if layout != NULL:
+        evas_object_geometry_get(o, &x, &y, NULL, NULL)
+        _smart_layout_apply(o, layout, x, y, w, h)
+
+
+cdef void _smart_object_layout_move(Evas_Object *o, Evas_Coord x, Evas_Coord y) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>efl_key_data_get(o, "python-layout")
+        Evas_Coord w, h
+
+    if layout != NULL:
+        evas_object_geometry_get(o, NULL, NULL, &w, &h)
+        _smart_layout_apply(o, layout, x, y, w, h)
+
+
+cdef void _smart_object_layout_resize(Evas_Object *o, Evas_Coord w, Evas_Coord h) nogil:
+    cdef:
+        _Smart_Layout *layout = <_Smart_Layout *>efl_key_data_get(o, "python-layout")
+        Evas_Coord x, y
+
+    if layout != NULL:
+        evas_object_geometry_get(o, &x, &y, NULL, NULL)
+        _smart_layout_apply(o, layout, x, y, w, h)
+
+
 cdef void _smart_object_show(Evas_Object *o) with gil:
     cdef:
         void *tmp
@@ -387,6 +556,45 @@ cdef class _SmartCb:
         object func
         tuple args
         dict kargs
+        # built once at registration: (obj, *args), or (obj, None, *args)
+        # when the callback gets the event_info
+        tuple call_args
+
+    cdef void _prepare(self):
+        if self.event_conv == NULL:
+            self.call_args = (self.obj,) + self.args
+        else:
+            self.call_args = (self.obj, None) + self.args
+        if not self.kargs:
+            self.kargs = None
+
+    cdef void _call(self, void *event_info):
+        cdef:
+            tuple call_args = self.call_args
+            object ei, item
+            Py_ssize_t i, n
+
+        try:
+            if event_info != NULL and self.event_conv != NULL:
+                # same as the prepared tuple, with the converted event_info
+                ei = self.event_conv(event_info)
+                n = len(self.call_args)
+                call_args = PyTuple_New(n)
+                Py_INCREF(self.obj)
+                PyTuple_SET_ITEM(call_args, 0, self.obj)
+                Py_INCREF(ei)
+                PyTuple_SET_ITEM(call_args, 1, ei)
+                for i in range(2, n):
+                    item = self.call_args[i]
+                    Py_INCREF(item)
+                    PyTuple_SET_ITEM(call_args, i, item)
+
+            if self.kargs is None:
+                self.func(*call_args)
+            else:
+                PyObject_Call(self.func, call_args, self.kargs)
+        except Exception:
+            traceback.print_exc()
 
 
 cdef object _smart_cb_pass_conv(void *addr):
@@ -398,54 +606,19 @@ cdef void _smart_callback(void *data, Evas_Object *o, void *event_info) with gil
         EINA_LOG_DOM_ERR(PY_EFL_EVAS_LOG_DOMAIN, "data is NULL!")
         return
 
+    # data is the list of the callbacks registered for the event, kept in
+    # the _smart_callback_specs dict of the object
     cdef:
-        void *tmp = NULL
-        SmartObject obj
-        object event, ei
+        list lst = <list>data
         _SmartCb spec
-        list tmp_args
-        list lst
 
-    tmp = efl_key_data_get(o, "python-eo")
-    if tmp == NULL:
-        EINA_LOG_DOM_ERR(PY_EFL_EVAS_LOG_DOMAIN, "obj is NULL!")
+    if len(lst) == 1:
+        # fast path, a single subscriber
+        (<_SmartCb>lst[0])._call(event_info)
         return
-    else:
-        obj = <SmartObject>tmp
 
-    event = <object>data
-    lst = <list>obj._smart_callback_specs[event]
-
-    for spec in lst:
-        if event_info == NULL:
-            try:
-                tmp_args = [spec.obj]
-                if spec.event_conv != NULL:
-                    tmp_args.append(None)
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
-        elif event_info != NULL and spec.event_conv == NULL:
-            #EINA_LOG_DOM_WARN(
-            #    PY_EFL_EVAS_LOG_DOMAIN,
-            #    'event_info for event "%s" is not NULL and there is no event_conv!',
-            #    <const char*>event
-            #    )
-            try:
-                tmp_args = [spec.obj]
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
-        else:
-            try:
-                tmp_args = [spec.obj]
-                tmp_args.append(spec.event_conv(event_info))
-                tmp_args.extend(spec.args)
-                PyObject_Call(spec.func, tuple(tmp_args), spec.kargs)
-            except Exception:
-                traceback.print_exc()
+    for spec in tuple(lst): # copy, callbacks can be removed meanwhile
+        spec._call(event_info)
 
 
 cdef class Smart(object):
@@ -477,12 +650,16 @@ cdef class Smart(object):
 
         Called in order to move object to given position.
 
-        Usually you move children here.
+        Usually you move children here. Not called when all the children
+        are placed by :meth:`SmartObject.member_layout_set` rules.
 
     .. staticmethod:: resize(obj, int w, int h)
 
         Called in order to resize object.
 
+        Not called when all the children are placed by
+        :meth:`SmartObject.member_layout_set` rules.
+
     .. staticmethod:: show(obj)
 
         Called in order to show the given element.
@@ -540,7 +717,7 @@ cdef class Smart(object):
             if "move" in self.__class__.__dict__:
                 cls_def.move = _smart_object_move
             else:
-                cls_def.move = NULL
+                cls_def.move = _smart_object_layout_move
 
             if "show" in self.__class__.__dict__:
                 cls_def.show = _smart_object_show
@@ -580,7 +757,7 @@ cdef class Smart(object):
         if "resize" in self.__class__.__dict__:
             cls_def.resize = _smart_object_resize
         else:
-            cls_def.resize = NULL
+            cls_def.resize = _smart_object_layout_resize
 
         if "calculate" in self.__class__.__dict__:
             cls_def.calculate = _smart_object_calculate
@@ -784,6 +961,136 @@ cdef class SmartObject(Object):
         """
         evas_object_smart_move_children_relative(self.obj, dx, dy)
 
+    def member_layout_set(self, Object member not None,
+                          double rel_x=0.0, double rel_y=0.0,
+                          int offset_x=0, int offset_y=0,
+                          rel_w=None, rel_h=None,
+                          int offset_w=0, int offset_h=0,
+                          double align_x=0.0, double align_y=0.0):
+        """Place a member relatively to the object, without calling python.
+
+        Once set, the member is moved, and optionally resized, in C every
+        time the object is moved or resized. :func:`Smart.move` and
+        :func:`Smart.resize` are only called while some members have no
+        rule, to let them place those, and the rules are applied after them.
+
+        From the object geometry ``x, y, w, h`` the member geometry is::
+
+            mw = rel_w * w + offset_w      # unchanged if rel_w is None
+            mh = rel_h * h + offset_h      # unchanged if rel_h is None
+            mx = x + rel_x * w - align_x * mw + offset_x
+            my = y + rel_y * h - align_y * mh + offset_y
+
+        For example ``rel_x=1.0, align_x=1.0, offset_x=-5`` keeps the member
+        5 pixels away from the right border of the object, and
+        ``rel_w=0.5, rel_h=1.0`` makes it as big as the left half.
+
+        The rule replaces any previous rule of the member, is applied
+        immediately and is dropped when the member is deleted.
+
+        .. note:: Objects of a clipped :class:`Smart` already move all their
+            members in C, the rules are applied when they are resized.
+
+        :param member: a member of this object
+        :type member: :class:`Object`
+        :raise ValueError: if **member** is not a member of this object
+        :raise TypeError: if the object doesn't use a python :class:`Smart`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            _Smart_Layout *layout
+            _Smart_Layout_Rule *rule
+            _Smart_Layout_Rule *rules
+            int size
+            Evas_Coord x, y, w, h
+
+        if evas_object_smart_parent_get(member.obj) != self.obj:
+            raise ValueError("%r is not a member of this object" % member)
+
+        layout = _smart_layout_get(self, 1)
+        rule = _smart_layout_rule_find(layout, member.obj)
+        if rule == NULL:
+            if layout.count == layout.size:
+                size = layout.size * 2 if layout.size > 0 else 4
+                rules = <_Smart_Layout_Rule *>realloc(layout.rules,
+                    sizeof(_Smart_Layout_Rule) * size)
+                if rules == NULL:
+                    raise MemoryError
+                layout.rules = rules
+                layout.size = size
+            rule = &layout.rules[layout.count]
+            layout.count += 1
+            evas_object_event_callback_add(member.obj,
+                enums.EVAS_CALLBACK_DEL, _smart_layout_member_del_cb, layout)
+
+        rule.member = member.obj
+        rule.rel_x = rel_x
+        rule.rel_y = rel_y
+        rule.offset_x = offset_x
+        rule.offset_y = offset_y
+        rule.resize_w = rel_w is not None
+        rule.rel_w = rel_w if rel_w is not None else 0.0
+        rule.offset_w = offset_w
+        rule.resize_h = rel_h is not None
+        rule.rel_h = rel_h if rel_h is not None else 0.0
+        rule.offset_h = offset_h
+        rule.align_x = align_x
+        rule.align_y = align_y
+
+        evas_object_geometry_get(self.obj, &x, &y, &w, &h)
+        _smart_layout_rule_apply(rule[0], x, y, w, h)
+
+    def member_layout_del(self, Object member not None):
+        """Remove the layout rule of a member.
+
+        The member is left where it is, and will be placed by
+        :func:`Smart.move` and :func:`Smart.resize` again.
+
+        :raise ValueError: if **member** has no rule
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            _Smart_Layout *layout = _smart_layout_get(self, 0)
+            _Smart_Layout_Rule *rule = NULL
+
+        if layout != NULL:
+            rule = _smart_layout_rule_find(layout, member.obj)
+        if rule == NULL:
+            raise ValueError("%r has no layout rule" % member)
+
+        evas_object_event_callback_del_full(member.obj,
+            enums.EVAS_CALLBACK_DEL, _smart_layout_member_del_cb, layout)
+        _smart_layout_rule_remove(layout, rule)
+
+    def member_layout_clear(self):
+        """Remove all the members layout rules.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef _Smart_Layout *layout = _smart_layout_get(self, 0)
+
+        while layout != NULL and layout.count > 0:
+            evas_object_event_callback_del_full(layout.rules[0].member,
+                enums.EVAS_CALLBACK_DEL, _smart_layout_member_del_cb, layout)
+            _smart_layout_rule_remove(layout, &layout.rules[0])
+
+    property member_layout_count:
+        """The number of members with a layout rule.
+
+        :type: int
+
+        .. versionadded:: 1.27
+
+        """
+        def __get__(self):
+            cdef _Smart_Layout *layout = _smart_layout_get(self, 0)
+            return layout.count if layout != NULL else 0
+
     def changed(self):
         """Mark object as changed, so it's :py:func:`calculate()` will be called.
 
@@ -879,13 +1186,14 @@ cdef class SmartObject(Object):
         spec.func = func
         spec.args = args
         spec.kargs = kargs
+        spec._prepare()
 
         lst = <list>self._smart_callback_specs.setdefault(event, [])
         if not lst:
             evas_object_smart_callback_add(self.obj,
                 <const char*>spec.event,
                 _smart_callback,
-                <void *>spec.event
+                <void *>lst
                 )
         lst.append(spec)
 
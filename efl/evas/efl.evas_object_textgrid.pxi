@@ -16,6 +16,33 @@
 # along with this Python-EFL.  If not, see <http://www.gnu.org/licenses/>.
 
 from libc.stdlib cimport malloc
+from cpython.array cimport array, clone
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.buffer cimport Py_buffer, PyObject_GetBuffer, PyBuffer_Release, \
+    PyBUF_SIMPLE, PyBUF_FORMAT, PyBUF_ND
+
+# Bits of the flags plane used by Textgrid.rows_update() and rows_get()
+EVAS_TEXTGRID_CELL_BOLD = 1 << 0
+EVAS_TEXTGRID_CELL_ITALIC = 1 << 1
+EVAS_TEXTGRID_CELL_UNDERLINE = 1 << 2
+EVAS_TEXTGRID_CELL_STRIKETHROUGH = 1 << 3
+EVAS_TEXTGRID_CELL_FG_EXTENDED = 1 << 4
+EVAS_TEXTGRID_CELL_BG_EXTENDED = 1 << 5
+EVAS_TEXTGRID_CELL_DOUBLE_WIDTH = 1 << 6
+
+cdef array _textgrid_codepoints_template = array('I')
+
+
+cdef int _textgrid_plane_get(object plane, Py_buffer *view, Py_ssize_t n,
+                             name) except -1:
+    # A contiguous plane of n bytes, one per cell
+    PyObject_GetBuffer(plane, view, PyBUF_SIMPLE)
+    if view.len != n:
+        PyBuffer_Release(view)
+        raise ValueError(
+            "%s must have %d items, one per cell, not %d" % (
+                name, n, view.len))
+    return 0
 
 
 cdef class TextgridCell(object):
@@ -448,4 +475,201 @@ cdef class Textgrid(Object):
         """
         evas_object_textgrid_update_add(self.obj, x, y, w, h)
 
+    def rows_update(self, int y, codepoints, fg=None, bg=None, flags=None):
+        """Set the content of whole rows at once, and mark them as updated.
+
+        :param int y: The first row to set
+        :param codepoints: The characters of the cells, row after row, as
+            a string or as a contiguous buffer of 32 bit unsigned integers
+            (unicode codepoints) or of bytes
+        :param fg: A contiguous buffer (fe: bytes, bytearray or an uint8 numpy
+            array) with the foreground palette index of each cell, or
+            ``None`` to leave them unchanged
+        :param bg: Same as **fg**, for the background palette index
+        :param flags: Same as **fg**, with the style of each cell as a
+            combination of the ``EVAS_TEXTGRID_CELL_*`` bits
+        :raise ValueError: if the number of cells is not a multiple of the
+            grid width, if the rows do not fit in the grid or if the planes
+            sizes do not match
+
+        The number of rows set is the number of codepoints divided by the
+        width of the grid. This replaces the :py:meth:`cellrow_get`,
+        :py:meth:`cellrow_set` and :py:meth:`update_add` sequence, without
+        creating one python object per cell, so a whole screen can be blitted
+        in a single call, fe::
+
+            tg.rows_update(0, b"hello world".ljust(w * h),
+                           fg=bytes([1]) * (w * h))
+
+        The flags bits are:
+
+        - EVAS_TEXTGRID_CELL_BOLD
+        - EVAS_TEXTGRID_CELL_ITALIC
+        - EVAS_TEXTGRID_CELL_UNDERLINE
+        - EVAS_TEXTGRID_CELL_STRIKETHROUGH
+        - EVAS_TEXTGRID_CELL_FG_EXTENDED
+        - EVAS_TEXTGRID_CELL_BG_EXTENDED
+        - EVAS_TEXTGRID_CELL_DOUBLE_WIDTH
+
+        .. seealso:: :py:meth:`rows_get`
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            int gw, gh, rows, row, x
+            Py_ssize_t n, i = 0
+            unicode text = None
+            Py_buffer cp_view, fg_view, bg_view, fl_view
+            bint have_cp = 0, have_fg = 0, have_bg = 0, have_fl = 0
+            unsigned char *cp8 = NULL
+            unsigned char *fgp = NULL
+            unsigned char *bgp = NULL
+            unsigned char *flp = NULL
+            unsigned int *cp32 = NULL
+            unsigned char f
+            Evas_Textgrid_Cell *cells
+
+        evas_object_textgrid_size_get(self.obj, &gw, &gh)
+        if gw <= 0:
+            raise ValueError("the textgrid has no columns")
+
+        try:
+            if isinstance(codepoints, unicode):
+                text = codepoints
+                n = len(text)
+            else:
+                PyObject_GetBuffer(codepoints, &cp_view,
+                                   PyBUF_FORMAT | PyBUF_ND)
+                have_cp = 1
+                if cp_view.itemsize == 4:
+                    cp32 = <unsigned int *>cp_view.buf
+                elif cp_view.itemsize == 1:
+                    cp8 = <unsigned char *>cp_view.buf
+                else:
+                    raise ValueError(
+                        "codepoints must be 8 or 32 bit unsigned integers")
+                n = cp_view.len // cp_view.itemsize
+
+            if n % gw != 0:
+                raise ValueError(
+                    "the number of cells (%d) is not a multiple of the grid "
+                    "width (%d)" % (n, gw))
+            rows = n // gw
+            if y < 0 or y + rows > gh:
+                raise ValueError(
+                    "rows %d to %d out of the grid height (%d)" % (
+                        y, y + rows, gh))
+
+            if fg is not None:
+                _textgrid_plane_get(fg, &fg_view, n, "fg")
+                have_fg = 1
+                fgp = <unsigned char *>fg_view.buf
+            if bg is not None:
+                _textgrid_plane_get(bg, &bg_view, n, "bg")
+                have_bg = 1
+                bgp = <unsigned char *>bg_view.buf
+            if flags is not None:
+                _textgrid_plane_get(flags, &fl_view, n, "flags")
+                have_fl = 1
+                flp = <unsigned char *>fl_view.buf
+
+            for row in range(y, y + rows):
+                cells = evas_object_textgrid_cellrow_get(self.obj, row)
+                if cells == NULL:
+                    raise RuntimeError("Could not get the row %d" % row)
+                for x in range(gw):
+                    if text is not None:
+                        cells[x].codepoint = <Py_UCS4>text[i]
+                    elif cp32 != NULL:
+                        cells[x].codepoint = cp32[i]
+                    else:
+                        cells[x].codepoint = cp8[i]
+                    if fgp != NULL:
+                        cells[x].fg = fgp[i]
+                    if bgp != NULL:
+                        cells[x].bg = bgp[i]
+                    if flp != NULL:
+                        f = flp[i]
+                        cells[x].bold = f & 1
+                        cells[x].italic = (f >> 1) & 1
+                        cells[x].underline = (f >> 2) & 1
+                        cells[x].strikethrough = (f >> 3) & 1
+                        cells[x].fg_extended = (f >> 4) & 1
+                        cells[x].bg_extended = (f >> 5) & 1
+                        cells[x].double_width = (f >> 6) & 1
+                    i += 1
+                evas_object_textgrid_cellrow_set(self.obj, row, cells)
+            if rows > 0:
+                evas_object_textgrid_update_add(self.obj, 0, y, gw, rows)
+        finally:
+            if have_cp:
+                PyBuffer_Release(&cp_view)
+            if have_fg:
+                PyBuffer_Release(&fg_view)
+            if have_bg:
+                PyBuffer_Release(&bg_view)
+            if have_fl:
+                PyBuffer_Release(&fl_view)
+
+    def rows_get(self, int y=0, int h=-1):
+        """Get the content of whole rows at once.
+
+        :param int y: The first row to get
+        :param int h: The number of rows to get, -1 means up to the last one
+        :return: The codepoints, fg, bg and flags planes of the cells, row
+            after row, see :py:meth:`rows_update` for their meaning
+        :rtype: (array.array of type 'I', bytearray, bytearray, bytearray)
+
+        The returned planes are copies, they can be modified and given back
+        to :py:meth:`rows_update`.
+
+        .. versionadded:: 1.27
+
+        """
+        cdef:
+            int gw, gh, row, x
+            Py_ssize_t n, i = 0
+            array codepoints
+            bytearray fg, bg, flags
+            unsigned int *cpp
+            char *fgp
+            char *bgp
+            char *flp
+            Evas_Textgrid_Cell *cells
+            Evas_Textgrid_Cell *c
+
+        evas_object_textgrid_size_get(self.obj, &gw, &gh)
+        if h < 0:
+            h = gh - y
+        if y < 0 or y + h > gh:
+            raise ValueError(
+                "rows %d to %d out of the grid height (%d)" % (y, y + h, gh))
+
+        n = <Py_ssize_t>gw * h
+        codepoints = clone(_textgrid_codepoints_template, n, False)
+        fg = bytearray(n)
+        bg = bytearray(n)
+        flags = bytearray(n)
+        cpp = codepoints.data.as_uints
+        fgp = PyByteArray_AS_STRING(fg)
+        bgp = PyByteArray_AS_STRING(bg)
+        flp = PyByteArray_AS_STRING(flags)
+
+        for row in range(y, y + h):
+            cells = evas_object_textgrid_cellrow_get(self.obj, row)
+            if cells == NULL:
+                raise RuntimeError("Could not get the row %d" % row)
+            for x in range(gw):
+                c = &cells[x]
+                cpp[i] = c.codepoint
+                fgp[i] = c.fg
+                bgp[i] = c.bg
+                flp[i] = (c.bold | c.italic << 1 | c.underline << 2 |
+                          c.strikethrough << 3 | c.fg_extended << 4 |
+                          c.bg_extended << 5 | c.double_width << 6)
+                i += 1
+
+        return codepoints, fg, bg, flags
+
 _object_mapping_register("Evas.Textgrid", Textgrid)
@@ -20,7 +20,10 @@ from efl.eina cimport Eina_Log_Domain, Eina_Log_Level, \
     eina_log_level_get, eina_log_domain_level_get, eina_log_domain_level_set, \
     eina_log_print, EINA_LOG_DOM_DBG, EINA_LOG_DOM_INFO, EINA_LOG_DOM_WARN, \
     EINA_LOG_DOM_ERR, EINA_LOG_DOM_CRIT
-from cpython cimport PyUnicode_AsUTF8String, PY_VERSION_HEX
+from cpython cimport PyUnicode_AsUTF8String, PY_VERSION_HEX, \
+    PyMem_Malloc, PyMem_Free
+from libc.stdint cimport uintptr_t
+from libc.string cimport strcmp
 
 import logging
 import types
@@ -28,9 +31,11 @@ import types
 cdef extern from "stdarg.h":
     ctypedef struct va_list:
         pass
+    void va_copy(va_list dest, va_list src)
+    void va_end(va_list ap)
 
 cdef extern from "stdio.h":
-    int vsprintf(char *, const char *fmt, va_list args)
+    int vsnprintf(char *, size_t size, const char *fmt, va_list args)
 
 cdef extern from "Python.h":
     void PyEval_InitThreads()
@@ -45,7 +50,44 @@ cdef tuple log_levels = (
 
 cdef dict loggers = dict()
 
-cdef char log_buf[1024]
+# The handler getting the records instead of the loggers, see queue_set()
+cdef object queue_handler = None
+
+# Decoded domain, file and function names, keyed by the address of the C
+# string. The names are kept too, to detect a reused address.
+cdef dict names_cache = dict()
+# The loggers of the domains, keyed by the address of the domain name
+cdef dict domains_cache = dict()
+cdef int NAMES_CACHE_MAX = 4096
+
+
+cdef unicode cached_name_get(const char *s):
+    cdef tuple cached
+
+    if s == NULL:
+        return u""
+    cached = names_cache.get(<uintptr_t>s)
+    if cached is not None and strcmp(<bytes>cached[0], s) == 0:
+        return cached[1]
+
+    if len(names_cache) >= NAMES_CACHE_MAX:
+        names_cache.clear()
+    b = <bytes>s
+    u = b.decode('UTF-8', 'replace')
+    names_cache[<uintptr_t>s] = (b, u)
+    return u
+
+
+cdef object domain_logger_get(const Eina_Log_Domain *d):
+    cdef tuple cached = domains_cache.get(<uintptr_t>d.name)
+
+    if cached is not None and strcmp(<bytes>cached[0], d.name) == 0:
+        return cached[1]
+
+    name = cached_name_get(d.name)
+    logger = loggers.get(name, loggers["efl"])
+    domains_cache[<uintptr_t>d.name] = (<bytes>d.name, logger)
+    return logger
 
 
 PyEval_InitThreads()
@@ -55,22 +97,75 @@ cdef void py_eina_log_print_cb(const Eina_Log_Domain *d, Eina_Log_Level level,
     const char *fmt, void *data, va_list args) with gil:
 
     cdef:
-        unicode msg, name, ufile, ufnc
+        unicode msg
         object rec, logger
+        int lvl, n
+        # the stack is per thread
+        char buf[1024]
+        char *big = NULL
+        va_list args_copy
+
+    if level < 0:
+        lvl = log_levels[0]
+    elif level >= len(log_levels):
+        lvl = log_levels[len(log_levels) - 1]
+    else:
+        lvl = log_levels[level]
+
+    logger = domain_logger_get(d)
+    if not logger.isEnabledFor(lvl):
+        # nobody wants it, don't even format it
+        return
+
+    va_copy(args_copy, args)
+    n = vsnprintf(buf, sizeof(buf), fmt, args)
+    try:
+        if n >= <int>sizeof(buf):
+            big = <char *>PyMem_Malloc(n + 1)
+            if big != NULL:
+                vsnprintf(big, n + 1, fmt, args_copy)
+                msg = big[:n].decode('UTF-8', 'replace')
+            else:
+                msg = buf.decode('UTF-8', 'replace')
+        else:
+            msg = buf[:n if n > 0 else 0].decode('UTF-8', 'replace')
+    finally:
+        va_end(args_copy)
+        PyMem_Free(big)
+
+    rec = logging.LogRecord(cached_name_get(d.name), lvl,
+                            cached_name_get(file), line, msg, None, None,
+                            cached_name_get(fnc))
+    if queue_handler is not None:
+        queue_handler.handle(rec)
+    else:
+        logger.handle(rec)
 
-    vsprintf(log_buf, fmt, args)
+eina_log_print_cb_set(py_eina_log_print_cb, NULL)
 
-    msg = log_buf.decode('UTF-8', 'replace')
-    name = d.name.decode('UTF-8', 'replace')
-    ufile = file.decode('UTF-8', 'replace')
-    ufnc = fnc.decode('UTF-8', 'replace')
+def queue_set(handler):
+    """Send the EFL log records to a handler, instead of the loggers.
 
-    rec = logging.LogRecord(
-        name, log_levels[level], ufile, line, msg, None, None, ufnc)
-    logger = loggers.get(name, loggers["efl"])
-    logger.handle(rec)
+    The records are built, for the enabled levels only, but not formatted
+    nor handled in the thread that emitted them. This is meant for a
+    :py:class:`logging.handlers.QueueHandler`, with a
+    :py:class:`logging.handlers.QueueListener` passing the records to the
+    real handlers from another thread::
 
-eina_log_print_cb_set(py_eina_log_print_cb, NULL)
+        q = queue.Queue()
+        listener = QueueListener(q, logging.StreamHandler())
+        listener.start()
+        efl.utils.logger.queue_set(QueueHandler(q))
+
+    :param handler: The handler getting all the records, or ``None`` to
+        go back to the loggers
+    :type handler: :py:class:`logging.Handler`
+
+    .. versionadded:: 1.27
+
+    """
+    global queue_handler
+    queue_handler = handler
 
 def setLevel(self, lvl):
     cname = self.name
@@ -85,6 +180,7 @@ class PyEFLLogger(logging.Logger):
         if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
         self.eina_log_domain = eina_log_domain_register(cname, NULL)
         loggers[name] = self
+        domains_cache.clear()
         logging.Logger.__init__(self, name)
         if PY_VERSION_HEX < 0x03000000:
             self.setLevel = types.MethodType(setLevel, self, type(self))
@@ -102,6 +198,7 @@ cdef object add_logger(object name):
         if isinstance(cname, unicode): cname = PyUnicode_AsUTF8String(cname)
         log.eina_log_domain = eina_log_domain_register(cname, NULL)
         loggers[name] = log
+        domains_cache.clear()
         lvl = log.getEffectiveLevel()
         eina_log_domain_level_set(cname, log_levels.index(lvl))
         if PY_VERSION_HEX < 0x03000000:
@@ -124,5 +221,7 @@ rootlog.propagate = False
 
 cdef public int PY_EFL_LOG_DOMAIN = rootlog.eina_log_domain
 
-def logger_test_dbg():
-    EINA_LOG_DOM_DBG(PY_EFL_LOG_DOMAIN, "test message")
+def logger_test_dbg(int count=1):
+    cdef int i
+    for i in range(count):
+        EINA_LOG_DOM_DBG(PY_EFL_LOG_DOMAIN, "test message")
@@ -103,12 +103,13 @@ cdef extern from "Eo.h":
     void efl_unref(const Eo *obj)
     int efl_ref_get(const Eo *obj)
 
-    void efl_wref_add(Eo **wref)
+    void efl_wref_add(Eo *obj, Eo **wref)
+    void efl_wref_del(Eo *obj, Eo **wref)
 
     const Efl_Class *efl_object_class_get()
 
-    void  efl_key_data_set(Eo *obj, const char *key, const void *data)
-    void *efl_key_data_get(Eo *obj, const char *key)
+    void  efl_key_data_set(Eo *obj, const char *key, const void *data) nogil
+    void *efl_key_data_get(Eo *obj, const char *key) nogil
 
     const Efl_Class *efl_class_get(const Eo *obj)
     const char *efl_class_name_get(const Efl_Class *klass)
@@ -260,11 +260,15 @@ cdef class Exe(object):
 
 cdef class ExeEventFilter(object):
     cdef Ecore_Exe *exe
-    cdef Ecore_Event_Handler *handler
+    cdef bint registered
     cdef readonly object owner
     cdef readonly int event_type
     cdef object callbacks
 
+    cdef int _register(self) except 0
+    cdef void _unregister(self)
+    cdef int _dispatch(self, void *event) except 0
+
 
 cdef class EventHandler(object):
     cdef Ecore_Event_Handler *obj
@@ -328,10 +332,16 @@ cdef class EventExeDel(Event):
 
 
 cdef class EventExeData(Event):
+    cdef Ecore_Exe_Event_Data *obj
     cdef readonly object exe
-    cdef readonly object data
     cdef readonly object size
-    cdef readonly object lines
+    cdef object _raw
+    cdef object _raw_lines
+    cdef object _text
+    cdef object _lines
+
+    cdef object _raw_lines_get(self)
+    cdef void _release(self)
 
 
 cdef class FileDownload:
@@ -117,6 +117,13 @@ cdef extern from "Ecore_Con.h":
 cdef class Url(Eo):
     # we cannot use Eo.obj here because Url is no more eo objects in C
     cdef Ecore_Con_Url *obj2
+    cdef bint _buffered, _streaming, _overflow
+    cdef Py_ssize_t _max_size, _received
+    cdef bytearray _body
+    cdef object _chunk_func, _chunk_args, _chunk_kargs
+    cdef void _stream_update(self)
+    cdef void _stream_reset(self)
+    cdef int _stream_data(self, Ecore_Con_Event_Url_Data *event) except -1
 
 cdef class Lookup(object):
     cdef object done_cb
@@ -145,6 +152,10 @@ cdef class EventUrlData(Event):
 cdef class ConEventFilter(object):
     cdef dict callbacks
     cdef dict handlers
-    cdef callback_add(self, int ev_type, Eo obj, object func, tuple args, dict kargs)
-    cdef callback_del(self, int ev_type, Eo obj, object func, tuple args, dict kargs)
-    cdef callback_del_full(self, Eo obj)
+    cdef dict handlers_count
+    cdef Eina_Hash *objects
+    cdef callback_add(self, int ev_type, Url obj, object func, tuple args, dict kargs)
+    cdef callback_del(self, int ev_type, Url obj, object func, tuple args, dict kargs)
+    cdef callback_del_full(self, Url obj)
+    cdef stream_set(self, Url obj, bint enable)
+    cdef _handler_ref(self, int ev_type, int count)
@@ -318,6 +318,7 @@ cdef extern from "Edje.h":
 cdef class Message:
     cdef int _type
     cdef int _id
+    cdef void _release(self)
 
 
 cdef class MessageSignal(Message):
@@ -342,10 +343,24 @@ cdef class MessageStringSet(Message):
 
 cdef class MessageIntSet(Message):
     cdef Edje_Message_Int_Set *obj
+    cdef bytes _values
+    cdef int _count
+    cdef Py_ssize_t _shape_strides[2]
+    cdef int _copy(self) except -1
+    cdef void _release(self)
+    cdef const int *_vals(self) except NULL
+    cdef int _len(self) except -1
 
 
 cdef class MessageFloatSet(Message):
     cdef Edje_Message_Float_Set *obj
+    cdef bytes _values
+    cdef int _count
+    cdef Py_ssize_t _shape_strides[2]
+    cdef int _copy(self) except -1
+    cdef void _release(self)
+    cdef const double *_vals(self) except NULL
+    cdef int _len(self) except -1
 
 
 cdef class MessageStringInt(Message):
@@ -405,6 +420,10 @@ cdef class Edje(Object):
     cdef object _text_change_cb
     cdef object _message_handler_cb
     cdef object _signal_callbacks
+    cdef list _signal_batch_pending
+    cdef object _signal_batch_enterer
+
+    cdef void _signal_batch_schedule(self)
 
     cdef void message_send_int(self, int id, int data)
     cdef void message_send_float(self, int id, float data)
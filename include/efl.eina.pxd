@@ -120,7 +120,7 @@ cdef extern from "Eina.h":
     int               eina_stringshare_strlen(Eina_Stringshare *str)
     Eina_Bool         eina_stringshare_replace(Eina_Stringshare **p_str, const char *news)
 
-    Eina_List *eina_list_free(Eina_List *list)
+    Eina_List *eina_list_free(Eina_List *list) nogil
     Eina_List *eina_list_append(Eina_List *list, void *data)
     Eina_List *eina_list_prepend(Eina_List *list, void *data)
     Eina_List *eina_list_append(Eina_List *list, void *data)
@@ -136,7 +136,7 @@ cdef extern from "Eina.h":
     Eina_List *eina_list_demote_list(Eina_List *list, Eina_List *move_list)
     void *eina_list_data_find(Eina_List *list, void *data)
     Eina_List *eina_list_data_find_list(Eina_List *list, void *data)
-    Eina_List *eina_list_free(Eina_List *list)
+    Eina_List *eina_list_free(Eina_List *list) nogil
     void *eina_list_nth(Eina_List *list, unsigned int n)
     Eina_List *eina_list_nth_list(Eina_List *list, unsigned int n)
     Eina_List *eina_list_reverse(Eina_List *list)
@@ -158,6 +158,8 @@ cdef extern from "Eina.h":
     unsigned int eina_list_count(Eina_List *list)
 
     Eina_Hash *eina_hash_string_superfast_new(Eina_Free_Cb data_free_cb)
+    Eina_Hash *eina_hash_pointer_new(Eina_Free_Cb data_free_cb)
+    void       eina_hash_free_buckets(Eina_Hash *hash)
     Eina_Bool  eina_hash_add(Eina_Hash *hash, const void *key, const void *data)
     Eina_Bool eina_hash_del(Eina_Hash  *hash, const void *key, const void *data)
     void *eina_hash_find(Eina_Hash *hash, const void *key)
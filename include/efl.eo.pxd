@@ -22,13 +22,23 @@ cdef:
     class Eo(object):
         cdef:
             cEo *obj
-            readonly dict data
+            dict _data
             dict internal_data
+            object _legacy_parent
+            cEo *_legacy_parent_obj
 
             int _set_obj(self, cEo *obj) except 0
             int _set_properties_from_keyword_args(self, dict kwargs) except 0
+            object _legacy_parent_get(self)
+            int _legacy_parent_set(self, Eo parent) except 0
             #_add_obj(self, Eo_Class *klass, cEo *parent)
 
+        # internal_data is only allocated when something is stored in it
+        cdef inline dict _internal_data(self):
+            if self.internal_data is None:
+                self.internal_data = dict()
+            return self.internal_data
+
     class EoIterator:
         cdef Eina_Iterator *itr
         @staticmethod
@@ -94,6 +94,7 @@ cdef extern from "Evas.h":
         EVAS_COLORSPACE_YCBCR422601_PL
         EVAS_COLORSPACE_YCBCR420NV12601_PL
         EVAS_COLORSPACE_YCBCR420TM12601_PL
+        EVAS_COLORSPACE_AGRY88
 
     ctypedef enum Evas_Object_Table_Homogeneous_Mode:
         EVAS_OBJECT_TABLE_HOMOGENEOUS_NONE
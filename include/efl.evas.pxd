@@ -40,8 +40,14 @@ cdef extern from "Evas.h":
     ctypedef int Evas_Coord
     ctypedef int Evas_Angle
     ctypedef int Evas_Font_Size
+    ctypedef short Evas_Callback_Priority
     ctypedef unsigned long long Evas_Modifier_Mask
 
+    enum:
+        EVAS_CALLBACK_PRIORITY_BEFORE
+        EVAS_CALLBACK_PRIORITY_DEFAULT
+        EVAS_CALLBACK_PRIORITY_AFTER
+
 
     ####################################################################
     # Structures
@@ -213,6 +219,7 @@ cdef extern from "Evas.h":
         Evas_Device *dev
 
     ctypedef struct Evas_Event_Multi_Move:
+        int device
         double radius
         double radius_x
         double radius_y
@@ -336,7 +343,7 @@ cdef extern from "Evas.h":
     Eina_List   *evas_objects_at_xy_get(const Evas *e, Evas_Coord x, Evas_Coord y, Eina_Bool include_pass_events_objects, Eina_Bool include_hidden_objects)
     Eina_List   *evas_objects_in_rectangle_get(const Evas *e, Evas_Coord x, Evas_Coord y, Evas_Coord w, Evas_Coord h, Eina_Bool include_pass_events_objects, Eina_Bool include_hidden_objects)
 
-    void       evas_damage_rectangle_add(Evas *e, int x, int y, int w, int h)
+    void       evas_damage_rectangle_add(Evas *e, int x, int y, int w, int h) nogil
     void       evas_obscured_rectangle_add(Evas *e, int x, int y, int w, int h)
     void       evas_obscured_clear(Evas *e)
     Eina_List *evas_render_updates(Evas *e)
@@ -415,9 +422,9 @@ cdef extern from "Evas.h":
     Evas_Object *evas_object_bottom_get(const Evas *e)
     Evas_Object *evas_object_top_get(const Evas *e)
 
-    void evas_object_move(Evas_Object *obj, Evas_Coord x, Evas_Coord y)
-    void evas_object_resize(Evas_Object *obj, Evas_Coord w, Evas_Coord h)
-    void evas_object_geometry_get(const Evas_Object *obj, Evas_Coord *x, Evas_Coord *y, Evas_Coord *w, Evas_Coord *h)
+    void evas_object_move(Evas_Object *obj, Evas_Coord x, Evas_Coord y) nogil
+    void evas_object_resize(Evas_Object *obj, Evas_Coord w, Evas_Coord h) nogil
+    void evas_object_geometry_get(const Evas_Object *obj, Evas_Coord *x, Evas_Coord *y, Evas_Coord *w, Evas_Coord *h) nogil
 
     void evas_object_size_hint_min_get(const Evas_Object *obj, Evas_Coord *w, Evas_Coord *h)
     void evas_object_size_hint_min_set(Evas_Object *obj, Evas_Coord w, Evas_Coord h)
@@ -459,7 +466,7 @@ cdef extern from "Evas.h":
     void   evas_object_scale_set(Evas_Object *obj, double scale)
     double evas_object_scale_get(const Evas_Object *obj)
 
-    void evas_object_color_set(Evas_Object *obj, int r, int g, int b, int a)
+    void evas_object_color_set(Evas_Object *obj, int r, int g, int b, int a) nogil
     void evas_object_color_get(const Evas_Object *obj, int *r, int *g, int *b, int *a)
 
     void evas_color_argb_premul(int a, int *r, int *g, int *b)
@@ -481,10 +488,13 @@ cdef extern from "Evas.h":
     int evas_async_events_process()
 
     void  evas_object_event_callback_add(Evas_Object *obj, Evas_Callback_Type type, Evas_Object_Event_Cb func, const void *data)
+    void  evas_object_event_callback_priority_add(Evas_Object *obj, Evas_Callback_Type type, Evas_Callback_Priority priority, Evas_Object_Event_Cb func, const void *data)
     void *evas_object_event_callback_del(Evas_Object *obj, Evas_Callback_Type type, Evas_Object_Event_Cb func)
+    void *evas_object_event_callback_del_full(Evas_Object *obj, Evas_Callback_Type type, Evas_Object_Event_Cb func, const void *data) nogil
 
     void  evas_event_callback_add(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func, const void *data)
     void *evas_event_callback_del(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func)
+    void *evas_event_callback_del_full(Evas *e, Evas_Callback_Type type, Evas_Event_Cb func, const void *data)
 
     void      evas_object_pass_events_set(Evas_Object *obj, Eina_Bool p)
     Eina_Bool evas_object_pass_events_get(const Evas_Object *obj)
@@ -525,8 +535,8 @@ cdef extern from "Evas.h":
     Evas_Object   *evas_object_smart_add(Evas *e, Evas_Smart *s)
     void           evas_object_smart_member_add(Evas_Object *obj, Evas_Object *smart_obj)
     void           evas_object_smart_member_del(Evas_Object *obj)
-    Evas_Object   *evas_object_smart_parent_get(const Evas_Object *obj)
-    Eina_List     *evas_object_smart_members_get(const Evas_Object *obj)
+    Evas_Object   *evas_object_smart_parent_get(const Evas_Object *obj) nogil
+    Eina_List     *evas_object_smart_members_get(const Evas_Object *obj) nogil
     Evas_Smart    *evas_object_smart_smart_get(const Evas_Object *obj)
     void          *evas_object_smart_data_get(const Evas_Object *obj)
     void           evas_object_smart_data_set(Evas_Object *obj, void *data)
@@ -541,6 +551,7 @@ cdef extern from "Evas.h":
     void           evas_object_smart_move_children_relative(Evas_Object *obj, int dx, int dy)
     Eina_Iterator *evas_object_smart_iterator_new(const Evas_Object_Smart *obj)
     void           evas_object_smart_clipped_smart_set(Evas_Smart_Class *sc)
+    Evas_Object   *evas_object_smart_clipped_clipper_get(const Evas_Object *obj)
     Eina_Bool      evas_object_smart_callbacks_descriptions_set(Evas_Object_Smart *obj, const Evas_Smart_Cb_Description *descriptions)
     void           evas_object_smart_callbacks_descriptions_get(const Evas_Object_Smart *obj, const Evas_Smart_Cb_Description ***class_descriptions, unsigned int *class_count, const Evas_Smart_Cb_Description ***instance_descriptions, unsigned int *instance_count)
     void           evas_object_smart_callback_description_find(const Evas_Object_Smart *obj, const char *name, const Evas_Smart_Cb_Description **class_description, const Evas_Smart_Cb_Description **instance_description)
@@ -590,7 +601,7 @@ cdef extern from "Evas.h":
     void                evas_object_image_data_set(Evas_Object *obj, void *data)
     void               *evas_object_image_data_get(const Evas_Object *obj, Eina_Bool for_writing)
     # TODO: void                *evas_object_image_data_convert(Evas_Object *obj, Evas_Colorspace to_cspace)
-    # TODO: void                evas_object_image_data_copy_set(Evas_Object *obj, void *data)
+    void                evas_object_image_data_copy_set(Evas_Object *obj, void *data)
     void                evas_object_image_data_update_add(Evas_Object *obj, int x, int y, int w, int h)
     void                evas_object_image_alpha_set(Evas_Object *obj, Eina_Bool has_alpha)
     Eina_Bool           evas_object_image_alpha_get(const Evas_Object *obj)
@@ -788,19 +799,19 @@ cdef extern from "Evas.h":
     ####################################################################
     # Evas Map
     #
-    Evas_Map       *evas_map_new(int count)
+    Evas_Map       *evas_map_new(int count) nogil
 
-    void            evas_object_map_enable_set(Evas_Object *obj, Eina_Bool enabled)
+    void            evas_object_map_enable_set(Evas_Object *obj, Eina_Bool enabled) nogil
     Eina_Bool       evas_object_map_enable_get(const Evas_Object *obj)
-    void            evas_object_map_set(Evas_Object *obj, const Evas_Map *map)
+    void            evas_object_map_set(Evas_Object *obj, const Evas_Map *map) nogil
     const Evas_Map *evas_object_map_get(const Evas_Object *obj)
 
     void            evas_map_util_points_populate_from_object_full(Evas_Map *m, const Evas_Object *obj, Evas_Coord z)
     void            evas_map_util_points_populate_from_object(Evas_Map *m, const Evas_Object *obj)
-    void            evas_map_util_points_populate_from_geometry(Evas_Map *m, Evas_Coord x, Evas_Coord y, Evas_Coord w, Evas_Coord h, Evas_Coord z)
+    void            evas_map_util_points_populate_from_geometry(Evas_Map *m, Evas_Coord x, Evas_Coord y, Evas_Coord w, Evas_Coord h, Evas_Coord z) nogil
     void            evas_map_util_points_color_set(Evas_Map *m, int r, int g, int b, int a)
-    void            evas_map_util_rotate(Evas_Map *m, double degrees, Evas_Coord cx, Evas_Coord cy)
-    void            evas_map_util_zoom(Evas_Map *m, double zoomx, double zoomy, Evas_Coord cx, Evas_Coord cy)
+    void            evas_map_util_rotate(Evas_Map *m, double degrees, Evas_Coord cx, Evas_Coord cy) nogil
+    void            evas_map_util_zoom(Evas_Map *m, double zoomx, double zoomy, Evas_Coord cx, Evas_Coord cy) nogil
     void            evas_map_util_3d_rotate(Evas_Map *m, double dx, double dy, double dz, Evas_Coord cx, Evas_Coord cy, Evas_Coord cz)
     void            evas_map_util_quat_rotate(Evas_Map *m, double qx, double qy, double qz, double qw, double cx, double cy, double cz)
     void            evas_map_util_3d_lighting(Evas_Map *m, Evas_Coord lx, Evas_Coord ly, Evas_Coord lz, int lr, int lg, int lb, int ar, int ag, int ab)
@@ -814,10 +825,10 @@ cdef extern from "Evas.h":
     void            evas_map_alpha_set(Evas_Map *m, Eina_Bool enabled)
     Eina_Bool       evas_map_alpha_get(const Evas_Map *m)
     Evas_Map       *evas_map_dup(const Evas_Map *m)
-    void            evas_map_free(Evas_Map *m)
+    void            evas_map_free(Evas_Map *m) nogil
     int             evas_map_count_get(const Evas_Map *m)
-    void            evas_map_point_coord_set(Evas_Map *m, int idx, Evas_Coord x, Evas_Coord y, Evas_Coord z)
-    void            evas_map_point_coord_get(const Evas_Map *m, int idx, Evas_Coord *x, Evas_Coord *y, Evas_Coord *z)
+    void            evas_map_point_coord_set(Evas_Map *m, int idx, Evas_Coord x, Evas_Coord y, Evas_Coord z) nogil
+    void            evas_map_point_coord_get(const Evas_Map *m, int idx, Evas_Coord *x, Evas_Coord *y, Evas_Coord *z) nogil
     void            evas_map_point_image_uv_set(Evas_Map *m, int idx, double u, double v)
     void            evas_map_point_image_uv_get(const Evas_Map *m, int idx, double *u, double *v)
     void            evas_map_point_color_set(Evas_Map *m, int idx, int r, int g, int b, int a)
@@ -919,6 +930,7 @@ cdef class Map(object):
 
 cdef class Object(Eo):
     cdef list _event_callbacks
+    cdef dict _motion_coalescers
     cdef int _set_properties_from_keyword_args(self, dict) except 0
 
 cdef class Rectangle(Object):
@@ -1123,3 +1135,12 @@ cdef class EventHold:
     cdef void _set_obj(self, void *ptr)
     cdef void _unset_obj(self)
     cdef int _check_validity(self) except 0
+
+
+cdef class EventMotionCoalesced:
+    cdef readonly int type
+    cdef readonly int count
+    cdef readonly object points
+    cdef readonly int device
+    cdef readonly int buttons
+    cdef readonly unsigned int timestamp
@@ -0,0 +1,18 @@
+"""Shared by the benchmarks of all the test modules
+
+The benchmarks are skipped unless EFL_TEST_BENCHMARKS is set in the
+environment, and report their timings on the efl.tests logger. The test
+modules add this directory to sys.path to import it, as they also run
+standalone or from their own 00_run_all_tests.py.
+
+"""
+
+import os
+import logging
+import unittest
+
+
+log = logging.getLogger("efl.tests")
+
+benchmark = unittest.skipUnless(os.environ.get("EFL_TEST_BENCHMARKS"),
+                                "EFL_TEST_BENCHMARKS is not set")
@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+
+import sys
+
+while True:
+    line = sys.stdin.readline()
+    if not line:
+        break
+    line = line.strip()
+    if line == "crash":
+        exit(1)
+    sys.stdout.write(line.upper() + "\n")
+    sys.stdout.flush()
+
+exit(0)
@@ -2,12 +2,17 @@
 
 
 import os
+import sys
 import unittest
 import logging
 import subprocess
+import time
 
 from efl import ecore
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
 
 script_path = os.path.dirname(os.path.realpath(__file__))
 helper = os.path.join(script_path, "exe_helper.sh")
@@ -192,6 +197,111 @@ class TestExe(unittest.TestCase):
         self.assertEqual(self.num_data, 8)
 
 
+class TestExeData(unittest.TestCase):
+    def testRawAndReadinto(self):
+        self.events = []
+        ring = bytearray(32)
+        self.pos = 30
+
+        def on_add(x, event):
+            x.send(b"123\n\xff\xfe\nxyz\n")
+
+        def on_data(x, event):
+            self.assertIsInstance(event, ecore.EventExeData)
+            self.assertEqual(event.size, len(event.raw))
+            self.pos = event.readinto(ring, self.pos)
+            self.events.append(event)
+            x.kill()
+
+        def on_del(x, event):
+            ecore.main_loop_quit()
+
+        exe = ecore.Exe("cat", flags | ecore.ECORE_EXE_PIPE_WRITE)
+        exe.on_add_event_add(on_add)
+        exe.on_data_event_add(on_data)
+        exe.on_del_event_add(on_del)
+
+        t = ecore.timer_add(2, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        # the events have been retained, so they must still be usable
+        self.assertEqual(len(self.events), 1)
+        event = self.events[0]
+        self.assertEqual(event.raw_lines, [b"123", b"\xff\xfe", b"xyz"])
+        self.assertEqual(event.lines[0], "123")
+        self.assertEqual(event.lines[2], "xyz")
+        self.assertEqual(len(event.text), event.size)
+        self.assertEqual(self.pos, (30 + event.size) % len(ring))
+        self.assertRaises(ValueError, event.readinto, bytearray(2))
+
+    def testDeleteFromCallback(self):
+        self.calls = []
+
+        def on_data1(x, event):
+            self.calls.append(1)
+            x.delete()
+            ecore.main_loop_quit()
+
+        def on_data2(x, event):
+            self.calls.append(2)
+
+        exe = ecore.Exe("%s 0.0" % helper, flags)
+        exe.on_data_event_add(on_data1)
+        exe.on_data_event_add(on_data2)
+
+        t = ecore.timer_add(2, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        # the second callback still runs, with the deleted exe
+        self.assertEqual(self.calls, [1, 2])
+
+    def testUninitialized(self):
+        event = ecore.EventExeData()
+        self.assertRaises(ValueError, getattr, event, "raw")
+        self.assertRaises(ValueError, getattr, event, "raw_lines")
+        self.assertRaises(ValueError, event.readinto, bytearray(2))
+
+
+@benchmark
+class TestExeDispatchBenchmark(unittest.TestCase):
+    def run_children(self, n):
+        self.events = 0
+        self.lines = 0
+        self.running = n
+
+        def on_data(x, event):
+            self.events += 1
+            self.lines += len(event.lines)
+
+        def on_del(x, event):
+            self.running -= 1
+            if self.running == 0:
+                ecore.main_loop_quit()
+
+        exes = []
+        for i in range(n):
+            exe = ecore.Exe("%s 0.0" % helper, flags)
+            exe.on_data_event_add(on_data)
+            exe.on_del_event_add(on_del)
+            exes.append(exe)
+
+        t = time.time()
+        timeout = ecore.timer_add(30, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+        return time.time() - t
+
+    def testBenchmark(self):
+        for n in (1, 10, 50):
+            t = self.run_children(n)
+            self.assertEqual(self.running, 0)
+            self.assertEqual(self.lines, n * 1000)
+            log.info("%d children: %d data events in %.3fs, %.1f us/event" %
+                     (n, self.events, t, t * 1000000 / self.events))
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
@@ -2,11 +2,16 @@
 
 import unittest
 import os
+import sys
 import tempfile
+import time
 import logging
 
 from efl import ecore, ecore_con
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import log
+
 
 TIMEOUT = 5.0 # seconds
 
@@ -176,6 +181,189 @@ class TestCon(unittest.TestCase):
         self.assertEqual(u.status_code, 200) # assume net is ok
         u.delete()
 
+    def testUrlCallbackDelKeepsOthers(self):
+        # removing the last callback of an object must not break the others
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b"some data")
+        os.close(fd)
+        self.completed = []
+
+        def _on_complete(event, i):
+            self.completed.append(i)
+            if len(self.completed) == 1:
+                ecore.main_loop_quit()
+
+        def _unused(event):
+            pass
+
+        u1 = ecore_con.Url("file://" + path)
+        u1.on_complete_event_add(_unused)
+        u2 = ecore_con.Url("file://" + path)
+        u2.on_complete_event_add(_on_complete, 2)
+        u1.on_complete_event_del(_unused)
+        self.assertTrue(u2.get())
+
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(self.completed, [2])
+        u1.delete()
+        u2.delete()
+        os.unlink(path)
+
+    def testUrlCallbacksPerObject(self):
+        # each object only gets the events of its own transfer
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b"some data")
+        os.close(fd)
+        self.completed = []
+
+        def _on_complete(event, name, url):
+            self.completed.append((name, event.url is url))
+            if len(self.completed) == 2:
+                ecore.main_loop_quit()
+
+        u1 = ecore_con.Url("file://" + path)
+        u1.on_complete_event_add(_on_complete, "u1", u1)
+        u2 = ecore_con.Url("file://" + path)
+        u2.on_complete_event_add(_on_complete, "u2", u2)
+        self.assertTrue(u1.get())
+        self.assertTrue(u2.get())
+
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(sorted(self.completed),
+                         [("u1", True), ("u2", True)])
+        u1.delete()
+        u2.delete()
+        os.unlink(path)
+
+    def testUrlBuffered(self):
+        data = os.urandom(100000)
+        fd, path = tempfile.mkstemp()
+        os.write(fd, data)
+        os.close(fd)
+        self.chunks = []
+
+        def _on_complete(event):
+            ecore.main_loop_quit()
+
+        def _on_chunk(url, chunk, tag):
+            self.assertEqual(tag, "tag")
+            self.assertIsInstance(chunk, memoryview)
+            self.chunks.append(chunk.tobytes())
+            self.last_chunk = chunk
+
+        u = ecore_con.Url("file://" + path, buffered=True)
+        self.assertIsNone(u.body)
+        u.chunk_func_set(_on_chunk, "tag")
+        u.on_complete_event_add(_on_complete)
+        self.assertTrue(u.get())
+
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(bytes(u.body), data)
+        self.assertFalse(u.body_overflow)
+        self.assertEqual(b"".join(self.chunks), data)
+        # the chunk views are released after the call
+        if hasattr(memoryview, "release"):
+            self.assertRaises(ValueError, len, self.last_chunk)
+
+        # max size, the remaining data is dropped
+        u.buffer_max_size = 1000
+        u.chunk_func_set(None)
+        self.assertTrue(u.get())
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertTrue(u.body_overflow)
+        self.assertTrue(len(u.body) <= 1000)
+        self.assertEqual(bytes(u.body), data[:len(u.body)])
+        self.assertRaises(ValueError, setattr, u, "buffer_max_size", -1)
+
+        u.delete()
+        os.unlink(path)
+
+    def testUrlBodyHeld(self):
+        data = os.urandom(100000)
+        fd, path = tempfile.mkstemp()
+        os.write(fd, data)
+        os.close(fd)
+        self.held = []
+
+        def _on_complete(event):
+            ecore.main_loop_quit()
+
+        def _on_chunk(url, chunk):
+            # keep views on the body while the transfer goes on
+            self.held.append(url.body)
+
+        u = ecore_con.Url("file://" + path, buffered=True)
+        u.chunk_func_set(_on_chunk)
+        u.on_complete_event_add(_on_complete)
+        self.assertTrue(u.get())
+
+        t = ecore.Timer(TIMEOUT, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertTrue(len(self.held) > 1)
+        self.assertEqual(bytes(u.body), data)
+        for body in self.held:
+            self.assertEqual(bytes(body), data[:len(body)])
+
+        u.delete()
+        os.unlink(path)
+
+    def testUrlStress(self):
+        n = 1000
+        fd, path = tempfile.mkstemp()
+        os.write(fd, b"x" * 1024)
+        os.close(fd)
+        self.completed = 0
+        self.data = 0
+
+        def _on_complete(event):
+            self.completed += 1
+            if self.completed == n:
+                ecore.main_loop_quit()
+
+        def _on_data(event):
+            self.data += event.size
+
+        urls = []
+        for i in range(n):
+            u = ecore_con.Url("file://" + path)
+            u.on_complete_event_add(_on_complete)
+            if i % 2:
+                u.on_data_event_add(_on_data)
+            urls.append(u)
+        # some objects without callbacks, their events are just dropped
+        unmanaged = [ecore_con.Url("file://" + path) for i in range(n // 10)]
+
+        t0 = time.time()
+        for u in urls + unmanaged:
+            u.get()
+
+        t = ecore.Timer(TIMEOUT * 4, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+        t0 = time.time() - t0
+
+        self.assertEqual(self.completed, n)
+        self.assertEqual(self.data, (n // 2) * 1024)
+        log.info("%d concurrent urls completed in %.3fs" % (n, t0))
+
+        for u in urls + unmanaged:
+            u.delete()
+        os.unlink(path)
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
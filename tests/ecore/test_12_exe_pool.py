@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+import logging
+
+from efl import ecore
+
+
+script_path = os.path.dirname(os.path.realpath(__file__))
+helper = os.path.join(script_path, "exe_pool_helper.sh")
+
+
+class TestExePool(unittest.TestCase):
+    def testRequests(self):
+        responses = {}
+
+        def on_done(request, i):
+            self.assertTrue(request.done)
+            self.assertIsNone(request.error)
+            responses[i] = request.response
+            if len(responses) == 20:
+                ecore.main_loop_quit()
+
+        pool = ecore.ExePool(helper, 4)
+        for i in range(20):
+            pool.submit("request %d" % i, on_done, i)
+        self.assertTrue(pool.queue_depth > 0)
+
+        t = ecore.timer_add(5, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(len(responses), 20)
+        for i in range(20):
+            self.assertEqual(responses[i], ("REQUEST %d" % i).encode())
+
+        stats = pool.stats_get()
+        self.assertEqual(stats["completed"], 20)
+        self.assertEqual(stats["queued"], 0)
+        self.assertEqual(stats["alive"], 4)
+        self.assertEqual(stats["idle"], 4)
+        self.assertTrue(stats["latency_max"] >= stats["latency_avg"])
+        pool.shutdown()
+        self.assertRaises(RuntimeError, pool.submit, "late")
+
+    def testRestart(self):
+        done = []
+
+        def on_done(request):
+            done.append(request)
+            if len(done) == 2:
+                ecore.main_loop_quit()
+
+        pool = ecore.ExePool(helper, 1, backoff_min=0.01, max_attempts=2)
+        crash = pool.submit("crash", on_done)
+        ok = pool.submit("fine", on_done)
+
+        t = ecore.timer_add(5, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        self.assertEqual(crash.attempts, 2)
+        self.assertIsInstance(crash.error, RuntimeError)
+        self.assertEqual(ok.response, b"FINE")
+        self.assertEqual(pool.restarts, 2)
+        self.assertEqual(pool.failed, 1)
+        pool.shutdown()
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, ecore.ExePool, helper, 0)
+        self.assertRaises(ValueError, ecore.ExePool, helper, 1, "xml")
+        pool = ecore.ExePool(helper, 1)
+        self.assertRaises(ValueError, pool.submit, "two\nlines")
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import time
+import random
+import unittest
+import logging
+
+from efl import ecore
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def run_loop(self, timeout=5):
+        t = ecore.timer_add(timeout, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+    def testTimeouts(self):
+        fired = []
+
+        def on_timeout(name, a=None):
+            fired.append((name, a, time.time() - start))
+            if name == "last":
+                ecore.main_loop_quit()
+
+        wheel = ecore.TimerWheel(0.01, 16)
+        start = time.time()
+        wheel.add(0.3, on_timeout, "last")
+        wheel.add(0.05, on_timeout, "first", a=1)
+        # more than a turn of the wheel
+        wheel.add(0.2, on_timeout, "second")
+        cancelled = wheel.add(0.1, on_timeout, "cancelled")
+        self.assertEqual(len(wheel), 4)
+        cancelled.cancel()
+        self.assertFalse(cancelled.active)
+        self.assertEqual(len(wheel), 3)
+        self.run_loop()
+
+        self.assertEqual([f[:2] for f in fired],
+                         [("first", 1), ("second", None), ("last", None)])
+        # never early
+        self.assertTrue(fired[0][2] >= 0.05)
+        self.assertTrue(fired[1][2] >= 0.2)
+        self.assertEqual(len(wheel), 0)
+        wheel.delete()
+
+    def testRescheduleAndRenew(self):
+        calls = []
+
+        def on_renew():
+            calls.append("renew")
+            return len(calls) < 3
+
+        def on_reschedule(timeout):
+            calls.append("reschedule")
+            ecore.main_loop_quit()
+
+        wheel = ecore.TimerWheel(0.01)
+        wheel.add(0.02, on_renew)
+        timeout = wheel.add(0.05, on_reschedule, None)
+        timeout.reschedule(0.3)
+        self.assertEqual(timeout.delay, 0.3)
+        self.assertTrue(timeout.pending > 0.2)
+        self.run_loop()
+
+        self.assertEqual(calls, ["renew", "renew", "renew", "reschedule"])
+        self.assertFalse(timeout.active)
+        self.assertIsNone(timeout.pending)
+        wheel.delete()
+        self.assertRaises(RuntimeError, wheel.add, 1.0, on_renew)
+        self.assertRaises(RuntimeError, timeout.reschedule)
+
+    def testCancelFromCallback(self):
+        calls = []
+
+        def on_timeout(i):
+            calls.append(i)
+            for t in timeouts:
+                t.cancel()
+
+        wheel = ecore.TimerWheel(0.05)
+        # all due in the same tick
+        timeouts = [wheel.add(0.01, on_timeout, i) for i in range(10)]
+        ecore.timer_add(0.3, ecore.main_loop_quit)
+        self.run_loop()
+        self.assertEqual(calls, [0])
+        wheel.delete()
+
+    def testClear(self):
+        calls = []
+
+        def on_timeout(i):
+            calls.append(i)
+            wheel.clear()
+
+        wheel = ecore.TimerWheel(0.05)
+        # all due in the same tick
+        timeouts = [wheel.add(0.01, on_timeout, i) for i in range(10)]
+        later = wheel.add(0.5, on_timeout, "later")
+        self.run_loop(0.3)
+        self.assertEqual(calls, [0])
+        self.assertEqual(len(wheel), 0)
+        self.assertFalse(any(t.active for t in timeouts))
+        self.assertFalse(later.active)
+
+        # still usable
+        wheel.add(0.01, lambda: ecore.main_loop_quit())
+        self.run_loop()
+        self.assertEqual(len(wheel), 0)
+        wheel.delete()
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, ecore.TimerWheel, 0)
+        self.assertRaises(ValueError, ecore.TimerWheel, 0.1, 0)
+        self.assertRaises(TypeError, ecore.Timeout)
+        wheel = ecore.TimerWheel()
+        self.assertRaises(TypeError, wheel.add, 1.0, None)
+        wheel.delete()
+
+    @benchmark
+    def testBenchmark(self):
+        for n in (10000, 100000):
+            delays = [random.uniform(0.0, 0.5) for i in range(n)]
+            self.fired = 0
+
+            def on_timeout():
+                self.fired += 1
+                if self.fired == n:
+                    ecore.main_loop_quit()
+
+            t = time.time()
+            timers = [ecore.Timer(d, on_timeout) for d in delays]
+            t_add = time.time() - t
+            self.run_loop(30)
+            t = time.time() - t
+            self.assertEqual(self.fired, n)
+            del timers
+            log.info("Timer: %d timers added in %.3fs, fired in %.3fs, "
+                     "%.0f timers/sec" % (n, t_add, t, n / t))
+
+            self.fired = 0
+            wheel = ecore.TimerWheel(0.01)
+            t = time.time()
+            timeouts = [wheel.add(d, on_timeout) for d in delays]
+            t_add = time.time() - t
+            self.run_loop(30)
+            t = time.time() - t
+            self.assertEqual(self.fired, n)
+            log.info("TimerWheel: %d timeouts added in %.3fs, fired in %.3fs, "
+                     "%.0f timeouts/sec" % (n, t_add, t, n / t))
+
+            t = time.time()
+            for timeout in timeouts:
+                timeout.reschedule(10.0)
+            for timeout in timeouts:
+                timeout.cancel()
+            t = time.time() - t
+            self.assertEqual(len(wheel), 0)
+            wheel.delete()
+            log.info("TimerWheel: %d timeouts rescheduled and cancelled in "
+                     "%.3fs, %.0f ops/sec" % (n, t, 2 * n / t))
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
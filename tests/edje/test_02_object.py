@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 
 import os
+import shutil
+import tempfile
 import unittest
 import logging
+from array import array
 
 from efl import evas
 from efl import ecore
 from efl import edje
+from efl.edje_edit import EdjeEdit
 
 
 theme_path = os.path.dirname(os.path.abspath(__file__))
@@ -128,6 +132,109 @@ class TestEdjeObject(unittest.TestCase):
         ecore.main_loop_begin()
         o.delete()
 
+    def testSignalsBatch(self):
+        batches = []
+
+        def _batch_cb(obj, signals, arg):
+            self.assertEqual(arg, "arg")
+            batches.append(signals)
+
+        def _quit_cb(obj, emission, source):
+            ecore.main_loop_quit()
+
+        o = edje.Edje(self.canvas, file=theme_file, group="main")
+        o.signal_callback_batch_add("test,*", "*", _batch_cb, "arg")
+        o.signal_callback_add("quit", "*", _quit_cb)
+        for i in range(100):
+            o.signal_emit("test,%d" % (i % 2), "src")
+        ecore.Timer(0.1, lambda: o.signal_emit("quit", ""))
+        ecore.main_loop_begin()
+
+        # all the signals in a single call
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 100)
+        self.assertEqual(batches[0][0], ("test,0", "src"))
+        self.assertEqual(batches[0][1], ("test,1", "src"))
+        # the strings are shared
+        self.assertIs(batches[0][0][0], batches[0][2][0])
+
+        stats = dict(((e, s, f), n)
+                     for e, s, f, n in o.signal_callback_stats_get())
+        self.assertEqual(stats[("test,*", "*", _batch_cb)], 100)
+        self.assertEqual(stats[("quit", "*", _quit_cb)], 1)
+
+        o.signal_callback_del("test,*", "*", _batch_cb)
+        self.assertEqual(len(o.signal_callback_stats_get()), 1)
+        o.delete()
+
+    def testMessageSendBuffer(self):
+        o = edje.Edje(self.canvas, file=theme_file, group="main")
+        o.message_send_buffer(1, array("i", [1, 2, 3]))
+        o.message_send_buffer(1, array("d", [1.5] * 1000))
+        o.message_send_buffer(1, array("f", [0.5, 2.5]))
+        self.assertRaises(TypeError, o.message_send_buffer, 1, b"abc")
+        self.assertRaises(TypeError, o.message_send_buffer, 1, [1, 2])
+
+        msg = edje.MessageBuffer(edje.EDJE_MESSAGE_FLOAT_SET, 4)
+        self.assertEqual(msg.size, 4)
+        self.assertEqual(len(msg), 4)
+        msg.values_set(array("d", [1.0, 2.0]))
+        self.assertEqual(msg.count, 2)
+        self.assertEqual(memoryview(msg).tolist(), [1.0, 2.0])
+        msg.values_set([3, 4, 5])
+        values = memoryview(msg)
+        self.assertEqual(values.format, "d")
+        self.assertEqual(values.tolist(), [3.0, 4.0, 5.0])
+        o.message_send_buffer(2, msg)
+        self.assertRaises(ValueError, msg.values_set, [1] * 5)
+        self.assertRaises(ValueError, setattr, msg, "count", 5)
+
+        msg = edje.MessageBuffer(edje.EDJE_MESSAGE_INT_SET, 2)
+        values = memoryview(msg)
+        values[0] = 7
+        values[1] = 8
+        self.assertEqual(values.format, "i")
+        o.message_send_buffer(3, msg)
+        self.assertRaises(ValueError, edje.MessageBuffer,
+                          edje.EDJE_MESSAGE_STRING, 2)
+        o.delete()
+
+    def testMessageSetKept(self):
+        # a theme sending an int set message back
+        fd, path = tempfile.mkstemp(suffix=".edj")
+        os.close(fd)
+        shutil.copy(theme_file, path)
+        e = EdjeEdit(self.canvas, file=path, group="main")
+        e.program_get("emit_back_message").script = \
+            "send_message(MSG_INT_SET, 2, 1, 2, 3);"
+        self.assertTrue(e.script_compile())
+        e.save()
+        e.delete()
+
+        kept = []
+
+        def _on_message(obj, msg):
+            kept.append(msg)
+            ecore.main_loop_quit()
+
+        o = edje.Edje(self.canvas, file=path, group="main")
+        o.message_handler_set(_on_message)
+        o.signal_emit("emit,message", "")
+        t = ecore.Timer(2.0, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        t.delete()
+
+        # the values are exported after the handler returned
+        self.assertEqual(len(kept), 1)
+        msg = kept[0]
+        self.assertIsInstance(msg, edje.MessageIntSet)
+        self.assertEqual(memoryview(msg).tolist(), [1, 2, 3])
+        self.assertEqual(msg.val, [1, 2, 3])
+        self.assertEqual(len(msg), 3)
+        self.assertEqual(msg[2], 3)
+        o.delete()
+        os.unlink(path)
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
@@ -5,8 +5,12 @@ from efl import ecore
 from efl import edje
 from efl.edje import Edje
 
-import os, unittest
+import os, sys, unittest
 import logging
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
 
 
 theme_path = os.path.dirname(os.path.abspath(__file__))
@@ -80,6 +84,58 @@ class TestEdjeDecoratedCallbacks(unittest.TestCase):
         self.assertEqual(expected_text_parts, [])
 
 
+class MyEdjeChild(MyEdje):
+    @edje.on_signal("child", "*")
+    def cb_signal_child(self, emission, source):
+        pass
+
+    def text_change(self, part):
+        pass
+
+
+class TestEdjeDecoratedCallbacksTable(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+
+    def tearDown(self):
+        self.canvas.delete()
+
+    def testInheritedTable(self):
+        o = MyEdjeChild(self.canvas)
+        table = MyEdjeChild.__dict__["__efl_decorated_callbacks__"]
+        names = sorted(cb[0] for cb in table)
+        # text_change is overridden without the decorator
+        self.assertEqual(names, ["message_handler_set", "signal_callback_add",
+                                 "signal_callback_add", "signal_callback_add",
+                                 "signal_callback_add"])
+        o.delete()
+
+    @benchmark
+    def testConstructionBenchmark(self):
+        n = 2000
+
+        t = time.time()
+        for i in range(n):
+            Edje(self.canvas, file=theme_file, group="main").delete()
+        t_plain = time.time() - t
+
+        MyEdje(self.canvas).delete()
+        table = MyEdje.__dict__["__efl_decorated_callbacks__"]
+        t = time.time()
+        for i in range(n):
+            MyEdje(self.canvas).delete()
+        t_decorated = time.time() - t
+
+        log.info("construction of %d objects: undecorated %.3fs, "
+                 "decorated %.3fs" % (n, t_plain, t_decorated))
+        # the table is built once, only the callbacks themselves cost more
+        self.assertIs(MyEdje.__dict__["__efl_decorated_callbacks__"], table)
+        self.assertTrue(t_decorated < t_plain * 3)
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
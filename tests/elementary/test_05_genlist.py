@@ -0,0 +1,409 @@
+#!/usr/bin/env python
+
+import os
+import sys
+os.environ["ELM_ENGINE"] = "buffer"
+
+import time
+import unittest
+import logging
+
+from efl import elementary as elm
+from efl import ecore
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+def text_get(obj, part, item_data):
+    return "row %s" % (item_data,)
+
+
+class TestGenlistItemsAppend(unittest.TestCase):
+
+    def setUp(self):
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC)
+        self.itc = elm.GenlistItemClass(item_style="default",
+                                        text_get_func=text_get)
+
+    def tearDown(self):
+        self.o.delete()
+
+    def testItemsAppend(self):
+        gl = elm.Genlist(self.o)
+        first = gl.item_append(self.itc, "first")
+        items = gl.items_append(self.itc, range(10))
+        self.assertEqual(len(items), 10)
+        self.assertEqual(gl.items_count, 11)
+        self.assertEqual(items[0].data, 0)
+        self.assertEqual(items[9].data, 9)
+        self.assertEqual(first.next, items[0])
+        self.assertEqual(gl.last_item, items[9])
+        self.assertEqual(items[3].prev, items[2])
+        gl.delete()
+
+    def testItemsAppendObjectItemData(self):
+        gl = elm.Genlist(self.o)
+        items = gl.items_append(self.itc, range(2))
+        # same as the items created by item_append
+        self.assertEqual(elm.ObjectItem.data_get(items[0]), ((), {}))
+        gl.delete()
+
+    def testItemsAppendTree(self):
+        gl = elm.Genlist(self.o)
+        parent = gl.item_append(self.itc, "parent",
+                                flags=elm.ELM_GENLIST_ITEM_TREE)
+        items = gl.items_append(self.itc, ["a", "b"], parent)
+        self.assertEqual(items[0].parent, parent)
+        gl.delete()
+
+    def testGengridItemsAppend(self):
+        gg = elm.Gengrid(self.o)
+        itc = elm.GengridItemClass(item_style="default",
+                                   text_get_func=text_get)
+        items = gg.items_append(itc, range(10))
+        self.assertEqual(len(items), 10)
+        self.assertEqual(gg.items_count, 10)
+        self.assertEqual(gg.first_item, items[0])
+        self.assertEqual(elm.ObjectItem.data_get(items[0]), ((), {}))
+        gg.delete()
+
+    @benchmark
+    def testItemsAppendBenchmark(self):
+        for n in (10000, 100000, 1000000):
+            gl = elm.Genlist(self.o)
+            t = time.time()
+            gl.items_append(self.itc, range(n))
+            t = time.time() - t
+            self.assertEqual(gl.items_count, n)
+            gl.delete()
+            log.info("items_append: %d rows in %.3fs, %.0f rows/sec" %
+                     (n, t, n / t))
+
+        n = 100000
+        gl = elm.Genlist(self.o)
+        t = time.time()
+        for i in range(n):
+            gl.item_append(self.itc, i)
+        t = time.time() - t
+        gl.delete()
+        log.info("item_append: %d rows in %.3fs, %.0f rows/sec" %
+                 (n, t, n / t))
+
+
+class TestGenlistTextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC, size=(200, 400))
+        self.itc = elm.GenlistItemClass(item_style="default",
+                                        text_get_func=self.text_get)
+
+    def tearDown(self):
+        self.o.delete()
+
+    def text_get(self, obj, part, item_data):
+        self.calls += 1
+        return "row %s" % (item_data,)
+
+    def realize(self):
+        for i in range(10):
+            ecore.main_loop_iterate()
+
+    def testTextCache(self):
+        self.assertEqual(self.itc.text_cache_size, 0)
+        self.itc.text_cache_size = 100
+        self.assertRaises(ValueError, setattr, self.itc, "text_cache_size", -1)
+
+        gl = elm.Genlist(self.o, size=(200, 400))
+        self.o.resize_object_add(gl)
+        items = gl.items_append(self.itc, range(5))
+        gl.show()
+        self.o.show()
+        self.realize()
+        calls = self.calls
+        self.assertTrue(calls > 0)
+
+        # cached, the getter is not called again
+        gl.realized_items_update()
+        self.realize()
+        self.assertEqual(self.calls, calls)
+
+        # invalidated by update()
+        items[0].update()
+        self.realize()
+        self.assertTrue(self.calls > calls)
+
+        calls = self.calls
+        self.itc.text_cache_clear()
+        gl.realized_items_update()
+        self.realize()
+        self.assertTrue(self.calls > calls)
+        gl.delete()
+
+
+class TestGenlistModel(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = []
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC, size=(200, 400))
+        self.itc = elm.GenlistItemClass(item_style="default",
+                                        text_get_func=self.text_get)
+
+    def tearDown(self):
+        self.o.delete()
+
+    def text_get(self, obj, part, item_data):
+        self.rows.append(item_data)
+        return "row %s" % (item_data,)
+
+    def realize(self):
+        for i in range(10):
+            ecore.main_loop_iterate()
+
+    def testModel(self):
+        selected = []
+
+        def on_select(item, gl, item_data):
+            selected.append((item, item_data))
+
+        model = range(1000000)
+        gl = elm.Genlist(self.o, size=(200, 400))
+        self.o.resize_object_add(gl)
+        gl.model_set(model, self.itc, on_select)
+        self.assertIs(gl.model, model)
+        self.assertEqual(gl.items_count, 1000000)
+        gl.show()
+        self.o.show()
+        self.realize()
+
+        # only the visible rows have been read
+        self.assertTrue(0 < len(self.rows) < 1000)
+        self.assertTrue(0 in self.rows)
+
+        first = gl.first_item
+        self.assertIsInstance(first, elm.GenlistModelItem)
+        self.assertEqual(first.row, 0)
+        self.assertEqual(first.data, 0)
+        self.assertEqual(elm.ObjectItem.data_get(first), ((), {}))
+        self.assertEqual(first, gl.first_item)
+        self.assertEqual(first.next.row, 1)
+        self.assertEqual(gl.last_item.data, 999999)
+
+        first.selected = True
+        self.assertEqual(selected, [(first, 0)])
+        self.assertEqual(gl.selected_item, first)
+
+        gl.model_set(None)
+        self.assertIsNone(gl.model)
+        self.assertEqual(gl.items_count, 0)
+        gl.delete()
+
+    def testModelUpdate(self):
+        model = ["a", "b", "c"]
+        self.itc.text_cache_size = 10
+        gl = elm.Genlist(self.o, size=(200, 400))
+        self.o.resize_object_add(gl)
+        gl.model_set(model, self.itc)
+        gl.show()
+        self.o.show()
+        self.realize()
+        self.assertTrue("a" in self.rows)
+
+        model[0] = "z"
+        gl.model_update()
+        self.realize()
+        self.assertTrue("z" in self.rows)
+
+        gl.model = ["x"]
+        self.assertEqual(gl.items_count, 1)
+        gl.clear()
+        self.assertIsNone(gl.model)
+        self.assertRaises(TypeError, gl.model_set, model)
+        gl.delete()
+
+    def testModelSortedInsert(self):
+        def compare(item1, item2):
+            return (item1.data > item2.data) - (item1.data < item2.data)
+
+        gl = elm.Genlist(self.o)
+        gl.model_set(["b", "d"], self.itc)
+        gl.item_sorted_insert(self.itc, "c", compare)
+        gl.item_sorted_insert(self.itc, "a", compare)
+        self.assertEqual([it.data for it in gl], ["a", "b", "c", "d"])
+        gl.delete()
+
+    def testModelItemDeleted(self):
+        gl = elm.Genlist(self.o)
+        gl.model_set(["a", "b", "c"], self.itc)
+        first = gl.first_item
+        last = gl.last_item
+        self.assertTrue(first in gl)
+        kept = {first: "a", last: "c"}
+
+        first.delete()
+        self.assertFalse(first in gl)
+        # still usable as a key
+        self.assertEqual(kept[first], "a")
+        self.assertNotEqual(first, gl.first_item)
+        self.assertEqual(gl.first_item.row, 1)
+
+        gl.clear()
+        self.assertFalse(last in gl)
+        self.assertRaises(ValueError, last.delete)
+        self.assertEqual(kept.pop(last), "c")
+        self.assertNotEqual(first, last)
+        self.assertEqual(last.row, 2)
+        gl.delete()
+
+
+class TestItemIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC)
+        self.itc = elm.GenlistItemClass(item_style="default",
+                                        text_get_func=text_get)
+
+    def tearDown(self):
+        self.o.delete()
+
+    def testGenlist(self):
+        gl = elm.Genlist(self.o)
+        other = elm.Genlist(self.o)
+        items = gl.items_append(self.itc, range(100))
+        stranger = other.item_append(self.itc, "x")
+
+        self.assertTrue(items[50] in gl)
+        self.assertFalse(stranger in gl)
+        self.assertFalse(None in gl)
+        self.assertEqual(gl.index_of(items[0]), 0)
+        self.assertEqual(gl.index_of(items[42]), 42)
+        self.assertRaises(ValueError, gl.index_of, stranger)
+        self.assertEqual(gl.item_at(7), items[7])
+        self.assertEqual(gl.item_at(-1), items[99])
+        self.assertRaises(IndexError, gl.item_at, 100)
+        self.assertRaises(IndexError, gl.item_at, -101)
+
+        gl.clear()
+        self.assertFalse(items[0] in gl)
+        gl.delete()
+        other.delete()
+
+    def testInsertNoRelayout(self):
+        gl = elm.Genlist(self.o, size=(200, 400))
+        self.o.resize_object_add(gl)
+        items = gl.items_append(self.itc, range(10))
+        gl.show()
+        self.o.show()
+        for i in range(10):
+            ecore.main_loop_iterate()
+        self.assertEqual(gl.index_of(items[5]), 5)
+
+        # no main loop iteration, the native index is not updated yet
+        first = gl.item_prepend(self.itc, "first")
+        self.assertEqual(gl.index_of(first), 0)
+        self.assertEqual(gl.index_of(items[5]), 6)
+        before = gl.item_insert_before(self.itc, "before", items[3])
+        self.assertEqual(gl.index_of(before), 4)
+        self.assertEqual(gl.index_of(items[5]), 7)
+        gl.delete()
+
+        gg = elm.Gengrid(self.o)
+        itc = elm.GengridItemClass(item_style="default",
+                                   text_get_func=text_get)
+        items = gg.items_append(itc, range(10))
+        self.assertEqual(gg.index_of(items[5]), 5)
+        first = gg.item_prepend(itc, "first")
+        self.assertEqual(gg.index_of(first), 0)
+        self.assertEqual(gg.index_of(items[5]), 6)
+        gg.delete()
+
+    def testGengrid(self):
+        gg = elm.Gengrid(self.o)
+        itc = elm.GengridItemClass(item_style="default",
+                                   text_get_func=text_get)
+        items = gg.items_append(itc, range(10))
+        self.assertTrue(items[3] in gg)
+        self.assertEqual(gg.index_of(items[3]), 3)
+        self.assertEqual(gg.item_at(-2), items[8])
+        self.assertRaises(IndexError, gg.item_at, 10)
+        gg.delete()
+
+    def testList(self):
+        li = elm.List(self.o)
+        items = [li.item_append("item %d" % i) for i in range(10)]
+        self.assertTrue(items[3] in li)
+        self.assertEqual(li.index_of(items[3]), 3)
+        self.assertEqual(li.item_at(5), items[5])
+        self.assertEqual(li.item_at(-10), items[0])
+        self.assertRaises(IndexError, li.item_at, 10)
+        li.delete()
+
+
+class TestGenlistSortedInsert(unittest.TestCase):
+
+    def setUp(self):
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC)
+        self.itc = elm.GenlistItemClass(item_style="default",
+                                        text_get_func=text_get)
+
+    def tearDown(self):
+        self.o.delete()
+
+    def testSortKey(self):
+        gl = elm.Genlist(self.o)
+        for key in (5, 1.5, 3, -2, 10**12):
+            gl.item_sorted_insert(self.itc, key, sort_key=key)
+        self.assertEqual([it.data for it in gl], [-2, 1.5, 3, 5, 10**12])
+        self.assertEqual(gl.first_item.sort_key, -2)
+        gl.clear()
+
+        for key in (b"b", b"ab", b"a", u"\xe9", b"z"):
+            gl.item_sorted_insert(self.itc, key, sort_key=key)
+        self.assertEqual([it.data for it in gl],
+                         [b"a", b"ab", b"b", b"z", u"\xe9"])
+
+        self.assertRaises(TypeError, gl.item_sorted_insert, self.itc, 1)
+        self.assertRaises(TypeError, gl.item_sorted_insert, self.itc, 1,
+                          sort_key=[1])
+        gl.delete()
+
+    @benchmark
+    def testSortKeyBenchmark(self):
+        n = 50000
+        keys = [(i * 7919) % n for i in range(n)]
+
+        def compare(item1, item2):
+            return (item1.data > item2.data) - (item1.data < item2.data)
+
+        gl = elm.Genlist(self.o)
+        t = time.time()
+        for key in keys:
+            gl.item_sorted_insert(self.itc, key, sort_key=key)
+        t_key = time.time() - t
+        self.assertEqual(gl.first_item.data, 0)
+        self.assertEqual(gl.last_item.data, n - 1)
+        gl.delete()
+
+        gl = elm.Genlist(self.o)
+        t = time.time()
+        for key in keys:
+            gl.item_sorted_insert(self.itc, key, compare)
+        t_func = time.time() - t
+        self.assertEqual(gl.first_item.data, 0)
+        gl.delete()
+
+        log.info("sorted insert, sort_key: %d rows in %.3fs, %.0f rows/sec" %
+                 (n, t_key, n / t_key))
+        log.info("sorted insert, comparison_func: %d rows in %.3fs, "
+                 "%.0f rows/sec" % (n, t_func, n / t_func))
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
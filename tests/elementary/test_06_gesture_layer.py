@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+import os
+os.environ["ELM_ENGINE"] = "buffer"
+
+import unittest
+import logging
+
+from efl import elementary as elm
+from efl import ecore
+from efl import evas
+
+
+STATES = (elm.ELM_GESTURE_STATE_START, elm.ELM_GESTURE_STATE_MOVE,
+          elm.ELM_GESTURE_STATE_END, elm.ELM_GESTURE_STATE_ABORT)
+
+
+class TestGestureLayer(unittest.TestCase):
+
+    def setUp(self):
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC, size=(400, 400))
+        self.bg = elm.Background(self.o)
+        self.o.resize_object_add(self.bg)
+        self.bg.show()
+        self.o.show()
+        for i in range(5):
+            ecore.main_loop_iterate()
+        self.states = []
+
+    def tearDown(self):
+        self.o.delete()
+
+    def on_state(self, info, state):
+        self.states.append((state, info.fields if info is not None else None))
+
+    def drag(self, moves):
+        canvas = self.o.evas
+        canvas.feed_mouse_move(10, 10, 1)
+        canvas.feed_mouse_down(1, evas.EVAS_BUTTON_NONE, 2)
+        for i in range(moves):
+            canvas.feed_mouse_move(10 + i * 2, 10 + i, 3 + i)
+        canvas.feed_mouse_up(1, evas.EVAS_BUTTON_NONE, 3 + moves)
+
+    def layer(self, coalesce):
+        gl = elm.GestureLayer(self.o, move_coalesce=coalesce)
+        gl.attach(self.bg)
+        for state in STATES:
+            gl.cb_set(elm.ELM_GESTURE_MOMENTUM, state, self.on_state, state)
+        return gl
+
+    def moves(self):
+        return [s for s in self.states if s[0] == elm.ELM_GESTURE_STATE_MOVE]
+
+    def testMoves(self):
+        gl = self.layer(False)
+        self.drag(50)
+        self.assertEqual(self.states[0][0], elm.ELM_GESTURE_STATE_START)
+        self.assertTrue(len(self.moves()) > 1)
+        self.assertEqual(len(self.states[0][1]), 9)
+        gl.delete()
+
+    def testMoveCoalesce(self):
+        gl = self.layer(True)
+        self.assertTrue(gl.move_coalesce)
+        self.drag(50)
+
+        # no frame during the drag, the last move goes before the end
+        self.assertEqual(self.states[0][0], elm.ELM_GESTURE_STATE_START)
+        self.assertEqual(len(self.moves()), 1)
+        self.assertEqual(self.states[1][0], elm.ELM_GESTURE_STATE_MOVE)
+        self.assertTrue(self.states[-1][0] in (elm.ELM_GESTURE_STATE_END,
+                                               elm.ELM_GESTURE_STATE_ABORT))
+        # the move has the values of the last event
+        self.assertEqual(self.states[1][1][2:4], (108, 59))
+
+        for state in STATES:
+            gl.cb_set(elm.ELM_GESTURE_MOMENTUM, state, None)
+        self.states = []
+        self.drag(10)
+        self.assertEqual(self.states, [])
+        gl.delete()
+
+    def testMoveCoalesceDeleted(self):
+        gl = self.layer(True)
+        canvas = self.o.evas
+        canvas.feed_mouse_move(10, 10, 1)
+        canvas.feed_mouse_down(1, evas.EVAS_BUTTON_NONE, 2)
+        for i in range(20):
+            canvas.feed_mouse_move(10 + i * 2, 10 + i, 3 + i)
+        self.assertEqual(self.moves(), [])
+
+        # the pending move is dropped with the layer
+        gl.delete()
+        for i in range(5):
+            ecore.main_loop_iterate()
+        self.assertEqual(self.moves(), [])
+        canvas.feed_mouse_up(1, evas.EVAS_BUTTON_NONE, 30)
+
+    def testInvalid(self):
+        gl = elm.GestureLayer(self.o)
+        self.assertRaises(TypeError, gl.cb_set, elm.ELM_GESTURE_ZOOM,
+                          elm.ELM_GESTURE_STATE_START, 1)
+        gl.delete()
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
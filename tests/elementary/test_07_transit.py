@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+import os
+import sys
+os.environ["ELM_ENGINE"] = "buffer"
+
+import time
+import unittest
+import logging
+
+from efl import elementary as elm
+from efl import ecore
+from efl import evas
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+class CountingEffect(elm.TransitCustomEffect):
+
+    def transition_cb(self, transit, progress):
+        for obj in transit.objects:
+            obj.color = (int(255 * progress),) * 4
+
+
+class TestTransitKeyframeEffect(unittest.TestCase):
+
+    def setUp(self):
+        self.o = elm.Window("t", elm.ELM_WIN_BASIC, size=(400, 400))
+        self.o.show()
+        self.running = 0
+
+    def tearDown(self):
+        self.o.delete()
+
+    def rect(self):
+        r = evas.Rectangle(self.o.evas, pos=(10, 10), size=(50, 50),
+                           color=(255, 255, 255, 255))
+        r.show()
+        return r
+
+    def on_del(self, transit):
+        self.running -= 1
+        if self.running == 0:
+            ecore.main_loop_quit()
+
+    def transit(self, objs, effect, duration=0.2):
+        t = elm.Transit(duration=duration, objects_final_state_keep=True)
+        for obj in objs:
+            t.object_add(obj)
+        t.effect_add(effect)
+        t.del_cb_set(self.on_del)
+        self.running += 1
+        return t
+
+    def run_transits(self):
+        timeout = ecore.timer_add(10, ecore.main_loop_quit)
+        ecore.main_loop_begin()
+        timeout.delete()
+        self.assertEqual(self.running, 0)
+
+    def testFinalState(self):
+        effect = elm.TransitKeyframeEffect(
+            color=[(1.0, (0, 0, 0, 0)), (0.0, (255, 255, 255, 255)),
+                   (0.5, (255, 0, 0, 255))],
+            translation=[(0.0, (0, 0)), (1.0, (100, 20))],
+            rotation=[(0.0, 0), (1.0, 90)])
+        r1 = self.rect()
+        r2 = self.rect()
+        t = self.transit([r1, r2], effect)
+        # added once only
+        t.effect_add(effect)
+        self.run_transits()
+
+        for r in (r1, r2):
+            self.assertEqual(r.color, (0, 0, 0, 0))
+            self.assertTrue(r.map_enabled)
+            # the geometry itself is not changed
+            self.assertEqual(r.pos, (10, 10))
+
+    def testShared(self):
+        effect = elm.TransitKeyframeEffect(zoom=[(0.0, 1.0), (1.0, 2.0)])
+        rects = [self.rect() for i in range(3)]
+        for r in rects:
+            self.transit([r], effect)
+        del effect
+        self.run_transits()
+        for r in rects:
+            self.assertTrue(r.map_enabled)
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, elm.TransitKeyframeEffect, color=[])
+        self.assertRaises(ValueError, elm.TransitKeyframeEffect,
+                          color=[(0.0, (1, 2, 3))])
+        self.assertRaises(ValueError, elm.TransitKeyframeEffect,
+                          map_points=[(0.0, ((0, 0), (0, 0), (0, 0)))])
+        self.assertRaises(TypeError, elm.TransitKeyframeEffect,
+                          zoom=[(0.0, None)])
+        t = elm.Transit()
+        self.assertRaises(TypeError, t.effect_add, object())
+        t.delete()
+
+    def benchmark(self, effect_get, n):
+        frames = []
+
+        def on_frame():
+            frames.append(1)
+            return ecore.ECORE_CALLBACK_RENEW
+
+        for i in range(n):
+            self.transit([self.rect()], effect_get(), 1.0)
+        animator = ecore.Animator(on_frame)
+        t = time.time()
+        self.run_transits()
+        t = time.time() - t
+        animator.delete()
+        return len(frames), t
+
+    @benchmark
+    def testBenchmark(self):
+        n = 500
+        effect = elm.TransitKeyframeEffect(
+            color=[(0.0, (255, 255, 255, 255)), (1.0, (0, 0, 0, 0))],
+            translation=[(0.0, (0, 0)), (0.5, (100, 0)), (1.0, (0, 0))],
+            rotation=[(0.0, 0), (1.0, 360)])
+        frames, t = self.benchmark(lambda: effect, n)
+        log.info("keyframe effect: %d transits, %d frames in %.3fs, "
+                 "%.1f frames/sec" % (n, frames, t, frames / t))
+
+        # custom effects can't be shared between transits
+        frames, t = self.benchmark(CountingEffect, n)
+        log.info("custom effect: %d transits, %d frames in %.3fs, "
+                 "%.1f frames/sec" % (n, frames, t, frames / t))
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+from efl import evas
+
+import os
+import sys
+import unittest
+import logging
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+class TestWrapping(unittest.TestCase):
+
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+
+    def tearDown(self):
+        self.canvas.delete()
+        del self.canvas
+
+    def objects_get(self):
+        return self.canvas.objects_in_rectangle_get(0, 0, 10, 10, True, True)
+
+    def testLazyData(self):
+        o = evas.Rectangle(self.canvas)
+        o.data["test"] = 123
+        self.assertEqual(o.data, {"test": 123})
+        o.delete()
+
+    def testParent(self):
+        o = evas.Rectangle(self.canvas)
+        self.assertEqual(o.parent, self.canvas)
+        o.delete()
+
+    def testRewrap(self):
+        o1 = evas.Rectangle(self.canvas, geometry=(0, 0, 10, 10))
+        o1._wipe_obj_data_NEVER_USE_THIS()
+        o2 = self.objects_get()[0]
+        self.assertIsInstance(o2, evas.Rectangle)
+        self.assertIsNot(o1, o2)
+        self.assertEqual(o2.parent, self.canvas)
+        o2.delete()
+
+    @benchmark
+    def testWrapBenchmark(self):
+        n = 100000
+        objs = [evas.Rectangle(self.canvas, geometry=(0, 0, 10, 10))
+                for i in range(n)]
+
+        t = time.time()
+        found = self.objects_get()
+        t = time.time() - t
+        self.assertEqual(len(found), n)
+        log.info("unwrap: %d objects in %.3fs, %.0f objects/sec" %
+                 (n, t, n / t))
+
+        for o in objs:
+            o._wipe_obj_data_NEVER_USE_THIS()
+        del objs, found
+
+        t = time.time()
+        found = self.objects_get()
+        t = time.time() - t
+        self.assertEqual(len(found), n)
+        log.info("wrap: %d objects in %.3fs, %.0f objects/sec" %
+                 (n, t, n / t))
+
+        for o in found:
+            o.delete()
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import time
+import unittest
+import logging
+
+from efl import eo
+from efl.utils import logger
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def handle(self, record):
+        self.records.append(record)
+
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.log = logging.getLogger("efl")
+        self.level = self.log.level
+        self.handler = RecordsHandler()
+        self.log.addHandler(self.handler)
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+        self.log.setLevel(self.level)
+        logger.queue_set(None)
+
+    def testRecords(self):
+        self.log.setLevel(logging.DEBUG)
+        logger.logger_test_dbg(3)
+        self.assertEqual(len(self.handler.records), 3)
+        rec = self.handler.records[0]
+        self.assertEqual(rec.getMessage(), "test message")
+        self.assertEqual(rec.levelno, logging.DEBUG)
+        self.assertEqual(rec.name, "efl")
+        # the names are decoded once
+        self.assertIs(rec.funcName, self.handler.records[1].funcName)
+
+    def testDisabled(self):
+        self.log.setLevel(logging.WARNING)
+        logger.logger_test_dbg(3)
+        self.assertEqual(self.handler.records, [])
+
+    def testQueue(self):
+        queued = RecordsHandler()
+        logger.queue_set(queued)
+        self.log.setLevel(logging.DEBUG)
+        logger.logger_test_dbg(2)
+        self.assertEqual(len(queued.records), 2)
+        self.assertEqual(self.handler.records, [])
+
+    @benchmark
+    def testBenchmark(self):
+        n = 100000
+        for level, name in ((logging.WARNING, "disabled"),
+                            (logging.DEBUG, "enabled")):
+            self.log.setLevel(level)
+            t = time.time()
+            logger.logger_test_dbg(n)
+            t = time.time() - t
+            log.info("eina log, %s: %d messages in %.3fs, %.0f messages/sec" %
+                     (name, n, t, n / t))
+        self.assertEqual(len([r for r in self.handler.records
+                              if r.name == "efl"]), n)
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)
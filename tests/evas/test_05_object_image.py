@@ -1,13 +1,36 @@
 #!/usr/bin/env python
 
 from efl import evas
-import os, unittest
+import os, sys, unittest
+import ctypes
+from array import array
 import logging
 
 
 icon_file = os.path.join(os.path.dirname(__file__), "icon.png")
 
 
+PyBUF_ND = 0x0008
+
+
+class Py_buffer(ctypes.Structure):
+    _fields_ = [("buf", ctypes.c_void_p), ("obj", ctypes.c_void_p),
+                ("len", ctypes.c_ssize_t), ("itemsize", ctypes.c_ssize_t),
+                ("readonly", ctypes.c_int), ("ndim", ctypes.c_int),
+                ("format", ctypes.c_char_p), ("shape", ctypes.c_void_p),
+                ("strides", ctypes.c_void_p), ("suboffsets", ctypes.c_void_p),
+                ("internal", ctypes.c_void_p)]
+
+
+def buffer_get(obj, flags):
+    # like memoryview(obj), but with the given request flags
+    view = Py_buffer()
+    ctypes.pythonapi.PyObject_GetBuffer(ctypes.py_object(obj),
+                                        ctypes.byref(view), flags)
+    ctypes.pythonapi.PyBuffer_Release(ctypes.byref(view))
+    return view
+
+
 class TestImageBasics(unittest.TestCase):
     def setUp(self):
         self.canvas = evas.Canvas(method="buffer",
@@ -26,6 +49,119 @@ class TestImageBasics(unittest.TestCase):
         self.assertEqual(o.file_get(), (icon_file, None))
 
 
+class TestImageData(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.img = evas.Image(self.canvas, size=(64, 32))
+        self.img.colorspace = evas.EVAS_COLORSPACE_ARGB8888
+        self.img.image_size = (64, 32)
+
+    def tearDown(self):
+        self.img.delete()
+        self.canvas.delete()
+        del self.canvas
+
+    def testMemoryview(self):
+        m = self.img.image_data_memoryview_get()
+        self.assertEqual(m.format, "I")
+        self.assertEqual(m.itemsize, 4)
+        self.assertEqual(m.shape, (32, 64))
+        self.assertEqual(m.strides, (self.img.stride, 4))
+        m.release()
+
+    def testWriteRegion(self):
+        # read only by default, like image_data_memoryview_get()
+        with memoryview(self.img.image_data_region_get(8, 4, 16, 2)) as m:
+            self.assertTrue(m.readonly)
+
+        region = self.img.image_data_region_get(8, 4, 16, 2, for_writing=True)
+        with memoryview(region) as m:
+            self.assertFalse(m.readonly)
+            self.assertEqual(m.shape, (2, 16))
+            for y in range(2):
+                for x in range(16):
+                    m[y, x] = 0xff00ff00
+
+        with self.img.image_data_memoryview_get() as m:
+            self.assertEqual(m[4, 8], 0xff00ff00)
+            self.assertEqual(m[5, 23], 0xff00ff00)
+            self.assertNotEqual(m[6, 8], 0xff00ff00)
+
+    def testReleaseUpdates(self):
+        self.img.fill = (0, 0, 64, 32)
+        self.img.show()
+        self.canvas.render_updates()
+
+        region = self.img.image_data_region_get(8, 4, 16, 2, for_writing=True)
+        with memoryview(region) as m:
+            del region
+            m[0, 0] = 0xff00ff00
+
+        updates = self.canvas.render_updates()
+        self.assertTrue(updates)
+        for x, y in ((8, 4), (23, 5)):
+            self.assertTrue(any(r.x <= x < r.x + r.w and r.y <= y < r.y + r.h
+                                for r in updates))
+
+    def testUpdatesAddRegistered(self):
+        self.img.fill = (0, 0, 64, 32)
+        self.img.show()
+        self.canvas.render_updates()
+        self.assertFalse(self.canvas.render_updates())
+
+        self.img.image_data_updates_add([(0, 0, 4, 4), (2, 2, 4, 4),
+                                         (40, 20, 4, 4)], merge=True)
+        updates = self.canvas.render_updates()
+        for x, y in ((0, 0), (5, 5), (41, 21)):
+            self.assertTrue(any(r.x <= x < r.x + r.w and r.y <= y < r.y + r.h
+                                for r in updates))
+
+    def testNotContiguous(self):
+        # without strides, only C contiguous regions can be exported
+        view = buffer_get(self.img.image_data_region_get(0, 4, 64, 2),
+                          PyBUF_ND)
+        self.assertEqual(view.len, 2 * 64 * 4)
+        self.assertRaises(BufferError, buffer_get,
+                          self.img.image_data_region_get(8, 4, 16, 2),
+                          PyBUF_ND)
+
+    def testRegionOutOfBounds(self):
+        region = self.img.image_data_region_get(60, 0, 16, 2)
+        self.assertRaises(BufferError, memoryview, region)
+
+    def testUpdatesAdd(self):
+        rects = [(0, 0, 8, 8), (4, 4, 8, 8), (20, 20, 0, 4)]
+        # the empty rect is skipped
+        self.assertEqual(self.img.image_data_updates_add(rects), 2)
+        self.assertEqual(self.img.image_data_updates_add(rects, merge=True),
+                         1)
+        buf = array("i", [0, 0, 4, 4, 2, 2, 4, 4, 40, 20, 4, 4])
+        self.assertEqual(self.img.image_data_updates_add(buf), 3)
+        self.assertEqual(self.img.image_data_updates_add(buf, merge=True), 2)
+        # the buffer itself is left alone
+        self.assertEqual(buf[4:8], array("i", [2, 2, 4, 4]))
+        self.assertEqual(self.img.image_data_updates_add(array("i")), 0)
+        self.assertRaises(ValueError, self.img.image_data_updates_add,
+                          array("i", [0, 0, 4]))
+        self.assertRaises(ValueError, self.img.image_data_updates_add,
+                          array("d", [0, 0, 4, 4]))
+
+    def testUpdatesAddByteOrder(self):
+        # ctypes exports its arrays with an explicit byte order, fe "<i"
+        little = (ctypes.c_int32.__ctype_le__ * 4)(0, 0, 4, 4)
+        big = (ctypes.c_int32.__ctype_be__ * 4)(0, 0, 4, 4)
+        if sys.byteorder == "little":
+            native, swapped = little, big
+        else:
+            native, swapped = big, little
+        self.assertEqual(self.img.image_data_updates_add(native), 1)
+        self.assertRaises(ValueError, self.img.image_data_updates_add,
+                          swapped)
+
+
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
     handler = logging.StreamHandler()
@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 
 from efl import evas
+import os
+import sys
 import unittest
 import logging
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
 
 
 class MySmart(evas.Smart):
@@ -142,6 +148,134 @@ class SmartObjectTest(unittest.TestCase):
         self.obj.callback_del("event1", _event1_cb)
         self.assertRaises(ValueError, self.obj.callback_del, "event1", _event1_cb)
 
+    def testMemberLayout(self):
+        fired = []
+        self.obj.geometry = (0, 0, 100, 100)
+        self.obj.callback_add("event1", lambda o, ei: fired.append(ei))
+
+        self.obj.member_layout_set(self.obj.r1, rel_w=0.5, rel_h=0.5)
+        self.assertEqual(self.obj.member_layout_count, 1)
+        self.assertEqual(self.obj.r1.geometry, (0, 0, 50, 50))
+        self.obj.member_layout_set(self.obj.r2, rel_x=1.0, rel_y=1.0,
+                                   align_x=1.0, align_y=1.0,
+                                   offset_x=-5, offset_y=-5)
+        self.assertEqual(self.obj.r2.geometry, (45, 45, 50, 50))
+
+        # all the members have a rule, python is not called anymore
+        self.obj.move(10, 20)
+        self.assertEqual(fired, [])
+        self.assertEqual(self.obj.r1.geometry, (10, 20, 50, 50))
+        self.assertEqual(self.obj.r2.geometry, (55, 65, 50, 50))
+        self.obj.resize(200, 100)
+        self.assertEqual(self.obj.r1.geometry, (10, 20, 100, 50))
+        self.assertEqual(self.obj.r2.geometry, (155, 65, 50, 50))
+
+        # r2 is placed by python again
+        self.obj.member_layout_del(self.obj.r2)
+        self.obj.move(0, 0)
+        self.assertEqual(fired, [None])
+        self.assertEqual(self.obj.r1.geometry, (0, 0, 100, 50))
+        self.assertRaises(ValueError, self.obj.member_layout_del, self.obj.r2)
+
+        other = evas.Rectangle(self.canvas)
+        self.assertRaises(ValueError, self.obj.member_layout_set, other)
+        other.delete()
+
+        # deleted members lose their rule
+        self.obj.r1.delete()
+        self.assertEqual(self.obj.member_layout_count, 0)
+        self.obj.member_layout_set(self.obj.r2)
+        self.obj.member_layout_clear()
+        self.assertEqual(self.obj.member_layout_count, 0)
+
+    def testMemberLayoutChangedByMember(self):
+        extra = [evas.Rectangle(self.canvas) for i in range(8)]
+        for r in extra:
+            self.obj.member_add(r)
+
+        def on_resize(r1):
+            # grows the rules while they are applied
+            for r in extra:
+                self.obj.member_layout_set(r, rel_x=0.5)
+
+        self.obj.geometry = (0, 0, 100, 100)
+        self.obj.member_layout_set(self.obj.r1, rel_w=0.5, rel_h=0.5)
+        self.obj.member_layout_set(self.obj.r2, rel_x=1.0, rel_y=1.0,
+                                   align_x=1.0, align_y=1.0)
+        self.obj.r1.on_resize_add(on_resize)
+        self.obj.resize(200, 200)
+        self.assertEqual(self.obj.r1.geometry, (0, 0, 100, 100))
+        self.assertEqual(self.obj.r2.geometry, (150, 150, 50, 50))
+        self.assertEqual(self.obj.member_layout_count, 10)
+        self.assertEqual(extra[0].pos, (100, 0))
+
+    @benchmark
+    def testMemberLayoutBenchmark(self):
+        n = 100000
+        self.obj.resize(100, 100)
+        t = time.time()
+        for i in range(n):
+            self.obj.move(i % 100, i % 50)
+        t_py = time.time() - t
+
+        self.obj.member_layout_set(self.obj.r1, rel_w=0.5, rel_h=0.5)
+        self.obj.member_layout_set(self.obj.r2, rel_x=0.5, rel_y=0.5,
+                                   rel_w=0.5, rel_h=0.5)
+        t = time.time()
+        for i in range(n):
+            self.obj.move(i % 100, i % 50)
+        t_layout = time.time() - t
+
+        log.info("smart move, python: %d moves in %.3fs, %.0f moves/sec" %
+                 (n, t_py, n / t_py))
+        log.info("smart move, member layout: %d moves in %.3fs, "
+                 "%.0f moves/sec" % (n, t_layout, n / t_layout))
+
+    def testCallbackEventInfo(self):
+        received = []
+        def _event1_cb(obj, event_info, a, k=None):
+            received.append((obj, event_info, a, k))
+        self.obj.callback_add("event1", _event1_cb, 1, k=2)
+        self.obj.callback_call("event1", "info")
+        self.obj.callback_call("event1")
+        self.assertEqual(received, [(self.obj, "info", 1, 2),
+                                    (self.obj, None, 1, 2)])
+        self.obj.callback_del("event1", _event1_cb)
+
+    def testCallbackDelWhileCalling(self):
+        called = []
+        def _event1_cb1(obj, event_info):
+            called.append(1)
+            obj.callback_del("event1", _event1_cb1)
+        def _event1_cb2(obj, event_info):
+            called.append(2)
+        self.obj.callback_add("event1", _event1_cb1)
+        self.obj.callback_add("event1", _event1_cb2)
+        self.obj.callback_call("event1")
+        self.obj.callback_call("event1")
+        self.assertEqual(called, [1, 2, 2])
+        self.obj.callback_del("event1", _event1_cb2)
+
+    @benchmark
+    def testCallbackBenchmark(self):
+        n = 200000
+        def _event1_cb(obj, event_info, *args):
+            pass
+
+        for name, subscribers, args in (("1 callback", 1, ()),
+                                        ("1 callback, 2 args", 1, (1, 2)),
+                                        ("4 callbacks", 4, ())):
+            for i in range(subscribers):
+                self.obj.callback_add("event1", _event1_cb, *args)
+            t = time.time()
+            for i in range(n):
+                self.obj.callback_call("event1", i)
+            t = time.time() - t
+            for i in range(subscribers):
+                self.obj.callback_del("event1", _event1_cb)
+            log.info("callback_call, %s: %d calls in %.3fs, %.0f ns/dispatch" %
+                     (name, n, t, t * 1e9 / (n * subscribers)))
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
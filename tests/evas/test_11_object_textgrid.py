@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 #coding=UTF-8
 
-from efl.evas import Canvas, Textgrid, TextgridCell
+from efl.evas import Canvas, Textgrid, TextgridCell, EVAS_TEXTGRID_CELL_BOLD
+from array import array
 import unittest
 import logging
 
@@ -36,6 +37,38 @@ class TestTextgridBasics(unittest.TestCase):
         print(tg.cell_size)
         self.assertEqual(row[0].codepoint, rowback[0].codepoint)
 
+    def testTextgridRowsUpdate(self):
+        tg = Textgrid(self.canvas)
+        tg.size = 4, 3
+        tg.rows_update(1, u"abcdöfgh", fg=bytes(bytearray([2] * 8)),
+                       flags=bytes(bytearray([EVAS_TEXTGRID_CELL_BOLD] * 8)))
+        row = tg.cellrow_get(1)
+        self.assertEqual(row[0].codepoint, u"a")
+        self.assertEqual(row[0].fg, 2)
+        self.assertTrue(row[0].bold)
+        self.assertFalse(row[0].italic)
+        self.assertEqual(tg.cellrow_get(2)[0].codepoint, u"ö")
+
+        tg.rows_update(0, array("I", [ord(u"x")] * 4))
+        tg.rows_update(2, b"wxyz")
+        codepoints, fg, bg, flags = tg.rows_get()
+        self.assertEqual(len(codepoints), 12)
+        self.assertEqual(codepoints[0], ord(u"x"))
+        self.assertEqual(codepoints[4], ord(u"a"))
+        self.assertEqual(codepoints[11], ord(u"z"))
+        self.assertEqual(fg[5], 2)
+        self.assertEqual(flags[5], EVAS_TEXTGRID_CELL_BOLD)
+
+        codepoints, fg, bg, flags = tg.rows_get(1, 1)
+        self.assertEqual(len(fg), 4)
+
+    def testTextgridRowsUpdateErrors(self):
+        tg = Textgrid(self.canvas)
+        tg.size = 4, 3
+        self.assertRaises(ValueError, tg.rows_update, 0, u"abc")
+        self.assertRaises(ValueError, tg.rows_update, 2, u"abcdefgh")
+        self.assertRaises(ValueError, tg.rows_update, 0, u"abcd", fg=b"\0")
+
 
 if __name__ == '__main__':
     formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
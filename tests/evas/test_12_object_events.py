@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+from efl import evas
+import os
+import sys
+import unittest
+import logging
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from benchmark import benchmark, log
+
+
+class TestObjectEvents(unittest.TestCase):
+    def setUp(self):
+        self.canvas = evas.Canvas(method="buffer",
+                                  size=(400, 500),
+                                  viewport=(0, 0, 400, 500))
+        self.canvas.engine_info_set(self.canvas.engine_info_get())
+        self.obj = evas.Rectangle(self.canvas, geometry=(0, 0, 400, 500))
+        self.obj.show()
+
+    def tearDown(self):
+        self.obj.delete()
+        self.canvas.delete()
+        del self.obj
+        del self.canvas
+
+    def feed_moves(self, count):
+        for i in range(count):
+            self.canvas.feed_mouse_move(i % 400, i % 500, i)
+
+    def testMouseMoveEventReused(self):
+        seen = []
+
+        def cb(obj, event):
+            seen.append((id(event), id(event.position), event.position.canvas.xy))
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(10)
+        self.obj.on_mouse_move_del(cb)
+
+        self.assertTrue(len(seen) > 1)
+        self.assertEqual(len(set(s[0] for s in seen)), 1)
+        self.assertEqual(len(set(s[1] for s in seen)), 1)
+        self.assertEqual(seen[-1][2], (9, 9))
+
+    def testRetainedEventNotReused(self):
+        retained = []
+
+        def cb(obj, event):
+            retained.append(event)
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(5)
+        self.obj.on_mouse_move_del(cb)
+
+        self.assertEqual(len(set(id(e) for e in retained)), len(retained))
+        for event in retained:
+            self.assertRaises(AssertionError, getattr, event, "buttons")
+
+    def testRetainedPositionNotReused(self):
+        retained = []
+
+        def cb(obj, event):
+            retained.append(event.position)
+
+        self.obj.on_mouse_move_add(cb)
+        self.feed_moves(5)
+        self.obj.on_mouse_move_del(cb)
+
+        self.assertEqual(len(set(id(p) for p in retained)), len(retained))
+        for position in retained:
+            self.assertRaises(AssertionError, getattr, position.canvas, "x")
+
+    def testCallbackDelFromCallback(self):
+        calls = []
+
+        def cb1(obj, event):
+            calls.append(1)
+            obj.on_mouse_move_del(cb1)
+
+        def cb2(obj, event):
+            calls.append(2)
+
+        self.obj.on_mouse_move_add(cb1)
+        self.obj.on_mouse_move_add(cb2)
+        self.feed_moves(4)
+        self.obj.on_mouse_move_del(cb2)
+
+        self.assertEqual(calls[:2], [1, 2])
+        self.assertEqual(calls.count(1), 1)
+
+    def testMouseMoveCoalesced(self):
+        batches = []
+
+        def cb(obj, event):
+            batches.append((event.count, event.position, len(event.points)))
+
+        self.obj.event_callback_coalesced_add(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+        self.feed_moves(10)
+        self.assertEqual(batches, [])
+
+        self.canvas.render()
+        self.assertEqual(len(batches), 1)
+        count, position, points = batches[0]
+        self.assertTrue(count > 1)
+        self.assertEqual(position, (9, 9))
+        self.assertEqual(points, count * 2)
+
+        self.canvas.render()
+        self.assertEqual(len(batches), 1)
+
+        self.obj.event_callback_coalesced_del(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+        self.feed_moves(10)
+        self.canvas.render()
+        self.assertEqual(len(batches), 1)
+
+    def testMouseMoveCoalescedRequestsRender(self):
+        batches = []
+
+        def cb(obj, event):
+            batches.append(event.position)
+
+        self.canvas.render_updates()
+        self.obj.event_callback_coalesced_add(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+        self.feed_moves(10)
+        # motion alone changes nothing, the coalescer damages the canvas
+        self.assertTrue(self.canvas.render_updates())
+        self.assertEqual(batches, [(9, 9)])
+        self.assertFalse(self.canvas.render_updates())
+        self.obj.event_callback_coalesced_del(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+
+    def testMouseMoveCoalescedFlushOnUp(self):
+        calls = []
+
+        def move_cb(obj, event):
+            calls.append(("move", event.position))
+
+        def up_cb(obj, event):
+            calls.append(("up", event.position.canvas.xy))
+
+        self.obj.on_mouse_up_add(up_cb)
+        self.obj.event_callback_coalesced_add(evas.EVAS_CALLBACK_MOUSE_MOVE,
+                                              move_cb)
+        self.canvas.feed_mouse_move(5, 5, 0)
+        self.canvas.feed_mouse_down(1, evas.EVAS_BUTTON_NONE, 1)
+        self.canvas.feed_mouse_move(20, 30, 2)
+        self.canvas.feed_mouse_up(1, evas.EVAS_BUTTON_NONE, 3)
+
+        self.assertEqual(calls[-2:], [("move", (20, 30)), ("up", (20, 30))])
+
+    def testMultiMoveCoalescedPerFinger(self):
+        batches = []
+
+        def cb(obj, event):
+            batches.append((event.device, event.count, event.position))
+
+        def multi(feed, d, x, y, *args):
+            feed(d, x, y, 1.0, 1.0, 1.0, 1.0, 0.0, x, y, *args)
+
+        self.obj.event_callback_coalesced_add(evas.EVAS_CALLBACK_MULTI_MOVE,
+                                              cb)
+        self.canvas.feed_mouse_move(1, 1, 0)
+        for d in (1, 2):
+            multi(self.canvas.feed_multi_down, d, 10 * d, 10 * d,
+                  evas.EVAS_BUTTON_NONE, 1)
+        for i in range(5):
+            multi(self.canvas.feed_multi_move, 1, 20 + i, 20, 2 + i)
+            multi(self.canvas.feed_multi_move, 2, 40, 40 + i, 2 + i)
+        self.canvas.render()
+        self.assertEqual(sorted(batches), [(1, 5, (24, 20)), (2, 5, (40, 44))])
+
+        # a finger going up only flushes its own motion
+        del batches[:]
+        multi(self.canvas.feed_multi_move, 1, 30, 30, 10)
+        multi(self.canvas.feed_multi_move, 2, 50, 50, 10)
+        multi(self.canvas.feed_multi_up, 1, 30, 30, evas.EVAS_BUTTON_NONE, 11)
+        self.assertEqual(batches, [(1, 1, (30, 30))])
+        self.canvas.render()
+        self.assertEqual(batches, [(1, 1, (30, 30)), (2, 1, (50, 50))])
+        self.obj.event_callback_coalesced_del(evas.EVAS_CALLBACK_MULTI_MOVE,
+                                              cb)
+
+    def testCoalescedInvalidType(self):
+        self.assertRaises(ValueError, self.obj.event_callback_coalesced_add,
+                          evas.EVAS_CALLBACK_MOUSE_DOWN, lambda o, e: None)
+        self.assertRaises(ValueError, self.obj.event_callback_coalesced_del,
+                          evas.EVAS_CALLBACK_MOUSE_MOVE, lambda o, e: None)
+
+    @benchmark
+    def testMouseMoveBenchmark(self):
+        count = [0]
+        n = 100000
+
+        def cb(obj, event):
+            count[0] += 1
+
+        self.obj.on_mouse_move_add(cb)
+        t = time.time()
+        self.feed_moves(n)
+        t = time.time() - t
+        self.obj.on_mouse_move_del(cb)
+
+        self.assertTrue(count[0] >= n - 1)
+        log.info("mouse move: %d events in %.3fs, %.0f events/sec" %
+                 (count[0], t, count[0] / t))
+
+    @benchmark
+    def testMouseMoveCoalescedBenchmark(self):
+        count = [0]
+        n = 100000
+
+        def cb(obj, event):
+            count[0] += event.count
+
+        self.obj.event_callback_coalesced_add(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+        t = time.time()
+        for i in range(n // 100):
+            for j in range(100):
+                self.canvas.feed_mouse_move(j, i % 500, i * 100 + j)
+            self.canvas.render()
+        t = time.time() - t
+        self.obj.event_callback_coalesced_del(evas.EVAS_CALLBACK_MOUSE_MOVE, cb)
+
+        log.info("coalesced mouse move: %d events in %.3fs, %.0f events/sec" %
+                 (count[0], t, count[0] / t))
+
+
+if __name__ == '__main__':
+    formatter = logging.Formatter("[%(levelname)s] %(name)s (%(filename)s: %(lineno)d) --- %(message)s")
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    efllog = logging.getLogger("efl")
+    efllog.addHandler(handler)
+    efllog.setLevel(logging.DEBUG)
+    unittest.main(verbosity=2)